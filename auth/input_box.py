@@ -1,5 +1,8 @@
 import pygame
 from settings import FONT_PATH, FONT_SIZE
+from managers.surface_pool import SurfacePool
+from managers.display_manager import px
+from ui.text_layout import TextLayout, TextCache
 
 
 class InputBox:
@@ -12,7 +15,7 @@ class InputBox:
         self.color = self.color_inactive
         self.text = text
         self.placeholder = placeholder
-        self.font = pygame.font.Font(FONT_PATH, 40)
+        self.font = pygame.font.Font(FONT_PATH, px(40))
         self.txt_surface = self.font.render(text, True, pygame.Color('white'))
         self.active = False
         self.password = password
@@ -20,11 +23,14 @@ class InputBox:
         self.cursor_timer = pygame.time.get_ticks()
         self.cursor_blink_speed = 500  # Milliseconds
         self.text_offset = 0  # For scrolling text horizontally
-        self.padding = 10  # Padding inside the input box
+        self.padding = px(10)  # Padding inside the input box
         self.align_top_left = align_top_left  # New parameter for text alignment
         self.multiline = multiline  # Support for multiline text (for questions)
         self.lines = []  # For multiline text
         self.max_chars_per_line = 0  # Will be calculated based on width
+        self.layout = TextLayout(self.font, width - 2 * self.padding)
+        self.line_cache = TextCache(self.font, pygame.Color('black'))  # Rendered lines, reused every frame
+        self.placeholder_surface = self.font.render(placeholder, True, pygame.Color('grey'))
 
         # Calculate max chars per line based on average character width
         self.calculate_max_chars_per_line()
@@ -37,7 +43,7 @@ class InputBox:
         """Calculate approximately how many characters fit in one line based on width."""
         # Use 'm' as a reference character (average width)
         test_char = 'm'
-        char_width = self.font.render(test_char, True, pygame.Color('white')).get_width()
+        char_width = self.font.size(test_char)[0]
         available_width = self.rect.width - (2 * self.padding)
         self.max_chars_per_line = max(1, int(available_width / char_width))
 
@@ -77,107 +83,18 @@ class InputBox:
                         self.format_multiline_text()
                     else:
                         self.adjust_text_offset()
-                        # Re-render the text for single line inputs
-                        displayed_text = '*' * len(self.text) if self.password else self.text
-                        self.txt_surface = self.font.render(displayed_text, True, pygame.Color('white'))
 
         return False  # No special action needed
 
     def format_multiline_text(self):
         """Split text into multiple lines that fit within the box width."""
-        available_width = self.rect.width - (2 * self.padding)
-
-        # Start with empty lines
-        self.lines = []
-
-        if not self.text:
-            return
-
-        # Split text by newlines first
-        paragraphs = self.text.split('\n')
-
-        for paragraph in paragraphs:
-            if not paragraph:  # Empty paragraph becomes a blank line
-                self.lines.append("")
-                continue
-
-            # First try to break by words
-            words = paragraph.split()
-
-            if words:
-                current_line = ""
-
-                for word in words:
-                    # Check if adding this word would exceed the width
-                    test_line = current_line + (" " + word if current_line else word)
-                    test_surface = self.font.render(test_line, True, pygame.Color('white'))
-
-                    if test_surface.get_width() <= available_width:
-                        current_line = test_line
-                    else:
-                        # Word doesn't fit, add current line and start a new one
-                        if current_line:
-                            self.lines.append(current_line)
-
-                        # Check if the word itself is too long and needs breaking
-                        if self.font.render(word, True, pygame.Color('white')).get_width() > available_width:
-                            # Break the word into chunks that fit
-                            remaining_word = word
-                            while remaining_word:
-                                char_count = 1
-                                while char_count <= len(remaining_word):
-                                    chunk = remaining_word[:char_count]
-                                    if self.font.render(chunk, True,
-                                                        pygame.Color('white')).get_width() > available_width:
-                                        # Use previous valid chunk
-                                        if char_count > 1:
-                                            char_count -= 1
-                                        break
-                                    char_count += 1
-
-                                # Add the chunk that fits
-                                if char_count > 0:
-                                    self.lines.append(remaining_word[:char_count])
-                                    remaining_word = remaining_word[char_count:]
-                                else:
-                                    # Failsafe - add at least one character if nothing fits
-                                    self.lines.append(remaining_word[:1])
-                                    remaining_word = remaining_word[1:]
-                        else:
-                            # Word fits on its own line
-                            current_line = word
-
-                # Add the last line if there's anything left
-                if current_line:
-                    self.lines.append(current_line)
-            else:
-                # Handle long continuous text (no spaces)
-                remaining_text = paragraph
-                while remaining_text:
-                    # Try to fit as many characters as possible
-                    char_count = 1
-                    while char_count <= len(remaining_text):
-                        chunk = remaining_text[:char_count]
-                        if self.font.render(chunk, True, pygame.Color('white')).get_width() > available_width:
-                            # Use previous valid chunk
-                            if char_count > 1:
-                                char_count -= 1
-                            break
-                        char_count += 1
-
-                    # Add the chunk that fits
-                    if char_count > 0:
-                        self.lines.append(remaining_text[:char_count])
-                        remaining_text = remaining_text[char_count:]
-                    else:
-                        # Failsafe - add at least one character if nothing else fits
-                        self.lines.append(remaining_text[:1])
-                        remaining_text = remaining_text[1:]
+        # The layout keeps the previous result and only reflows from the edited line
+        self.lines = self.layout.layout(self.text)
 
     def adjust_text_offset(self):
         # Calculate if text width exceeds visible area
         displayed_text = '*' * len(self.text) if self.password else self.text
-        text_width = self.font.render(displayed_text, True, pygame.Color('white')).get_width()
+        text_width = self.font.size(displayed_text)[0]
 
         max_visible_width = self.rect.width - (2 * self.padding)
 
@@ -206,36 +123,33 @@ class InputBox:
     def draw_multiline(self, screen):
         # Create a surface for clipping the text
         clip_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width - 2, self.rect.height - 2)
-        clip_surface = pygame.Surface((clip_rect.width, clip_rect.height), pygame.SRCALPHA)
-        clip_surface.fill((255, 255, 255, 0))  # Transparent background
+        clip_surface = SurfacePool().get_scratch(clip_rect.size, fill=(255, 255, 255, 0))  # Transparent background
 
         # Render placeholder if empty and not active
         if not self.text and not self.active:
-            placeholder_surface = self.font.render(self.placeholder, True, pygame.Color('grey'))
+            placeholder_surface = self.placeholder_surface
             clip_surface.blit(placeholder_surface,
                               (self.padding, self.padding if self.align_top_left else
                               (clip_rect.height - placeholder_surface.get_height()) // 2))
         else:
-            # Format text if not already done
-            if not self.lines:
-                self.format_multiline_text()
+            # Cheap when the text has not changed, and catches text set from outside
+            self.format_multiline_text()
 
             # Render each line
             y_offset = self.padding if self.align_top_left else (
                     (clip_rect.height - (len(self.lines) * self.font.get_height())) // 2
             )
 
-            for i, line in enumerate(self.lines):
-                line_surface = self.font.render(line, True, pygame.Color('black'))
-                clip_surface.blit(line_surface, (self.padding, y_offset + i * self.font.get_height()))
+            line_height = self.font.get_height()
+            clip_surface.blits([(self.line_cache.render(line), (self.padding, y_offset + i * line_height))
+                                for i, line in enumerate(self.lines)], doreturn=False)
 
             # Draw cursor at the end of the last line if active
             if self.active and self.cursor_visible:
                 if self.lines:
                     # Get last line to position cursor
                     last_line = self.lines[-1]
-                    last_line_surface = self.font.render(last_line, True, pygame.Color('black'))
-                    cursor_x = self.padding + last_line_surface.get_width()
+                    cursor_x = self.padding + self.font.size(last_line)[0]
                     cursor_y = y_offset + (len(self.lines) - 1) * self.font.get_height()
                 else:
                     # If no lines, cursor at beginning
@@ -247,14 +161,14 @@ class InputBox:
                     pygame.Color('black'),
                     (cursor_x, cursor_y),
                     (cursor_x, cursor_y + self.font.get_height()),
-                    2
+                    px(2)
                 )
 
         # Blit the clipped surface onto the screen
         screen.blit(clip_surface, (self.rect.x + 1, self.rect.y + 1))
 
         # Draw the rectangle border
-        pygame.draw.rect(screen, self.color, self.rect, 2)
+        pygame.draw.rect(screen, self.color, self.rect, px(2))
 
     def draw_single_line(self, screen):
         # For single line inputs - original implementation
@@ -266,12 +180,11 @@ class InputBox:
 
         # Create a surface for clipping the text
         clip_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width - 2, self.rect.height - 2)
-        clip_surface = pygame.Surface((clip_rect.width, clip_rect.height), pygame.SRCALPHA)
-        clip_surface.fill((255, 255, 255, 0))  # Transparent background
+        clip_surface = SurfacePool().get_scratch(clip_rect.size, fill=(255, 255, 255, 0))  # Transparent background
 
         # Render placeholder if empty and not active
         if not self.text and not self.active:
-            placeholder_surface = self.font.render(self.placeholder, True, pygame.Color('grey'))
+            placeholder_surface = self.placeholder_surface
             placeholder_y = self.padding if self.align_top_left else (
                     (clip_rect.height - placeholder_surface.get_height()) // 2
             )
@@ -279,7 +192,7 @@ class InputBox:
         else:
             # Render the text
             displayed_text = '*' * len(self.text) if self.password else self.text
-            self.txt_surface = self.font.render(displayed_text, True, pygame.Color('black'))
+            self.txt_surface = self.line_cache.render(displayed_text)
             text_y_offset = self.padding if self.align_top_left else (
                     (clip_rect.height - self.txt_surface.get_height()) // 2
             )
@@ -297,11 +210,11 @@ class InputBox:
                     pygame.Color('black'),
                     (cursor_pos_x, cursor_y_offset),
                     (cursor_pos_x, cursor_y_offset + self.txt_surface.get_height()),
-                    2
+                    px(2)
                 )
 
         # Blit the clipped surface onto the screen
         screen.blit(clip_surface, (self.rect.x + 1, self.rect.y + 1))
 
         # Draw the rectangle border
-        pygame.draw.rect(screen, self.color, self.rect, 2)
\ No newline at end of file
+        pygame.draw.rect(screen, self.color, self.rect, px(2))
\ No newline at end of file
@@ -3,6 +3,9 @@ import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH, FONT_SIZE
 from .input_box import InputBox
 from ui.button import Button
+from managers.surface_pool import SurfacePool
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 from .register_screen import RegisterScreen
 
 class LoginScreen:
@@ -20,25 +23,25 @@ class LoginScreen:
         # Create input boxes for login
         self.input_boxes = {
             'email': InputBox(
-                SCREEN_WIDTH // 2 - 340,
-                SCREEN_HEIGHT // 2 - 120,
-                700,
-                60,
+                px(SCREEN_WIDTH // 2 - 340),
+                px(SCREEN_HEIGHT // 2 - 120),
+                px(700),
+                px(60),
                 placeholder='Email'
             ),
             'password': InputBox(
-                SCREEN_WIDTH // 2 - 340,
-                SCREEN_HEIGHT // 2 + 60,
-                700,
-                60,
+                px(SCREEN_WIDTH // 2 - 340),
+                px(SCREEN_HEIGHT // 2 + 60),
+                px(700),
+                px(60),
                 placeholder='Password',
                 password=True
             )
         }
 
         self.login_button = Button(
-            SCREEN_WIDTH // 2 - 200,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 - 200),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['login']['normal'],
             hover_img=self.button_images['login']['hover'],
             action=self.login,
@@ -47,8 +50,8 @@ class LoginScreen:
         )
 
         self.register_button = Button(
-            SCREEN_WIDTH // 2 + 225,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 + 225),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['register']['normal'],
             hover_img=self.button_images['register']['hover'],
             action=self.show_register,
@@ -57,8 +60,8 @@ class LoginScreen:
         )
 
         self.close_button = Button(
-            x=100,
-            y=100,
+            x=px(100),
+            y=px(100),
             idle_img=self.button_images['close']['normal'],
             hover_img=self.button_images['close']['hover'],
             action=self.close,
@@ -69,7 +72,7 @@ class LoginScreen:
         # Status message
         self.status_message = ""
         self.status_color = pygame.Color('white')
-        self.font = pygame.font.Font(FONT_PATH, FONT_SIZE // 2)
+        self.font = pygame.font.Font(FONT_PATH, px(FONT_SIZE // 2))
 
         # Create register screen
         self.register_screen = RegisterScreen(
@@ -91,7 +94,7 @@ class LoginScreen:
             if scale != 1.0:
                 original_width = self.panel_background.get_width()
                 original_height = self.panel_background.get_height()
-                new_size = (int(original_width * scale), int(original_height * scale))
+                new_size = (px(original_width * scale), px(original_height * scale))
                 self.panel_background = pygame.transform.scale(self.panel_background, new_size)
 
         # Load button images
@@ -130,14 +133,17 @@ class LoginScreen:
 
     def show_register(self):
         self.visible = False
+        UIRouter().unregister_scope(self)
         self.register_screen.show()
         self.status_message = ""
 
     def show_login(self):
         self.visible = True
+        UIRouter().set_scope(self, [self.login_button, self.register_button, self.close_button])
 
     def close(self):
         self.visible = False
+        UIRouter().unregister_scope(self)
         # Reset input boxes and status message
         for box in self.input_boxes.values():
             box.text = ''
@@ -148,7 +154,7 @@ class LoginScreen:
             self.on_close_callback()
 
     def show(self):
-        self.visible = True
+        self.show_login()
 
         # FOR AUTO LOGIN REMOVE LATER
         if self.auto_login_data:
@@ -177,9 +183,7 @@ class LoginScreen:
                 pass
 
         # Handle buttons
-        self.login_button.update(event)
-        self.register_button.update(event)
-        self.close_button.update(event)
+        UIRouter().dispatch(event, scope=self)
 
     def update(self):
         if self.register_screen.visible:
@@ -199,12 +203,11 @@ class LoginScreen:
         if not self.visible:
             return
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # RGBA, 180 is the alpha (transparency)
+        overlay = SurfacePool().get_overlay(self.screen.get_size(), (0, 0, 0, 180))  # 180 is the alpha
         self.screen.blit(overlay, (0, 0))
 
         # Draw the panel background
-        panel_rect = self.panel_background.get_rect(center=(SCREEN_WIDTH // 2 + 65, SCREEN_HEIGHT // 2 - 100))
+        panel_rect = self.panel_background.get_rect(center=(px(SCREEN_WIDTH // 2 + 65), px(SCREEN_HEIGHT // 2 - 100)))
         self.screen.blit(self.panel_background, panel_rect)
 
         # Draw the input boxes
@@ -219,4 +222,4 @@ class LoginScreen:
         # Draw status message if any
         if self.status_message:
             status_surf = self.font.render(self.status_message, True, self.status_color)
-            self.screen.blit(status_surf, (SCREEN_WIDTH // 2 - status_surf.get_width() // 2, SCREEN_HEIGHT // 2 + 475))
\ No newline at end of file
+            self.screen.blit(status_surf, (px(SCREEN_WIDTH // 2) - status_surf.get_width() // 2, px(SCREEN_HEIGHT // 2 + 475)))
\ No newline at end of file
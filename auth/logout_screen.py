@@ -2,6 +2,9 @@ import pygame
 import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH, FONT_SIZE
 from ui.button import Button
+from managers.surface_pool import SurfacePool
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 
 class LogoutScreen:
     def __init__(self, screen, script_dir, auth_manager, audio_manager=None, on_close_callback=None):
@@ -17,8 +20,8 @@ class LogoutScreen:
 
         # Create buttons for logout screen
         self.logout_button = Button(
-            SCREEN_WIDTH // 2 - 200,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 - 200),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['logout']['normal'],
             hover_img=self.button_images['logout']['hover'],
             action=self.logout,
@@ -27,8 +30,8 @@ class LogoutScreen:
         )
 
         self.cancel_button = Button(
-            SCREEN_WIDTH // 2 + 225,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 + 225),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['cancel']['normal'],
             hover_img=self.button_images['cancel']['hover'],
             action=self.close,
@@ -39,7 +42,7 @@ class LogoutScreen:
         # Status message
         self.status_message = ""
         self.status_color = pygame.Color('white')
-        self.font = pygame.font.Font(FONT_PATH, FONT_SIZE // 2)
+        self.font = pygame.font.Font(FONT_PATH, px(FONT_SIZE // 2))
 
         # User info
         self.user_email = ""
@@ -54,7 +57,7 @@ class LogoutScreen:
             if scale != 1.0:
                 original_width = self.panel_background.get_width()
                 original_height = self.panel_background.get_height()
-                new_size = (int(original_width * scale), int(original_height * scale))
+                new_size = (px(original_width * scale), px(original_height * scale))
                 self.panel_background = pygame.transform.scale(self.panel_background, new_size)
 
         # Load button images
@@ -82,6 +85,7 @@ class LogoutScreen:
 
     def close(self):
         self.visible = False
+        UIRouter().unregister_scope(self)
         self.status_message = ""
 
         # Call the callback if provided
@@ -90,6 +94,7 @@ class LogoutScreen:
 
     def show(self):
         self.visible = True
+        UIRouter().set_scope(self, [self.logout_button, self.cancel_button])
         # Get current user's email to display
         current_user = self.auth_manager.get_current_user()
         if current_user:
@@ -107,8 +112,7 @@ class LogoutScreen:
             return
 
         # Handle buttons
-        self.logout_button.update(event)
-        self.cancel_button.update(event)
+        UIRouter().dispatch(event, scope=self)
 
     def update(self):
         if not self.visible:
@@ -117,11 +121,10 @@ class LogoutScreen:
     def draw(self):
         if not self.visible:
             return
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = SurfacePool().get_overlay(self.screen.get_size(), (0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        panel_rect = self.panel_background.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        panel_rect = self.panel_background.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
         self.screen.blit(self.panel_background, panel_rect)
 
         # Draw the buttons
@@ -131,4 +134,4 @@ class LogoutScreen:
         # Draw status message if any
         if self.status_message:
             status_surf = self.font.render(self.status_message, True, self.status_color)
-            self.screen.blit(status_surf, (SCREEN_WIDTH // 2 - status_surf.get_width() // 2, SCREEN_HEIGHT // 2 + 475))
\ No newline at end of file
+            self.screen.blit(status_surf, (px(SCREEN_WIDTH // 2) - status_surf.get_width() // 2, px(SCREEN_HEIGHT // 2 + 475)))
\ No newline at end of file
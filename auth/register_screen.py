@@ -3,6 +3,9 @@ import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH, FONT_SIZE
 from .input_box import InputBox
 from ui.button import Button
+from managers.surface_pool import SurfacePool
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 
 
 class RegisterScreen:
@@ -22,33 +25,33 @@ class RegisterScreen:
         # Create input boxes for registration
         self.input_boxes = {
             'email': InputBox(
-                SCREEN_WIDTH // 2 - 340,
-                SCREEN_HEIGHT // 2 - 130,
-                680,
-                60,
+                px(SCREEN_WIDTH // 2 - 340),
+                px(SCREEN_HEIGHT // 2 - 130),
+                px(680),
+                px(60),
                 placeholder='Email'
             ),
             'password': InputBox(
-                SCREEN_WIDTH // 2 - 340,
-                SCREEN_HEIGHT // 2 - 0.25,
-                680,
-                60,
+                px(SCREEN_WIDTH // 2 - 340),
+                px(SCREEN_HEIGHT // 2 - 0.25),
+                px(680),
+                px(60),
                 placeholder='Password',
                 password=True
             ),
             'confirm_password': InputBox(
-                SCREEN_WIDTH // 2 - 340,
-                SCREEN_HEIGHT // 2 + 125,
-                680,
-                60,
+                px(SCREEN_WIDTH // 2 - 340),
+                px(SCREEN_HEIGHT // 2 + 125),
+                px(680),
+                px(60),
                 placeholder='Confirm Password',
                 password=True
             )
         }
 
         self.register_button = Button(
-            SCREEN_WIDTH // 2 - 200,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 - 200),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['register']['normal'],
             hover_img=self.button_images['register']['hover'],
             action=self.register,
@@ -57,8 +60,8 @@ class RegisterScreen:
         )
 
         self.back_button = Button(
-            SCREEN_WIDTH // 2 + 225,
-            SCREEN_HEIGHT // 2 + 275,
+            px(SCREEN_WIDTH // 2 + 225),
+            px(SCREEN_HEIGHT // 2 + 275),
             idle_img=self.button_images['back']['normal'],
             hover_img=self.button_images['back']['hover'],
             action=self.back,
@@ -67,8 +70,8 @@ class RegisterScreen:
         )
 
         self.close_button = Button(
-            x=100,
-            y=100,
+            x=px(100),
+            y=px(100),
             idle_img=self.button_images['close']['normal'],
             hover_img=self.button_images['close']['hover'],
             action=self.close,
@@ -79,7 +82,7 @@ class RegisterScreen:
         # Status message
         self.status_message = ""
         self.status_color = pygame.Color('white')
-        self.font = pygame.font.Font(FONT_PATH, FONT_SIZE // 2)
+        self.font = pygame.font.Font(FONT_PATH, px(FONT_SIZE // 2))
 
     def load_assets(self):
         # Load panel background
@@ -91,7 +94,7 @@ class RegisterScreen:
             if scale != 1.0:
                 original_width = self.panel_background.get_width()
                 original_height = self.panel_background.get_height()
-                new_size = (int(original_width * scale), int(original_height * scale))
+                new_size = (px(original_width * scale), px(original_height * scale))
                 self.panel_background = pygame.transform.scale(self.panel_background, new_size)
 
         # Load button images
@@ -146,6 +149,7 @@ class RegisterScreen:
             box.text = ''
         self.status_message = ""
         self.visible = False
+        UIRouter().unregister_scope(self)
 
         # Call the back callback if provided
         if self.on_back_callback:
@@ -153,6 +157,7 @@ class RegisterScreen:
 
     def close(self):
         self.visible = False
+        UIRouter().unregister_scope(self)
         # Reset input boxes and status message
         for box in self.input_boxes.values():
             box.text = ''
@@ -164,6 +169,7 @@ class RegisterScreen:
 
     def show(self):
         self.visible = True
+        UIRouter().set_scope(self, [self.register_button, self.back_button, self.close_button])
 
     def handle_events(self, event):
         if not self.visible:
@@ -182,9 +188,7 @@ class RegisterScreen:
                 pass
 
         # Handle buttons
-        self.register_button.update(event)
-        self.back_button.update(event)
-        self.close_button.update(event)
+        UIRouter().dispatch(event, scope=self)
 
     def update(self):
         for box in self.input_boxes.values():
@@ -194,12 +198,11 @@ class RegisterScreen:
         if not self.visible:
             return
 
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # RGBA, 180 is the alpha (transparency)
+        overlay = SurfacePool().get_overlay(self.screen.get_size(), (0, 0, 0, 180))  # 180 is the alpha
         self.screen.blit(overlay, (0, 0))
 
         # Draw the panel background
-        panel_rect = self.panel_background.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
+        panel_rect = self.panel_background.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 100)))
         self.screen.blit(self.panel_background, panel_rect)
 
         # Draw the input boxes
@@ -214,4 +217,4 @@ class RegisterScreen:
         # Draw status message if any
         if self.status_message:
             status_surf = self.font.render(self.status_message, True, self.status_color)
-            self.screen.blit(status_surf, (SCREEN_WIDTH // 2 - status_surf.get_width() // 2, SCREEN_HEIGHT // 2 + 475))
\ No newline at end of file
+            self.screen.blit(status_surf, (px(SCREEN_WIDTH // 2) - status_surf.get_width() // 2, px(SCREEN_HEIGHT // 2 + 475)))
\ No newline at end of file
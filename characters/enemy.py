@@ -1,7 +1,12 @@
 import pygame
 import os
 import random
-from settings import FONT_PATH
+from managers.sprite_variants import SpriteVariants
+from managers.display_manager import px
+from ui.glyph_atlas import get_atlas
+
+MINI_ENEMY_COUNT = 19  # mini_1.png to mini_19.png
+ENEMY_SCALE = 2.5
 
 
 class Enemy:
@@ -11,20 +16,22 @@ class Enemy:
         self.level = level
 
         # Default enemy range if not specified
-        self.enemy_range = enemy_range if enemy_range is not None else (1, 19)
+        self.enemy_range = enemy_range if enemy_range is not None else (1, MINI_ENEMY_COUNT)
 
         # HP and damage will be set by the level, but we provide defaults here
         self.hp = hp if hp is not None else 5  # Default HP
         self.max_hp = self.hp
         self.damage = damage if damage is not None else 1  # Default damage
+        self.display_hp = self.hp  # HP shown by the bar; eased towards hp by a battle animator
+        self.sprite = None  # AnimatedSprite set by a battle animator
 
         # Load the appropriate enemy image
         self.load_image()
 
         # Position the enemy on the right side of the screen
         self.rect = self.image.get_rect()
-        self.rect.x = 1200  # Right side position
-        self.rect.bottom = 700  # Adjust this value as needed
+        self.rect.x = px(1200)  # Right side position
+        self.rect.bottom = px(700)  # Adjust this value as needed
 
     def load_image(self):
         """Loads the appropriate enemy image based on type and level"""
@@ -47,13 +54,8 @@ class Enemy:
             if not os.path.exists(image_path):
                 image_path = os.path.join(self.script_dir, "assets", "images", "battle", "enemy", "mini", "mini_1.png")
 
-        self.image = pygame.image.load(image_path)
-
-        # Scale image if needed
-        scale_factor = 2.5  # Adjust based on your image size
-        self.image = pygame.transform.scale(self.image, (int(self.image.get_width() * scale_factor),
-                                                         int(self.image.get_height() * scale_factor)))
-        self.image = pygame.transform.flip(self.image, True, False)
+        # Scaled and facing the player; shared with every other battle that uses this enemy
+        self.image = SpriteVariants().get(image_path, ENEMY_SCALE, flip_x=True)
 
     def take_damage(self, amount):
         """Applies damage to the enemy"""
@@ -68,25 +70,26 @@ class Enemy:
 
     def draw(self, screen):
         """Draws the enemy on the screen"""
-        screen.blit(self.image, self.rect)
+        if self.sprite:
+            self.sprite.draw(screen)
+        else:
+            screen.blit(self.image, self.rect)
 
         # Draw HP bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = screen.get_width() - bar_width - 100
-        bar_y = screen.get_height() - bar_height - 320
+        bar_width = px(200)
+        bar_height = px(20)
+        bar_x = screen.get_width() - bar_width - px(100)
+        bar_y = screen.get_height() - bar_height - px(320)
 
         # Background (empty) bar
         pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
 
         # Filled portion of the bar
-        health_width = int(bar_width * (self.hp / self.max_hp))
+        health_width = int(bar_width * (self.display_hp / self.max_hp))
         pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
 
         # HP text
-        font = pygame.font.Font(FONT_PATH, 20)
-        hp_text = font.render(f"{self.hp}/{self.max_hp} HP", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + 10, bar_y + 2))
+        get_atlas(20, (255, 255, 255)).draw(screen, f"{self.hp}/{self.max_hp} HP", (bar_x + px(10), bar_y + px(2)))
 
 
 class MiniBoss(Enemy):
@@ -1,27 +1,30 @@
 import pygame
 import os
-from settings import FONT_PATH
+from managers.sprite_variants import SpriteVariants
+from managers.display_manager import px
+from ui.glyph_atlas import get_atlas
+
+PLAYER_SCALE = 5
 
 class Player:
-    def __init__(self, script_dir, player_type="boy"):
+    def __init__(self, script_dir, player_type="boy", flip_x=False):
         self.script_dir = script_dir
         self.player_type = player_type
         self.hp = 10  # Universal HP for every level
         self.max_hp = 10
         self.show_health_bar = True  # Add a flag to control health bar visibility
+        self.display_hp = self.hp  # HP shown by the bar; eased towards hp by a battle animator
+        self.sprite = None  # AnimatedSprite set by a battle animator
 
         # Load player image based on type (boy or girl)
         image_path = os.path.join(script_dir, "assets", "images", "battle", self.player_type, f"{self.player_type}_stand.png")
-        self.image = pygame.image.load(image_path)
-
-        # Scale image if needed (adjust scale factor as appropriate)
-        scale_factor = 5  # Adjust this value based on your image size
-        self.image = pygame.transform.scale(self.image,(int(self.image.get_width() * scale_factor),int(self.image.get_height() * scale_factor)))
+        # Scaled (and mirrored for the right side) once, then shared across battles
+        self.image = SpriteVariants().get(image_path, PLAYER_SCALE, flip_x)
 
         # Position the player on the left side of the screen
         self.rect = self.image.get_rect()
-        self.rect.x = 300  # Left side position
-        self.rect.bottom = 700  # Adjust this value as needed
+        self.rect.x = px(300)  # Left side position
+        self.rect.bottom = px(700)  # Adjust this value as needed
 
     def take_damage(self, amount):
         """Applies damage to the player"""
@@ -38,24 +41,25 @@ class Player:
 
     def draw(self, screen):
         """Draws the player on the screen"""
-        screen.blit(self.image, self.rect)
+        if self.sprite:
+            self.sprite.draw(screen)
+        else:
+            screen.blit(self.image, self.rect)
 
         # Only draw the HP bar if show_health_bar is True
         if self.show_health_bar:
             # Draw HP bar
-            bar_width = 200
-            bar_height = 20
-            bar_x = 100
-            bar_y = screen.get_height() - bar_height - 320
+            bar_width = px(200)
+            bar_height = px(20)
+            bar_x = px(100)
+            bar_y = screen.get_height() - bar_height - px(320)
 
             # Background (empty) bar
             pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
 
             # Filled portion of the bar
-            health_width = int(bar_width * (self.hp / self.max_hp))
+            health_width = int(bar_width * (self.display_hp / self.max_hp))
             pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
 
             # HP text
-            font = pygame.font.Font(FONT_PATH, 20)
-            hp_text = font.render(f"{self.hp}/{self.max_hp} HP", True, (255, 255, 255))
-            screen.blit(hp_text, (bar_x + 10, bar_y + 2))
\ No newline at end of file
+            get_atlas(20, (255, 255, 255)).draw(screen, f"{self.hp}/{self.max_hp} HP", (bar_x + px(10), bar_y + px(2)))
\ No newline at end of file
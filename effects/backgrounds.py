@@ -0,0 +1,73 @@
+import pygame
+import numpy as np
+
+# Palettes: gradient from top to bottom color, an overlay pattern and how strongly the edges darken
+BACKGROUND_THEMES = {
+    "custom": {"top": (0, 50, 100), "bottom": (0, 100, 200), "pattern": "stars", "vignette": 0.25},
+    "pvp": {"top": (70, 40, 120), "bottom": (30, 30, 80), "pattern": "stripes", "vignette": 0.45},
+}
+STAR_DENSITY = 0.0006  # Stars per pixel for the "stars" pattern
+STRIPE_WIDTH = 48  # Width in pixels of the diagonal bands for the "stripes" pattern
+STRIPE_SHADE = 0.9  # Brightness of the darker bands
+DITHER = 3  # Random +/- per channel so wide gradients do not band
+
+background_cache = {}  # (size, palette, seed) -> finished surface
+
+
+def vertical_gradient(width, height, top, bottom):
+    """Float array (width, height, 3) blending from the top color to the bottom color."""
+    t = np.linspace(0.0, 1.0, height, dtype=np.float32)[None, :, None]
+    top = np.array(top, dtype=np.float32)
+    bottom = np.array(bottom, dtype=np.float32)
+    column = top + (bottom - top) * t
+    return np.repeat(column, width, axis=0)
+
+
+def apply_pattern(pixels, pattern, rng):
+    width, height = pixels.shape[:2]
+    if pattern == "stars":
+        count = int(width * height * STAR_DENSITY)
+        xs = rng.integers(0, width, count)
+        ys = rng.integers(0, height, count)
+        brightness = rng.uniform(120, 255, count).astype(np.float32)
+        pixels[xs, ys] = np.maximum(pixels[xs, ys], brightness[:, None])
+    elif pattern == "stripes":
+        x, y = np.ogrid[:width, :height]
+        bands = ((x + y) // STRIPE_WIDTH) % 2
+        pixels *= np.where(bands, STRIPE_SHADE, 1.0).astype(np.float32)[:, :, None]
+
+
+def apply_vignette(pixels, strength):
+    """Darken towards the corners; strength is how dark the corners get (0 leaves the image alone)."""
+    width, height = pixels.shape[:2]
+    x = np.linspace(-1.0, 1.0, width, dtype=np.float32)[:, None]
+    y = np.linspace(-1.0, 1.0, height, dtype=np.float32)[None, :]
+    distance = np.clip((x * x + y * y) / 2, 0.0, 1.0)
+    pixels *= (1.0 - strength * distance)[:, :, None]
+
+
+def generate_background(size, palette, seed=0):
+    """Build the background pixels for a palette; the seed fixes the pattern and dithering."""
+    width, height = size
+    rng = np.random.default_rng(seed)
+    pixels = vertical_gradient(width, height, palette["top"], palette["bottom"])
+    apply_pattern(pixels, palette.get("pattern"), rng)
+    apply_vignette(pixels, palette.get("vignette", 0))
+    if DITHER:
+        pixels += rng.uniform(-DITHER, DITHER, pixels.shape).astype(np.float32)
+
+    surface = pygame.surfarray.make_surface(np.clip(pixels, 0, 255).astype(np.uint8))
+    # Match the display format so the per-frame blit is a plain copy
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def get_background(size, theme, seed=0):
+    """The background for a theme name (or palette dict), generated on first use and cached after that."""
+    palette = BACKGROUND_THEMES[theme] if isinstance(theme, str) else theme
+    key = (tuple(size), tuple(sorted(palette.items())), seed)
+    surface = background_cache.get(key)
+    if surface is None:
+        surface = background_cache[key] = generate_background(size, palette, seed)
+    return surface
@@ -46,5 +46,9 @@ class Fade:
     def draw(self):
         """Draw the fade overlay"""
         if self.fading:
-            self.surface.set_alpha(self.alpha)
-            self.screen.blit(self.surface, (0, 0))
\ No newline at end of file
+            self.draw_alpha(self.alpha)
+
+    def draw_alpha(self, alpha):
+        """Draw the overlay at a given alpha, for callers that time the fade themselves"""
+        self.surface.set_alpha(alpha)
+        self.screen.blit(self.surface, (0, 0))
\ No newline at end of file
@@ -0,0 +1,181 @@
+import pygame
+import numpy as np
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.display_manager import px
+
+FADE_LEVELS = 4  # Pre-rendered alpha steps per particle sprite
+CORRECT_COLORS = [(255, 215, 0), (120, 255, 120), (255, 255, 255)]
+WRONG_COLORS = [(255, 60, 60), (255, 140, 0), (120, 0, 0)]
+CONFETTI_COLORS = [(255, 80, 80), (255, 215, 0), (80, 200, 255), (120, 255, 120), (220, 120, 255)]
+METEOR_COLOR = (255, 230, 180)
+
+
+def fade_frames(image):
+    """Copies of a sprite from fully opaque down to faint, one per fade level."""
+    frames = []
+    for level in range(1, FADE_LEVELS + 1):
+        frame = image.copy()
+        frame.fill((255, 255, 255, 255 * level // FADE_LEVELS), special_flags=pygame.BLEND_RGBA_MULT)
+        frames.append((frame, frame.get_width() // 2, frame.get_height() // 2))
+    return frames
+
+
+def make_spark(color, radius):
+    image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(image, color, (radius, radius), radius)
+    pygame.draw.circle(image, (255, 255, 255), (radius, radius), max(1, radius // 2))
+    return fade_frames(image)
+
+
+def make_confetti(color, size):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(color)
+    return fade_frames(image)
+
+
+def make_meteor(color, length, angle):
+    """A streak with a bright head, pointing along angle (degrees, screen coordinates)."""
+    image = pygame.Surface((length, 8), pygame.SRCALPHA)
+    for x in range(length):
+        alpha = 255 * x // length
+        pygame.draw.line(image, (*color, alpha), (x, 4 - x * 3 // length), (x, 4 + x * 3 // length))
+    pygame.draw.circle(image, (255, 255, 255), (length - 4, 4), 4)
+    image = pygame.transform.rotate(image, -angle)
+    # Drawn in layout pixels, then baked for the canvas
+    image = pygame.transform.smoothscale(image, (px(image.get_width()), px(image.get_height())))
+    return fade_frames(image)
+
+
+class ParticleSystem:
+    def __init__(self, pool_size):
+        """A fixed pool of particles stored in NumPy arrays, one row per slot, with no per-particle objects."""
+        self.pool_size = pool_size
+        self.pos = np.zeros((pool_size, 2), dtype=np.float32)
+        self.vel = np.zeros((pool_size, 2), dtype=np.float32)
+        self.gravity = np.zeros(pool_size, dtype=np.float32)  # Pixels per second squared, downwards
+        self.life = np.zeros(pool_size, dtype=np.float32)  # Seconds left; 0 marks a free slot
+        self.max_life = np.ones(pool_size, dtype=np.float32)
+        self.sprite = np.zeros(pool_size, dtype=np.int16)  # Index into self.sprites
+        self.alive_count = 0
+
+        # Every sprite the pool can show, rendered once: a list of fade frames per sprite
+        self.sprites = []
+        self.correct_sprites = [self.add_sprite(make_spark(color, px(6))) for color in CORRECT_COLORS]
+        self.wrong_sprites = [self.add_sprite(make_spark(color, px(6))) for color in WRONG_COLORS]
+        self.confetti_sprites = [self.add_sprite(make_confetti(color, size)) for color in CONFETTI_COLORS
+                                 for size in ((px(10), px(6)), (px(6), px(10)))]
+        self.meteor_angle = 25  # Every meteor falls the same way, so one streak sprite is enough
+        self.meteor_sprites = [self.add_sprite(make_meteor(METEOR_COLOR, 60, self.meteor_angle))]
+
+    def add_sprite(self, frames):
+        self.sprites.append(frames)
+        return len(self.sprites) - 1
+
+    def emit(self, count, x, y, sprites, speed, life, angle=(0, 360), gravity=0, spread=(0, 0), rng=np.random):
+        """Start up to count particles at (x, y); particles that do not fit in the pool are dropped.
+
+        Positions, speeds and gravity are in canvas pixels; the presets below convert their layout values.
+        """
+        free = np.flatnonzero(self.life <= 0)[:count]
+        count = len(free)
+        if count == 0:
+            return 0
+
+        angles = np.radians(rng.uniform(angle[0], angle[1], count))
+        speeds = rng.uniform(speed[0], speed[1], count)
+        self.pos[free, 0] = x + rng.uniform(-spread[0], spread[0], count)
+        self.pos[free, 1] = y + rng.uniform(-spread[1], spread[1], count)
+        self.vel[free, 0] = np.cos(angles) * speeds
+        self.vel[free, 1] = np.sin(angles) * speeds
+        self.gravity[free] = gravity
+        self.life[free] = self.max_life[free] = rng.uniform(life[0], life[1], count)
+        self.sprite[free] = rng.choice(sprites, count)
+        self.alive_count += count
+        return count
+
+    def burst(self, x, y, correct=True, count=60):
+        """Answer feedback: golden sparks for a correct answer, red ones for a wrong one."""
+        sprites = self.correct_sprites if correct else self.wrong_sprites
+        return self.emit(count, x, y, sprites, speed=(px(150), px(450)), life=(0.4, 0.9), gravity=px(600))
+
+    def confetti(self, count=300):
+        """Victory confetti falling from above the top of the screen."""
+        return self.emit(count, px(SCREEN_WIDTH // 2), px(-20), self.confetti_sprites, speed=(px(20), px(120)),
+                         life=(2.0, 3.5), angle=(60, 120), gravity=px(150), spread=(px(SCREEN_WIDTH // 2), px(20)))
+
+    def meteor(self, rng=np.random):
+        """One shooting star across the upper part of the screen."""
+        x = rng.uniform(0, px(SCREEN_WIDTH * 0.7))
+        y = rng.uniform(px(-50), px(SCREEN_HEIGHT * 0.3))
+        direction = (self.meteor_angle, self.meteor_angle)
+        return self.emit(1, x, y, self.meteor_sprites, speed=(px(900), px(1300)), life=(0.6, 1.0), angle=direction,
+                         rng=rng)
+
+    def update(self, step):
+        """Advance every live particle by one fixed step of step seconds."""
+        if self.alive_count == 0:
+            return
+        alive = self.life > 0
+        self.vel[alive, 1] += self.gravity[alive] * step
+        self.pos[alive] += self.vel[alive] * step
+        self.life[alive] -= step
+        self.alive_count = int(np.count_nonzero(self.life > 0))
+
+    def is_active(self):
+        return self.alive_count > 0
+
+    def clear(self):
+        self.life[:] = 0
+        self.alive_count = 0
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """Blit every live particle with the fade frame for its remaining life."""
+        if self.alive_count == 0:
+            return
+        indices = np.flatnonzero(self.life > 0)
+        levels = np.minimum((self.life[indices] / self.max_life[indices] * FADE_LEVELS).astype(np.int32),
+                            FADE_LEVELS - 1)
+        xs = (self.pos[indices, 0] + offset_x).astype(np.int32)
+        ys = (self.pos[indices, 1] + offset_y).astype(np.int32)
+
+        sprites = self.sprites
+        blits = []
+        for sprite, level, x, y in zip(self.sprite[indices].tolist(), levels.tolist(), xs.tolist(), ys.tolist()):
+            frame, half_width, half_height = sprites[sprite][level]
+            blits.append((frame, (x - half_width, y - half_height)))
+        screen.blits(blits, doreturn=False)
+
+
+def benchmark_particles(start_count=1000, frames=60, budget_ms=1000 / 60, max_count=1 << 16):
+    """Double the live particles until an update and draw take longer than the frame budget."""
+    from managers.display_manager import DisplayManager
+
+    display_manager = DisplayManager()
+    screen = display_manager.canvas
+    width, height = display_manager.render_size
+    rng = np.random.default_rng(1)
+    results = {}
+    count = start_count
+    while True:
+        particles = ParticleSystem(count)
+        # Long-lived sparks spread over the screen, so the pool stays full for the whole run
+        particles.emit(count, width // 2, height // 2, particles.correct_sprites + particles.confetti_sprites,
+                       speed=(0, px(60)), life=(100, 100), spread=(width // 2, height // 2), rng=rng)
+        start = pygame.time.get_ticks()
+        for _ in range(frames):
+            pygame.event.pump()
+            screen.fill((0, 0, 0))
+            particles.update(1 / 60)
+            particles.draw(screen)
+            display_manager.present()
+        average_ms = (pygame.time.get_ticks() - start) / frames
+        results[count] = round(average_ms, 2)
+        print(f"Particles: {count} particles averaged {average_ms:.2f} ms per frame")
+        if average_ms > budget_ms or count >= max_count:
+            break
+        count *= 2
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_particles()
@@ -0,0 +1,121 @@
+import inspect
+import pygame
+from managers.asset_manager import AssetPreloader
+from managers.display_manager import DisplayManager, px
+from managers.frame_governor import FrameGovernor
+from .fade import Fade
+
+TRANSITION_SECONDS = 0.35  # Length of each half: covering the outgoing scene, revealing the incoming one
+CROSS_DIM_ALPHA = 140  # How dark the outgoing scene gets while a cross-fade waits for loading
+LOADING_BAR_COLOR = (255, 215, 0)
+
+
+class Transition:
+    def __init__(self, screen, style="fade", duration=TRANSITION_SECONDS):
+        """Scene change that covers the outgoing scene while the incoming one loads, then reveals it.
+
+        Styles: "fade" goes through black, "cross" blends the two scenes and "wipe" sweeps a black edge across.
+        """
+        self.screen = screen
+        self.style = style
+        self.duration_ms = duration * 1000
+        self.width, self.height = screen.get_size()
+        self.fade = Fade(screen, self.width, self.height)
+        self.frame_governor = FrameGovernor()
+        self.quit_requested = False
+
+    def run(self, build, manifest=(), draw_incoming=None):
+        """Snapshot the outgoing scene, preload the manifest behind the cover, build the scene and reveal it.
+
+        build() returns the incoming scene, or is a generator that yields its progress between stages and
+        returns the scene; draw_incoming(scene) draws its first frame for the reveal.
+        """
+        outgoing = self.screen.copy()  # Taken once; every covering frame reuses it
+
+        # Decoding runs on the preloader's threads while the cover animates
+        preloader = AssetPreloader(list(manifest))
+        preloader.start()
+        self.play(lambda t: self.draw_cover(outgoing, t), preloader)
+
+        # Everything is covered now, so the build's remaining work is not seen
+        covered = self.screen.copy()
+        scene = self.build_scene(build, covered)
+
+        if draw_incoming is not None:
+            draw_incoming(scene)
+            incoming = self.screen.copy()
+            self.play(lambda t: self.draw_reveal(covered, incoming, t))
+
+        # A quit pressed during the transition belongs to the incoming scene
+        if self.quit_requested:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return scene
+
+    def play(self, draw_frame, preloader=None):
+        """Draw frames for one half of the transition; a covering half also waits for the preloader."""
+        start = pygame.time.get_ticks()
+        while True:
+            t = min(1.0, (pygame.time.get_ticks() - start) / self.duration_ms)
+            if preloader is not None:
+                preloader.poll()
+            draw_frame(t)
+            if preloader is not None and t >= 1 and not preloader.done():
+                self.draw_loading_bar(preloader.progress())
+            DisplayManager().present()
+
+            self.pump_events()
+            self.frame_governor.tick(True)
+
+            if t >= 1 and (preloader is None or preloader.done()):
+                return
+
+    def build_scene(self, build, covered):
+        """Run build behind the cover, drawing a frame and pumping events between a generator build's stages."""
+        self.show_covered(covered, 0)
+        steps = build()
+        if not inspect.isgenerator(steps):
+            self.show_covered(covered, 1)
+            return steps
+        while True:
+            try:
+                progress = next(steps)
+            except StopIteration as finished:
+                return finished.value
+            self.show_covered(covered, progress)
+
+    def show_covered(self, covered, progress):
+        """Present the covered screen with the build's progress and keep the window responding."""
+        self.screen.blit(covered, (0, 0))
+        self.draw_loading_bar(progress)
+        DisplayManager().present()
+        self.pump_events()
+
+    def pump_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit_requested = True
+
+    def draw_cover(self, outgoing, t):
+        self.screen.blit(outgoing, (0, 0))
+        if self.style == "wipe":
+            self.screen.fill((0, 0, 0), (0, 0, round(self.width * t), self.height))
+        elif self.style == "cross":
+            self.fade.draw_alpha(round(CROSS_DIM_ALPHA * t))
+        else:
+            self.fade.draw_alpha(round(255 * t))
+
+    def draw_reveal(self, covered, incoming, t):
+        self.screen.blit(incoming, (0, 0))
+        if self.style == "wipe":
+            left = round(self.width * t)
+            self.screen.fill((0, 0, 0), (left, 0, self.width - left, self.height))
+        elif self.style == "cross":
+            covered.set_alpha(round(255 * (1 - t)))
+            self.screen.blit(covered, (0, 0))
+        else:
+            self.fade.draw_alpha(round(255 * (1 - t)))
+
+    def draw_loading_bar(self, progress):
+        """Thin bar along the bottom edge, only shown when loading outlasts the cover or while the scene builds."""
+        bar = pygame.Rect(0, self.height - px(8), round(self.width * progress), px(8))
+        self.screen.fill(LOADING_BAR_COLOR, bar)
@@ -1,11 +1,23 @@
 import pygame
-import time
 import os
 from characters.player import Player
-from gameplay.questions import QuestionGenerator
+from gameplay.questions import QuestionGenerator, AnswerButton
 from managers.audio_manager import AudioManager
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.display_manager import DisplayManager, px
+from managers.frame_governor import FrameGovernor
+from managers.fixed_timestep import FixedTimestep
+from managers.game_clock import GameClock
+from managers.ui_router import UIRouter
+from managers.draw_list import DrawList, BOX_LAYER, BORDER_LAYER, CONTENT_LAYER
+from ui.text_layout import TextCache
+from ui.glyph_atlas import get_atlas
 from .map_pause import Pause
+from .battle_animation import BattleAnimator
+from effects.particles import ParticleSystem
+from managers.performance_manager import PerformanceManager
+
+BATTLE_END_SECONDS = 2  # How long the result stays on screen before the battle closes
 
 class Battle:
     def __init__(self, screen, script_dir, level, player_type="boy", audio_manager=None, game_instance=None):
@@ -13,9 +25,16 @@ class Battle:
         self.script_dir = script_dir
         self.level = level
         self.running = True
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(FONT_PATH, 50)
-        self.small_font = pygame.font.Font(FONT_PATH, 30)
+        self.frame_governor = FrameGovernor()
+        self.timestep = FixedTimestep()
+        self.game_clock = GameClock()
+        self.font = pygame.font.Font(FONT_PATH, px(50))
+        self.small_font = pygame.font.Font(FONT_PATH, px(30))
+        self.text_cache = TextCache(self.font, (255, 255, 255))
+        self.label_cache = TextCache(self.small_font, (255, 255, 255))
+        self.message_cache = TextCache(self.font, (255, 255, 0))
+        self.draw_list = DrawList()  # Interface commands of the frame being drawn
+        self.timer_atlas = get_atlas(50, (255, 255, 255))  # The countdown changes every second
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
@@ -23,14 +42,21 @@ class Battle:
         self.player = Player(script_dir, player_type)
         self.enemy = level.create_enemy()
 
+        # Attack lunges, hit flashes, screen shake, HP bar easing and hit bursts
+        self.particles = ParticleSystem(PerformanceManager().get("particles"))
+        self.animator = BattleAnimator(self.particles)
+        self.animator.add_fighter(self.player, facing=1)
+        self.animator.add_fighter(self.enemy, facing=-1)
+
         # Battle state
         self.current_question = None
         self.selected_answer = None
         self.answer_buttons = []
-        self.timer_start = 0
+        self.hovered_button = None  # Answer button under the cursor this frame
         self.time_left = level.get_timer_seconds()
         self.battle_message = ""
         self.message_timer = 0
+        self.end_time = None  # Game clock time at which a decided battle closes
 
         # Save the current map OST for restoration later
         self.player_type = player_type
@@ -80,123 +106,120 @@ class Battle:
     def generate_new_question(self):
         """Generates a new question for the battle"""
         self.current_question = QuestionGenerator.get_random_question(self.level.get_difficulty())
-        self.timer_start = time.time()
         self.time_left = self.level.get_timer_seconds()
         self.selected_answer = None
         self.create_answer_buttons()
 
     def create_answer_buttons(self):
         """Creates the answer buttons based on the current question"""
+        choices = self.current_question.choices
+        # Questions keep the same number of choices, so the buttons are relabelled rather than rebuilt
+        if len(choices) == len(self.answer_buttons):
+            for button, choice in zip(self.answer_buttons, choices):
+                button.set_value(choice)
+            return
+
+        UIRouter().unregister_scope(self)  # The previous question's buttons
         self.answer_buttons = []
         # Create a button for each choice
-        button_width = 200
-        button_height = 60
-        button_margin = 20
-        total_width = (button_width + button_margin) * len(self.current_question.choices)
-        start_x = (SCREEN_WIDTH - total_width) // 2
+        button_width = px(200)
+        button_height = px(60)
+        button_margin = px(20)
+        total_width = (button_width + button_margin) * len(choices)
+        start_x = (px(SCREEN_WIDTH) - total_width) // 2
 
-        for i, choice in enumerate(self.current_question.choices):
+        for i, choice in enumerate(choices):
             button_rect = pygame.Rect(
                 start_x + i * (button_width + button_margin),
-                SCREEN_HEIGHT - 150,
+                px(SCREEN_HEIGHT - 150),
                 button_width,
                 button_height
             )
-            self.answer_buttons.append({
-                'rect': button_rect,
-                'value': choice,
-                'text': str(choice),
-                'hovered': False
-            })
+            self.answer_buttons.append(AnswerButton(button_rect, choice))
+            UIRouter().register(self.answer_buttons[-1], scope=self)
 
     def handle_events(self):
         """Handle user input during battle"""
-        for event in pygame.event.get():
+        for event in self.frame_governor.get_events(not self.pause_menu.is_paused()):
             if event.type == pygame.QUIT:
                 self.running = False
 
             # Only process other events if not paused
             if not self.pause_menu.is_paused():
-                if event.type == pygame.MOUSEMOTION:
-                    # Check if mouse is hovering over any answer button
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        button['hovered'] = button['rect'].collidepoint(mouse_pos)
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Check if an answer button was clicked
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        if button['rect'].collidepoint(mouse_pos):
-                            self.selected_answer = button['value']
-                            self.check_answer()
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    # The router hit-tests the click against the answer buttons
+                    button = UIRouter().widget_at(event.pos, scope=self)
+                    # Answers are ignored once the battle is decided
+                    if button is not None and self.end_time is None:
+                        self.selected_answer = button.value
+                        self.check_answer()
 
             # Always process pause menu events
             self.pause_menu.update(event)
 
+        # Hover is resolved once per frame rather than on every mouse motion
+        self.hovered_button = None if self.pause_menu.is_paused() else UIRouter().hovered_widget(scope=self)
+
     def check_answer(self):
         """Checks if the selected answer is correct"""
         if self.selected_answer == self.current_question.answer:
             # Correct answer - enemy takes damage
             self.enemy.take_damage(1)
+            self.animator.attack(self.player, self.enemy, correct=True)
             self.battle_message = "Correct! Enemy takes damage!"
 
             if self.enemy.hp <= 0:
                 self.battle_message = "Victory! You defeated the enemy!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=True)
             else:
                 # Generate a new question
                 self.generate_new_question()
         else:
             # Wrong answer - player takes damage
             self.player.take_damage(self.enemy.get_damage_amount())
+            self.animator.attack(self.enemy, self.player, correct=False)
             self.battle_message = f"Wrong! You take {self.enemy.get_damage_amount()} damage!"
 
             if self.player.hp <= 0:
                 self.battle_message = "Defeat! You have been defeated!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=False)
             else:
                 # Generate a new question
                 self.generate_new_question()
 
         # Set message timer
-        self.message_timer = time.time()
-
-    def update_timer(self):
-        """Updates the time left to answer the question"""
-        # If paused, don't update anything
-        if self.pause_menu.is_paused():
+        self.message_timer = self.game_clock.now()
+
+    def end_battle(self, victory):
+        """Let the last hit play out for a moment before the battle loop ends."""
+        if victory:
+            self.particles.confetti()
+        self.end_time = self.game_clock.now() + BATTLE_END_SECONDS
+
+    def update_timer(self, step):
+        """Counts the time left to answer the question down by one simulation step"""
+        # If paused or already decided, don't update anything
+        if self.pause_menu.is_paused() or self.end_time is not None:
             return
 
-        # Adjust timer for any time spent paused
-        paused_time = self.pause_menu.get_total_paused_time()
-        if paused_time > 0:
-            self.timer_start += paused_time  # Move the start time forward by paused duration
-
         # Calculate remaining time
-        elapsed = time.time() - self.timer_start
-        self.time_left = max(0, self.level.get_timer_seconds() - elapsed)
+        self.time_left = max(0, self.time_left - step)
 
         # If time runs out, treat as wrong answer
         if self.time_left <= 0 and self.running:
             self.battle_message = "Time's up! You take damage!"
             self.player.take_damage(self.enemy.get_damage_amount())
+            self.animator.attack(self.enemy, self.player, correct=False)
 
             if self.player.hp <= 0:
                 self.battle_message = "Defeat! You have been defeated!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=False)
             else:
                 # Generate a new question
                 self.generate_new_question()
 
             # Set message timer
-            self.message_timer = time.time()
+            self.message_timer = self.game_clock.now()
 
     def draw(self):
         """Draws the battle screen"""
@@ -206,64 +229,79 @@ class Battle:
         # Draw player and enemy
         self.player.draw(self.screen)
         self.enemy.draw(self.screen)
+        self.animator.apply_shake(self.screen)
+
+        # The interface is queued and drawn in batches: boxes, then borders, then text
+        hud = self.draw_list
 
         # Draw timer
-        timer_text = self.font.render(f"Time: {int(self.time_left)}", True, (255, 255, 255))
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        pygame.draw.rect(self.screen, (0, 0, 0),
-                         (timer_rect.x - 10, timer_rect.y - 10,
-                          timer_rect.width + 20, timer_rect.height + 20))
-        self.screen.blit(timer_text, timer_rect)
+        timer_text = f"Time: {int(self.time_left)}"
+        timer_rect = self.timer_atlas.get_rect(timer_text, center=(px(SCREEN_WIDTH // 2), px(50)))
+        hud.fill((0, 0, 0), timer_rect.inflate(px(20), px(20)), layer=BOX_LAYER)
+        hud.blits(self.timer_atlas.glyph_blits(timer_text, timer_rect.topleft), layer=CONTENT_LAYER)
 
         # Draw question box
-        question_box = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 200)
-        pygame.draw.rect(self.screen, (0, 0, 0, 200), question_box)
-        pygame.draw.rect(self.screen, (255, 255, 255), question_box, 3)
+        question_box = pygame.Rect(px(50), px(SCREEN_HEIGHT - 300), px(SCREEN_WIDTH - 100), px(200))
+        hud.fill((0, 0, 0, 200), question_box, layer=BOX_LAYER)
+        hud.rect((255, 255, 255), question_box, px(3), layer=BORDER_LAYER)
 
         # Draw question text
-        question_text = self.font.render(self.current_question.question_text, True, (255, 255, 255))
-        question_rect = question_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250))
-        self.screen.blit(question_text, question_rect)
+        question_text = self.text_cache.render(self.current_question.question_text)
+        question_rect = question_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT - 250)))
+        hud.blit(question_text, question_rect, layer=CONTENT_LAYER)
 
         # Draw answer buttons if not paused
         if not self.pause_menu.is_paused():
             for button in self.answer_buttons:
-                color = (100, 100, 255) if button['hovered'] else (50, 50, 200)
-                pygame.draw.rect(self.screen, color, button['rect'])
-                pygame.draw.rect(self.screen, (255, 255, 255), button['rect'], 2)
-                text = self.small_font.render(button['text'], True, (255, 255, 255))
-                text_rect = text.get_rect(center=button['rect'].center)
-                self.screen.blit(text, text_rect)
+                color = (100, 100, 255) if button is self.hovered_button else (50, 50, 200)
+                hud.fill(color, button.rect, layer=BOX_LAYER)
+                hud.rect((255, 255, 255), button.rect, px(2), layer=BORDER_LAYER)
+                text = self.label_cache.render(button.text)
+                hud.blit(text, text.get_rect(center=button.rect.center), layer=CONTENT_LAYER)
 
         # Draw battle message
-        if self.battle_message and time.time() - self.message_timer < 2:
-            message_text = self.font.render(self.battle_message, True, (255, 255, 0))
-            message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            pygame.draw.rect(self.screen, (0, 0, 0),
-                             (message_rect.x - 10, message_rect.y - 10,
-                              message_rect.width + 20, message_rect.height + 20))
-            self.screen.blit(message_text, message_rect)
+        if self.battle_message and self.game_clock.now() - self.message_timer < 2:
+            message_text = self.message_cache.render(self.battle_message)
+            message_rect = message_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
+            hud.fill((0, 0, 0), message_rect.inflate(px(20), px(20)), layer=BOX_LAYER)
+            hud.blit(message_text, message_rect, layer=CONTENT_LAYER)
+        hud.flush(self.screen)
+
+        # Particles over the scene and the UI
+        self.particles.draw(self.screen)
 
         # Draw pause menu (button and overlay if paused)
         self.pause_menu.draw()
 
     def run(self):
         """Main battle loop"""
+        self.game_clock.tick()  # Time before the battle loop does not count
         while self.running:
             # Handle events
             self.handle_events()
 
-            # Update timer
-            self.update_timer()
+            # Advance the timer in fixed steps; the game clock stands still while paused
+            for _ in range(self.timestep.advance(self.game_clock.tick())):
+                self.update_timer(self.timestep.step)
+                self.animator.step()
+
+            # The result stays on screen, still animating, until the end time
+            if self.end_time is not None and self.game_clock.now() >= self.end_time:
+                self.running = False
 
             # Draw battle
             self.draw()
 
             # Update display
-            pygame.display.flip()
+            DisplayManager().present()
+
+            # Cap the frame rate; a paused battle drops to the idle rate
+            self.frame_governor.tick(not self.pause_menu.is_paused() or self.animator.is_animating())
 
-            # Cap the frame rate
-            self.clock.tick(FPS)
+        # Leaving from the pause menu must not keep the clock stopped
+        self.game_clock.set_paused(False)
+        UIRouter().unregister_scope(self)
+        UIRouter().unregister_scope(self.pause_menu)
 
         # Stop battle music and restore map music when the battle ends
         self.stop_battle_music()
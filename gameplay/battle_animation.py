@@ -0,0 +1,226 @@
+import os
+import weakref
+import pygame
+import random
+from settings import SIMULATION_HZ
+from managers.sprite_variants import SpriteVariants
+from managers.display_manager import px
+from characters.enemy import MINI_ENEMY_COUNT, ENEMY_SCALE
+from characters.player import PLAYER_SCALE
+
+# Clips are compiled to one pose per simulation step: (offset x, offset y, angle, scale, flash).
+# Angle, scale and flash are quantized so every pose maps to a cached transformed frame.
+REST_POSE = (0, 0, 0, 1.0, 0)
+SCALE_STEP = 0.02
+FLASH_LEVELS = 4  # Flash 1..FLASH_LEVELS brightens the sprite towards white
+IMPACT_FRAME = 7  # Step of the lunge where the hit lands
+HP_EASING = 0.12  # Share of the remaining HP difference the bar catches up per step
+
+
+def ease(kind, t):
+    if kind == "out":
+        return 1 - (1 - t) * (1 - t)
+    if kind == "in":
+        return t * t
+    return t
+
+
+def compile_track(keyframes, frame_count):
+    """Sample (time, value, easing) keyframes at every simulation step."""
+    values = []
+    for frame in range(frame_count):
+        time = frame / SIMULATION_HZ
+        value = keyframes[-1][1]
+        for (start, start_value, _), (end, end_value, kind) in zip(keyframes, keyframes[1:]):
+            if start <= time <= end:
+                t = (time - start) / (end - start) if end > start else 1
+                value = start_value + (end_value - start_value) * ease(kind, t)
+                break
+        values.append(value)
+    return values
+
+
+def compile_clip(duration, x=None, y=None, angle=None, scale=None, flash=None):
+    """Precompile keyframed tracks into a tuple of quantized poses, one per step."""
+    frame_count = max(1, round(duration * SIMULATION_HZ))
+    rest = [(0, 0, "linear")]
+    xs = compile_track(x or rest, frame_count)
+    ys = compile_track(y or rest, frame_count)
+    angles = compile_track(angle or rest, frame_count)
+    scales = compile_track(scale or [(0, 1, "linear")], frame_count)
+    flashes = compile_track(flash or rest, frame_count)
+    return tuple((round(xs[i]), round(ys[i]), round(angles[i]), round(scales[i] / SCALE_STEP) * SCALE_STEP,
+                  round(flashes[i] * FLASH_LEVELS)) for i in range(frame_count))
+
+
+def mirror_clip(clip):
+    """The same clip for a fighter facing the other way."""
+    return tuple((-x, y, -angle, scale, flash) for x, y, angle, scale, flash in clip)
+
+
+def compile_shake(duration, amplitude, seed=7):
+    """Decaying random screen offsets, fixed by the seed so every shake looks the same."""
+    rng = random.Random(seed)
+    frame_count = round(duration * SIMULATION_HZ)
+    offsets = []
+    for frame in range(frame_count):
+        strength = amplitude * (1 - frame / frame_count)
+        offsets.append((round(rng.uniform(-strength, strength)), round(rng.uniform(-strength, strength))))
+    return tuple(offsets)
+
+
+# Clips for a fighter facing right (the left side of the screen); mirror_clip() gives the other side
+LUNGE_CLIP = compile_clip(
+    0.4,
+    x=[(0, 0, "linear"), (0.12, 90, "out"), (0.4, 0, "in")],
+    y=[(0, 0, "linear"), (0.06, -20, "out"), (0.12, 0, "in")],
+    angle=[(0, 0, "linear"), (0.12, -8, "out"), (0.4, 0, "linear")],
+)
+HIT_CLIP = compile_clip(
+    0.35,
+    x=[(0, 0, "linear"), (0.06, -30, "out"), (0.35, 0, "in")],
+    angle=[(0, 0, "linear"), (0.06, 6, "out"), (0.35, 0, "linear")],
+    scale=[(0, 1, "linear"), (0.06, 0.94, "out"), (0.35, 1, "linear")],
+    flash=[(0, 1, "linear"), (0.1, 1, "linear"), (0.35, 0, "linear")],
+)
+SHAKE_OFFSETS = compile_shake(0.3, 12)
+
+# Fighter images come from the shared sprite variants, so their transformed frames can be shared too
+shared_frames = weakref.WeakKeyDictionary()  # image -> {(angle, scale, flash): frame}
+
+
+class AnimatedSprite:
+    def __init__(self, image, rect, facing=1, prewarm=True):
+        """A fighter image that plays precompiled clips around its rect."""
+        self.image = image
+        self.rect = rect  # Shared with the fighter, so moving the fighter moves the sprite
+        self.facing = facing  # 1 faces right, -1 faces left
+        self.clip = None
+        self.frame = 0
+        self.frames = shared_frames.setdefault(image, {})  # (angle, scale, flash) -> transformed image
+        self.lunge_clip = LUNGE_CLIP if facing > 0 else mirror_clip(LUNGE_CLIP)
+        self.hit_clip = HIT_CLIP if facing > 0 else mirror_clip(HIT_CLIP)
+        if prewarm:
+            for _ in self.prewarm_steps((self.lunge_clip, self.hit_clip)):
+                pass
+
+    def prewarm_steps(self, clips):
+        """Transform every pose the clips use, one per step, so playing them never calls pygame.transform."""
+        yield self.get_frame(REST_POSE)
+        for clip in clips:
+            for pose in clip:
+                yield self.get_frame(pose)
+
+    def get_frame(self, pose):
+        key = pose[2:]
+        frame = self.frames.get(key)
+        if frame is None:
+            _, _, angle, scale, flash = pose
+            frame = self.image
+            if angle or scale != 1:
+                frame = pygame.transform.rotozoom(frame, angle, scale)
+            if flash:
+                frame = frame.copy()
+                level = 255 * flash // FLASH_LEVELS
+                frame.fill((level, level, level, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self.frames[key] = frame
+        return frame
+
+    def play(self, clip):
+        self.clip = clip
+        self.frame = 0
+
+    def is_playing(self):
+        return self.clip is not None
+
+    def step(self):
+        if self.clip is not None:
+            self.frame += 1
+            if self.frame >= len(self.clip):
+                self.clip = None
+
+    def draw(self, screen):
+        pose = self.clip[self.frame] if self.clip is not None else REST_POSE
+        frame = self.get_frame(pose)
+        center = (self.rect.centerx + px(pose[0]), self.rect.centery + px(pose[1]))  # Poses are in layout pixels
+        screen.blit(frame, frame.get_rect(center=center))
+
+
+def warm_battle_sprites(script_dir):
+    """Prepare every mini enemy and hero image, with its animation frames, in the background."""
+    battle_dir = os.path.join(script_dir, "assets", "images", "battle")
+    keys = [(os.path.join(battle_dir, "enemy", "mini", f"mini_{mini_id}.png"), ENEMY_SCALE, True, None)
+            for mini_id in range(1, MINI_ENEMY_COUNT + 1)]
+    for hero in ("boy", "girl"):
+        path = os.path.join(battle_dir, hero, f"{hero}_stand.png")
+        keys += [(path, PLAYER_SCALE, False, None), (path, PLAYER_SCALE, True, None)]  # Left and right side
+
+    def prewarm(key, image):
+        # Flipped images face left, like enemies and PVP player 2
+        sprite = AnimatedSprite(image, image.get_rect(), -1 if key[2] else 1, prewarm=False)
+        return sprite.prewarm_steps((sprite.lunge_clip, sprite.hit_clip))
+
+    SpriteVariants().warm(keys, prewarm)
+
+
+class BattleAnimator:
+    def __init__(self, particles=None):
+        """Plays attack timelines for a battle: lunges, hit flashes, screen shake and HP bar easing."""
+        self.particles = particles  # Optional ParticleSystem for hit bursts, stepped along with the timelines
+        self.fighters = []  # Players and enemies with a sprite and an eased display_hp
+        self.events = []  # [steps left, callback] fired by step()
+        self.shake_frame = len(SHAKE_OFFSETS)
+
+    def add_fighter(self, fighter, facing=1):
+        """Animate a Player or Enemy; call again if its image changes (e.g. flipped)."""
+        fighter.sprite = AnimatedSprite(fighter.image, fighter.rect, facing)
+        fighter.display_hp = fighter.hp
+        if fighter not in self.fighters:
+            self.fighters.append(fighter)
+
+    def attack(self, attacker, target, correct=True):
+        """Attacker lunges; the target is hit when the lunge connects."""
+        attacker.sprite.play(attacker.sprite.lunge_clip)
+        self.schedule(IMPACT_FRAME, lambda: self.hurt(target, correct))
+
+    def hurt(self, target, correct=False):
+        """Hit flash and knockback on the target, a screen shake and a burst colored by the answer."""
+        target.sprite.play(target.sprite.hit_clip)
+        self.shake_frame = 0
+        if self.particles:
+            self.particles.burst(*target.rect.center, correct=correct)
+
+    def schedule(self, steps, callback):
+        self.events.append([steps, callback])
+
+    def step(self):
+        """Advance every timeline by one simulation step."""
+        for event in self.events[:]:
+            event[0] -= 1
+            if event[0] <= 0:
+                self.events.remove(event)
+                event[1]()
+
+        for fighter in self.fighters:
+            fighter.sprite.step()
+            # Ease the bar towards the real HP, snapping when close
+            difference = fighter.hp - fighter.display_hp
+            fighter.display_hp = fighter.hp if abs(difference) < 0.01 else fighter.display_hp + difference * HP_EASING
+
+        if self.shake_frame < len(SHAKE_OFFSETS):
+            self.shake_frame += 1
+
+        if self.particles:
+            self.particles.update(1 / SIMULATION_HZ)
+
+    def is_animating(self):
+        if self.particles and self.particles.is_active():
+            return True
+        return bool(self.events) or self.shake_frame < len(SHAKE_OFFSETS) or any(
+            fighter.sprite.is_playing() or fighter.display_hp != fighter.hp for fighter in self.fighters)
+
+    def apply_shake(self, screen):
+        """Shift what has been drawn so far (the battle scene, not the UI) by the shake offset."""
+        if self.shake_frame < len(SHAKE_OFFSETS):
+            offset_x, offset_y = SHAKE_OFFSETS[self.shake_frame]
+            screen.scroll(px(offset_x), px(offset_y))
@@ -1,8 +1,11 @@
 import pygame
 import random
-import time
 import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.display_manager import DisplayManager, px
+from managers.asset_manager import AssetManager
+from managers.frame_governor import FrameGovernor
+from managers.game_clock import GameClock
 
 
 class CoinToss:
@@ -12,30 +15,30 @@ class CoinToss:
         self.script_dir = script_dir
         self.audio_manager = audio_manager
         self.battle_instance = battle_instance  # Store reference to battle instance
-        self.font = pygame.font.Font(FONT_PATH, 50)
-        self.result_font = pygame.font.Font(FONT_PATH, 60)
-        self.small_font = pygame.font.Font(FONT_PATH, 30)
+        self.font = pygame.font.Font(FONT_PATH, px(50))
+        self.result_font = pygame.font.Font(FONT_PATH, px(60))
+        self.small_font = pygame.font.Font(FONT_PATH, px(30))
 
         # Overlay for darkening the background
-        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.overlay = pygame.Surface(screen.get_size())
         self.overlay.fill((0, 0, 0))
         self.overlay.set_alpha(180)  # Set transparency (0-255)
 
         # Load coin images
-        self.heads_img = pygame.image.load(os.path.join(script_dir, "assets", "images", "coin", "heads.png"))
-        self.tails_img = pygame.image.load(os.path.join(script_dir, "assets", "images", "coin", "tails.png"))
+        self.heads_img = AssetManager().load_image(os.path.join(script_dir, "assets", "images", "coin", "heads.png"))
+        self.tails_img = AssetManager().load_image(os.path.join(script_dir, "assets", "images", "coin", "tails.png"))
 
         # Scale coin images
         scale_factor = 0.5
-        self.heads_img = pygame.transform.scale(self.heads_img,(int(self.heads_img.get_width() * scale_factor),int(self.heads_img.get_height() * scale_factor)))
-        self.tails_img = pygame.transform.scale(self.tails_img,(int(self.tails_img.get_width() * scale_factor),int(self.tails_img.get_height() * scale_factor)))
+        self.heads_img = pygame.transform.scale(self.heads_img,(px(self.heads_img.get_width() * scale_factor),px(self.heads_img.get_height() * scale_factor)))
+        self.tails_img = pygame.transform.scale(self.tails_img,(px(self.tails_img.get_width() * scale_factor),px(self.tails_img.get_height() * scale_factor)))
 
         # Load coin flip sound
         self.coin_flip_sound = pygame.mixer.Sound(os.path.join(script_dir, "assets", "audio", "sfx", "coin_flip.mp3"))
 
         # Button areas
-        self.heads_button = pygame.Rect(SCREEN_WIDTH // 4 - 100, SCREEN_HEIGHT // 2 + 100, 275, 80)
-        self.tails_button = pygame.Rect(3 * SCREEN_WIDTH // 4 - 100, SCREEN_HEIGHT // 2 + 100, 275, 80)
+        self.heads_button = pygame.Rect(px(SCREEN_WIDTH // 4 - 100), px(SCREEN_HEIGHT // 2 + 100), px(275), px(80))
+        self.tails_button = pygame.Rect(px(3 * SCREEN_WIDTH // 4 - 100), px(SCREEN_HEIGHT // 2 + 100), px(275), px(80))
 
         # State variables
         self.player1_choice = None
@@ -53,7 +56,7 @@ class CoinToss:
     def handle_events(self, event):
         """Handle user input during coin toss."""
         if event.type == pygame.MOUSEBUTTONDOWN and not self.animation_running and self.player1_choice is None:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = DisplayManager().get_mouse_pos()
 
             # Check if heads button was clicked
             if self.heads_button.collidepoint(mouse_pos):
@@ -71,9 +74,9 @@ class CoinToss:
             self.coin_flip_sound.play()
 
         self.animation_running = True
-        self.animation_start_time = time.time()
+        self.animation_start_time = GameClock().now()
         self.flip_count = 0
-        self.last_flip_time = time.time()
+        self.last_flip_time = GameClock().now()
 
         # Determine the actual result
         self.toss_result = random.choice(["heads", "tails"])
@@ -81,7 +84,7 @@ class CoinToss:
     def update(self):
         """Update the coin toss animation."""
         if self.animation_running:
-            current_time = time.time()
+            current_time = GameClock().now()
 
             # Check if we should flip the coin
             if current_time - self.last_flip_time > self.flip_delay:
@@ -121,7 +124,7 @@ class CoinToss:
 
         # Draw title
         title_text = self.font.render("Coin Toss", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        title_rect = title_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(100)))
         self.screen.blit(title_text, title_rect)
 
         # Draw instruction
@@ -129,25 +132,25 @@ class CoinToss:
             instruction_text = self.font.render("Player 1: Choose Heads or Tails", True, (255, 255, 0))
         else:
             instruction_text = self.font.render(f"Player 1 chose {self.player1_choice.upper()}", True, (255, 255, 0))
-        instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, 170))
+        instruction_rect = instruction_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(170)))
         self.screen.blit(instruction_text, instruction_rect)
 
         # Draw coin
-        coin_rect = self.current_coin_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        coin_rect = self.current_coin_img.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
         self.screen.blit(self.current_coin_img, coin_rect)
 
         # Draw buttons if choice not yet made
         if not self.player1_choice:
             # Heads button
             pygame.draw.rect(self.screen, (50, 50, 200), self.heads_button)
-            pygame.draw.rect(self.screen, (255, 255, 255), self.heads_button, 2)
+            pygame.draw.rect(self.screen, (255, 255, 255), self.heads_button, px(2))
             heads_text = self.font.render("HEADS", True, (255, 255, 255))
             heads_text_rect = heads_text.get_rect(center=self.heads_button.center)
             self.screen.blit(heads_text, heads_text_rect)
 
             # Tails button
             pygame.draw.rect(self.screen, (200, 50, 50), self.tails_button)
-            pygame.draw.rect(self.screen, (255, 255, 255), self.tails_button, 2)
+            pygame.draw.rect(self.screen, (255, 255, 255), self.tails_button, px(2))
             tails_text = self.font.render("TAILS", True, (255, 255, 255))
             tails_text_rect = tails_text.get_rect(center=self.tails_button.center)
             self.screen.blit(tails_text, tails_text_rect)
@@ -155,26 +158,27 @@ class CoinToss:
         # Draw result text if toss is complete
         if self.toss_complete:
             result_text = self.result_font.render(f"{self.toss_result.upper()}!", True, (255, 215, 0))
-            result_rect = result_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
+            result_rect = result_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 + 150)))
             self.screen.blit(result_text, result_rect)
 
             # Show who goes first
             first_player_text = self.font.render(f"Player {self.first_player} goes first!", True, (0, 255, 0))
-            first_player_rect = first_player_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 220))
+            first_player_rect = first_player_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 + 220)))
             self.screen.blit(first_player_text, first_player_rect)
 
             # Show "Press any key to continue" message
             continue_text = self.small_font.render("Press any key to continue...", True, (200, 200, 200))
-            continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
+            continue_rect = continue_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT - 50)))
             self.screen.blit(continue_text, continue_rect)
 
     def run(self):
         """Run the coin toss and return the player who goes first."""
-        clock = pygame.time.Clock()
+        frame_governor = FrameGovernor()
         running = True
 
         while running:
-            for event in pygame.event.get():
+            # Once the result is shown the screen only waits for a key
+            for event in frame_governor.get_events(not self.toss_complete):
                 if event.type == pygame.QUIT:
                     return None
 
@@ -185,7 +189,7 @@ class CoinToss:
 
             self.update()
             self.draw()
-            pygame.display.flip()
-            clock.tick(60)
+            DisplayManager().present()
+            frame_governor.tick(not self.toss_complete)
 
         return self.first_player
\ No newline at end of file
@@ -5,6 +5,8 @@ import datetime
 from managers.custom_manager import CustomManager
 from .custom_ui import CustomUI
 from .custom_battle import CustomBattle
+from managers.asset_manager import get_scene_manifest
+from effects.transition import Transition
 
 
 class CustomMode:
@@ -157,13 +159,17 @@ class CustomMode:
         # Hide custom mode UI
         self.visible = False
 
-        # Create and run the battle
-        custom_battle = CustomBattle(
-            self.screen,
-            self.script_dir,
-            question_set_name,
-            self.audio_manager,
-            self.game_instance
+        # Create the battle while the question sets fade out, then run it
+        custom_battle = Transition(self.screen).run(
+            lambda: CustomBattle(
+                self.screen,
+                self.script_dir,
+                question_set_name,
+                self.audio_manager,
+                self.game_instance
+            ),
+            get_scene_manifest(self.script_dir, "battle"),
+            draw_incoming=lambda battle: battle.draw() if battle.running else None
         )
 
         result = custom_battle.run()
@@ -1,24 +1,44 @@
 import pygame
-import time
 import os
 import random
 from characters.player import Player
 from managers.custom_manager import CustomManager
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.display_manager import DisplayManager, px
+from managers.frame_governor import FrameGovernor
+from managers.fixed_timestep import FixedTimestep
+from managers.game_clock import GameClock
+from managers.ui_router import UIRouter
 from .pause import Pause
 from characters.enemy import MiniBoss, Boss
+from .battle_animation import BattleAnimator
+from ui.glyph_atlas import get_atlas
+from ui.text_layout import TextCache, fit_suffix
+from effects.particles import ParticleSystem
+from effects.backgrounds import get_background
+from managers.performance_manager import PerformanceManager
+
+BATTLE_END_SECONDS = 2  # How long the result stays on screen before the battle closes
+TIME_UP_SECONDS = 1.5  # How long "Time's up" stays on screen before the next question
 
 
 class CustomBattle:
     def __init__(self, screen, script_dir, question_set_name, audio_manager=None, game_instance=None):
         self.screen = screen
+        get_background(screen.get_size(), "custom")  # Generated now, while the scene transition covers the screen
         self.script_dir = script_dir
         self.question_set_name = question_set_name
         self.running = True
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(FONT_PATH, 50)
-        self.small_font = pygame.font.Font(FONT_PATH, 30)
-        self.input_font = pygame.font.Font(FONT_PATH, 35)
+        self.frame_governor = FrameGovernor()
+        self.timestep = FixedTimestep()
+        self.game_clock = GameClock()
+        self.font = pygame.font.Font(FONT_PATH, px(50))
+        self.input_font = pygame.font.Font(FONT_PATH, px(35))
+        self.timer_atlas = get_atlas(50, (255, 255, 255))  # The countdown changes every second
+        self.input_text_cache = TextCache(self.input_font, (255, 255, 255))  # The answer only re-renders when typed
+        self.question_text_cache = TextCache(self.font, (255, 255, 255), max_entries=2)
+        self.message_cache = TextCache(self.font, (255, 255, 0))
+        self.counter_atlas = get_atlas(30, (255, 255, 255))  # Question counter
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
@@ -46,14 +66,21 @@ class CustomBattle:
         if random.random() < 1:  # 80% chance of mini boss
             self.enemy = MiniBoss(script_dir, level=1, hp=enemy_hp, damage=1)
 
+        # Attack lunges, hit flashes, screen shake, HP bar easing and hit bursts
+        self.particles = ParticleSystem(PerformanceManager().get("particles"))
+        self.animator = BattleAnimator(self.particles)
+        self.animator.add_fighter(self.player, facing=1)
+        self.animator.add_fighter(self.enemy, facing=-1)
+
         # Battle state
         self.current_question_index = 0
         self.current_question = None
         self.user_answer = ""
-        self.timer_start = 0
         self.time_left = 60  # 60 seconds per question
         self.battle_message = ""
         self.message_timer = 0
+        self.end_time = None  # Game clock time at which a decided battle closes
+        self.next_question_time = None  # Game clock time at which a timed-out question moves on
         self.input_active = True
 
         # Save the current music path for restoration later
@@ -73,10 +100,10 @@ class CustomBattle:
 
         # Initialize text input field
         self.input_rect = pygame.Rect(
-            SCREEN_WIDTH // 2 - 300,  # x position
-            SCREEN_HEIGHT - 150,  # y position
-            600,  # width
-            60  # height
+            px(SCREEN_WIDTH // 2 - 300),  # x position
+            px(SCREEN_HEIGHT - 150),  # y position
+            px(600),  # width
+            px(60)  # height
         )
         self.color_active = pygame.Color('lightskyblue3')
         self.color_passive = pygame.Color('gray15')
@@ -131,7 +158,6 @@ class CustomBattle:
         """Loads the next question from the custom question set"""
         if self.current_question_index < len(self.questions):
             self.current_question = self.questions[self.current_question_index]
-            self.timer_start = time.time()
             self.time_left = 60  # Reset timer
             self.user_answer = ""  # Clear previous answer
             self.input_active = True  # Enable input for new question
@@ -141,13 +167,11 @@ class CustomBattle:
             self.battle_message = "Victory! You answered all questions!"
             print("All questions completed")
             self.input_active = False
-            # Wait a bit before ending the battle
-            pygame.time.delay(2000)
-            self.running = False
+            self.end_battle(victory=True)
 
     def handle_events(self):
         """Handle user input during battle"""
-        for event in pygame.event.get():
+        for event in self.frame_governor.get_events(not self.pause_menu.is_paused()):
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -160,7 +184,8 @@ class CustomBattle:
                     else:
                         self.color = self.color_passive
 
-                elif event.type == pygame.KEYDOWN and self.input_active:
+                elif (event.type == pygame.KEYDOWN and self.input_active and self.end_time is None
+                      and self.next_question_time is None):  # A timed-out question takes no more answers
                     # Handle text input
                     if event.key == pygame.K_RETURN:
                         # Submit answer when Enter is pressed
@@ -187,13 +212,12 @@ class CustomBattle:
         if user_answer == correct_answer:
             # Correct answer - enemy takes damage
             self.enemy.take_damage(1)
+            self.animator.attack(self.player, self.enemy, correct=True)
             self.battle_message = "Correct! Enemy takes damage!"
 
             if self.enemy.hp <= 0:
                 self.battle_message = "Victory! You defeated the enemy!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=True)
             else:
                 # Move to next question
                 self.current_question_index += 1
@@ -201,63 +225,64 @@ class CustomBattle:
         else:
             # Wrong answer - player takes damage
             self.player.take_damage(1)  # Always 1 damage for simplicity
+            self.animator.attack(self.enemy, self.player, correct=False)
             self.battle_message = f"Wrong! You take 1 damage!"
 
             if self.player.hp <= 0:
                 self.battle_message = "Defeat! You have been defeated!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=False)
             else:
                 # Move to next question
                 self.current_question_index += 1
                 self.load_next_question()
 
         # Set message timer
-        self.message_timer = time.time()
-
-    def update_timer(self):
-        """Updates the time left to answer the question"""
-        # If paused, don't update anything
-        if self.pause_menu.is_paused():
+        self.message_timer = self.game_clock.now()
+
+    def end_battle(self, victory):
+        """Let the last hit play out for a moment before the battle loop ends."""
+        if victory:
+            self.particles.confetti()
+        self.end_time = self.game_clock.now() + BATTLE_END_SECONDS
+
+    def update_timer(self, step):
+        """Counts the time left to answer the question down by one simulation step"""
+        # If paused or already decided, don't update anything
+        if self.pause_menu.is_paused() or self.end_time is not None:
             return
 
-        # Adjust timer for any time spent paused
-        paused_time = self.pause_menu.get_total_paused_time()
-        if paused_time > 0:
-            self.timer_start += paused_time  # Move the start time forward by paused duration
+        # After a timeout the enemy's attack plays out before the next question
+        if self.next_question_time is not None:
+            if self.game_clock.now() >= self.next_question_time:
+                self.next_question_time = None
+                self.current_question_index += 1
+                self.load_next_question()
+            return
 
         # Calculate remaining time
-        elapsed = time.time() - self.timer_start
-        self.time_left = max(0, 60 - elapsed)  # 60 seconds per question
+        self.time_left = max(0, self.time_left - step)
 
         # If time runs out, treat as wrong answer
         if self.time_left <= 0 and self.running and self.input_active:
             self.battle_message = "Time's up! You take damage!"
             self.player.take_damage(1)
+            self.animator.attack(self.enemy, self.player, correct=False)
             self.input_active = False  # Disable input when time's up
 
             if self.player.hp <= 0:
                 self.battle_message = "Defeat! You have been defeated!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=False)
             else:
-                # Move to next question after delay
-                pygame.time.delay(1500)  # Show time's up message
-                self.current_question_index += 1
-                self.load_next_question()
+                # Move to next question once the time's up message has been shown
+                self.next_question_time = self.game_clock.now() + TIME_UP_SECONDS
 
             # Set message timer
-            self.message_timer = time.time()
+            self.message_timer = self.game_clock.now()
 
     def draw_background(self, screen):
         """Draw a simple background for the battle"""
-        # Fill screen with a gradient background
-        for i in range(SCREEN_HEIGHT):
-            color_value = 50 + (i / SCREEN_HEIGHT * 50)
-            pygame.draw.line(screen, (0, int(color_value), int(color_value * 2)),
-                             (0, i), (SCREEN_WIDTH, i))
+        # Gradient generated once and shared by every custom battle
+        screen.blit(get_background(screen.get_size(), "custom"), (0, 0))
 
     def draw(self):
         """Draws the battle screen"""
@@ -267,64 +292,55 @@ class CustomBattle:
         # Draw player and enemy
         self.player.draw(self.screen)
         self.enemy.draw(self.screen)
+        self.animator.apply_shake(self.screen)
 
         # Draw timer
-        timer_text = self.font.render(f"Time: {int(self.time_left)}", True, (255, 255, 255))
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        pygame.draw.rect(self.screen, (0, 0, 0),
-                         (timer_rect.x - 10, timer_rect.y - 10,
-                          timer_rect.width + 20, timer_rect.height + 20))
-        self.screen.blit(timer_text, timer_rect)
+        timer_text = f"Time: {int(self.time_left)}"
+        timer_rect = self.timer_atlas.get_rect(timer_text, center=(px(SCREEN_WIDTH // 2), px(50)))
+        pygame.draw.rect(self.screen, (0, 0, 0), timer_rect.inflate(px(20), px(20)))
+        self.timer_atlas.draw(self.screen, timer_text, timer_rect.topleft)
 
         # Draw question box
-        question_box = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 200)
+        question_box = pygame.Rect(px(50), px(SCREEN_HEIGHT - 300), px(SCREEN_WIDTH - 100), px(200))
         pygame.draw.rect(self.screen, (0, 0, 0, 200), question_box)
-        pygame.draw.rect(self.screen, (255, 255, 255), question_box, 3)
+        pygame.draw.rect(self.screen, (255, 255, 255), question_box, px(3))
 
         # Draw question text
         if self.current_question:
-            question_text = self.font.render(self.current_question["question"], True, (255, 255, 255))
-            question_rect = question_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250))
+            question_text = self.question_text_cache.render(self.current_question["question"])
+            question_rect = question_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT - 250)))
             self.screen.blit(question_text, question_rect)
 
         # Draw input field if not paused
         if not self.pause_menu.is_paused() and self.input_active:
             pygame.draw.rect(self.screen, self.color, self.input_rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), self.input_rect, 2)
+            pygame.draw.rect(self.screen, (255, 255, 255), self.input_rect, px(2))
 
-            # Render input text
-            input_surface = self.input_font.render(self.user_answer, True, (255, 255, 255))
-
-            # Ensure input text fits within input box by limiting width
-            max_width = self.input_rect.width - 20
-            if input_surface.get_width() > max_width:
-                visible_text = self.user_answer
-                while self.input_font.render(visible_text, True, (255, 255, 255)).get_width() > max_width:
-                    visible_text = visible_text[1:]  # Remove first character
-                input_surface = self.input_font.render(visible_text, True, (255, 255, 255))
+            # Show the end of the answer that fits in the input box, found by binary search
+            max_width = self.input_rect.width - px(20)
+            visible_text = self.user_answer[fit_suffix(self.input_font, self.user_answer, max_width):]
+            input_surface = self.input_text_cache.render(visible_text)
 
             # Position text in input box
-            text_pos = (self.input_rect.x + 10,
+            text_pos = (self.input_rect.x + px(10),
                         self.input_rect.y + (self.input_rect.height - input_surface.get_height()) // 2)
             self.screen.blit(input_surface, text_pos)
 
         # Draw battle message
-        if self.battle_message and time.time() - self.message_timer < 2:
-            message_text = self.font.render(self.battle_message, True, (255, 255, 0))
-            message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            pygame.draw.rect(self.screen, (0, 0, 0),
-                             (message_rect.x - 10, message_rect.y - 10,
-                              message_rect.width + 20, message_rect.height + 20))
+        if self.battle_message and self.game_clock.now() - self.message_timer < 2:
+            message_text = self.message_cache.render(self.battle_message)
+            message_rect = message_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
+            pygame.draw.rect(self.screen, (0, 0, 0), message_rect.inflate(px(20), px(20)))
             self.screen.blit(message_text, message_rect)
 
         # Draw question counter
         if self.questions:
-            counter_text = self.small_font.render(
-                f"Question {self.current_question_index + 1}/{len(self.questions)}",
-                True, (255, 255, 255)
-            )
-            counter_rect = counter_text.get_rect(topright=(SCREEN_WIDTH - 100, 20))
-            self.screen.blit(counter_text, counter_rect)
+            counter_text = f"Question {self.current_question_index + 1}/{len(self.questions)}"
+            counter_rect = self.counter_atlas.get_rect(counter_text, topright=(px(SCREEN_WIDTH - 100), px(20)))
+            self.counter_atlas.draw(self.screen, counter_text, counter_rect.topleft)
+
+        # Particles over the scene and the UI
+        self.particles.draw(self.screen)
 
         # Draw pause menu (button and overlay if paused)
         self.pause_menu.draw()
@@ -336,21 +352,32 @@ class CustomBattle:
             print(f"Not enough questions to start battle: {len(self.questions) if self.questions else 0}/10")
             return False
 
+        self.game_clock.tick()  # Time before the battle loop does not count
         while self.running:
             # Handle events
             self.handle_events()
 
-            # Update timer
-            self.update_timer()
+            # Advance the timer in fixed steps; the game clock stands still while paused
+            for _ in range(self.timestep.advance(self.game_clock.tick())):
+                self.update_timer(self.timestep.step)
+                self.animator.step()
+
+            # The result stays on screen, still animating, until the end time
+            if self.end_time is not None and self.game_clock.now() >= self.end_time:
+                self.running = False
 
             # Draw battle
             self.draw()
 
             # Update display
-            pygame.display.flip()
+            DisplayManager().present()
+
+            # Cap the frame rate; a paused battle drops to the idle rate
+            self.frame_governor.tick(not self.pause_menu.is_paused() or self.animator.is_animating())
 
-            # Cap the frame rate
-            self.clock.tick(FPS)
+        # Leaving from the pause menu must not keep the clock stopped
+        self.game_clock.set_paused(False)
+        UIRouter().unregister_scope(self.pause_menu)
 
         # Stop battle music and restore original music when the battle ends
         self.stop_battle_music()
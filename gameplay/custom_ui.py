@@ -4,6 +4,12 @@ from ui.button import Button
 from ui.back_button import BackButton
 from auth.input_box import InputBox
 from settings import FONT_PATH, FONT_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH
+from managers.surface_pool import SurfacePool
+from managers.display_manager import DisplayManager, px
+from managers.ui_router import UIRouter
+from managers.draw_list import DrawList, BOX_LAYER, BORDER_LAYER, CONTENT_LAYER
+from ui.text_layout import TextCache
+from ui.glyph_atlas import get_atlas
 
 
 class CustomUI:
@@ -12,22 +18,26 @@ class CustomUI:
         self.screen = screen
         self.audio_manager = audio_manager
         self.visible = False
+        self.routed_state = None  # (creating_question, slot selected) the router last got buttons for
         self.scale = scale
         self.script_dir = script_dir
 
         # Font for slots
-        self.font = pygame.font.Font(FONT_PATH, FONT_SIZE)
-        self.small_font = pygame.font.Font(FONT_PATH, FONT_SIZE // 2)
+        self.font = pygame.font.Font(FONT_PATH, px(FONT_SIZE))
+        self.small_font = pygame.font.Font(FONT_PATH, px(FONT_SIZE // 2))
 
         # Save slot config
-        self.slot_width = 800
-        self.slot_height = 80
-        self.slot_spacing = 10
-        self.border_thickness = 2
+        self.slot_width = px(800)
+        self.slot_height = px(80)
+        self.slot_spacing = px(10)
+        self.border_thickness = px(2)
         self.slot_border_color = (127, 127, 127)  # Gray border color
         self.slot_background_color = (50, 50, 50)  # Dark background for slots
         self.selected_slot_color = (60, 60, 60)  # Slightly lighter when selected
         self.text_color = (255, 255, 255)  # White text
+        self.slot_text_cache = TextCache(self.font, self.text_color)  # Slot names, rendered once
+        self.count_atlas = get_atlas(FONT_SIZE // 2, self.text_color)  # Question counter
+        self.draw_list = DrawList()  # Slot rows of the frame being drawn
 
         # Area border color (changed to transparent gray)
         self.area_background_color = (80, 80, 80, 160)  # Gray with transparency
@@ -35,8 +45,8 @@ class CustomUI:
         # Scrolling functionality
         self.scroll_y = 0
         self.max_scroll = 0
-        self.scroll_speed = 20
-        self.visible_area = pygame.Rect(560, 200, self.slot_width, 600)
+        self.scroll_speed = px(20)
+        self.visible_area = pygame.Rect(px(560), px(200), self.slot_width, px(600))
 
         # Status message for validation (similar to login screen)
         self.status_message = ""
@@ -54,7 +64,7 @@ class CustomUI:
         create_btn_hover_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom",
                                              "createquestion_btn_hover.png")
 
-        self.create_button = Button(960, 875, create_btn_path, create_btn_hover_path, None,
+        self.create_button = Button(px(960), px(875), create_btn_path, create_btn_hover_path, None,
                                     lambda: self.custom_mode.create_question(), scale=0.5,
                                     audio_manager=self.audio_manager)
 
@@ -62,23 +72,23 @@ class CustomUI:
         start_battle_btn_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "enter_btn_img.png")
         start_battle_btn_hover_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "enter_btn_hover.png")
 
-        self.start_battle_button = Button(SCREEN_WIDTH / 2, 975, start_battle_btn_path, start_battle_btn_hover_path, None,
+        self.start_battle_button = Button(px(SCREEN_WIDTH / 2), px(975), start_battle_btn_path, start_battle_btn_hover_path, None,
                                           lambda: self.handle_start_battle(), scale=0.5,
                                           audio_manager=self.audio_manager)
 
         # Back Button
-        self.back_button = BackButton(self.screen, self.script_dir, lambda: self.custom_mode.go_back(), audio_manager=self.audio_manager, position=(100, 100), scale=0.25)
+        self.back_button = BackButton(self.screen, self.script_dir, lambda: self.custom_mode.go_back(), audio_manager=self.audio_manager, position=(px(100), px(100)), scale=0.25)
 
         # Load input border
         input_border_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "input_border.png")
         self.input_border = pygame.image.load(input_border_path).convert_alpha()
-        self.input_border = pygame.transform.scale(self.input_border, (int(self.input_border.get_width() * 0.7), int(self.input_border.get_height() * 0.7)))
-        self.input_border_rect = self.input_border.get_rect(center=(960, 500))
+        self.input_border = pygame.transform.scale(self.input_border, (px(self.input_border.get_width() * 0.7), px(self.input_border.get_height() * 0.7)))
+        self.input_border_rect = self.input_border.get_rect(center=(px(960), px(500)))
 
         # Input boxes for question and answer with updated parameters
-        self.question_input = InputBox(310, 290, 1300, 260, placeholder="Enter your question here...",
+        self.question_input = InputBox(px(310), px(290), px(1300), px(260), placeholder="Enter your question here...",
                                        align_top_left=True, multiline=True)
-        self.answer_input = InputBox(310, 700, 1300, 120, placeholder="Enter the answer here...", align_top_left=True)
+        self.answer_input = InputBox(px(310), px(700), px(1300), px(120), placeholder="Enter the answer here...", align_top_left=True)
 
         # Next and Done buttons
         next_btn_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "next_btn_img.png")
@@ -86,9 +96,9 @@ class CustomUI:
         done_btn_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "done_btn_img.png")
         done_btn_hover_path = os.path.join(self.script_dir, "assets", "images", "buttons", "game modes", "custom", "done_btn_hover.png")
 
-        self.next_button = Button(700, 950, next_btn_path, next_btn_hover_path, None,
+        self.next_button = Button(px(700), px(950), next_btn_path, next_btn_hover_path, None,
                                   lambda: self.custom_mode.next_question(), scale=0.5, audio_manager=self.audio_manager)
-        self.done_button = Button(1200, 950, done_btn_path, done_btn_hover_path, None,
+        self.done_button = Button(px(1200), px(950), done_btn_path, done_btn_hover_path, None,
                                   lambda: self.custom_mode.done_creating(), scale=0.5, audio_manager=self.audio_manager)
 
         # Load X button for removing slots
@@ -107,7 +117,7 @@ class CustomUI:
             self.x_button_hover_img = self.create_x_button((255, 100, 100))
 
         # Scale the X button images
-        button_size = 30
+        button_size = px(30)
         self.x_button_img = pygame.transform.scale(self.x_button_img, (button_size, button_size))
         self.x_button_hover_img = pygame.transform.scale(self.x_button_hover_img, (button_size, button_size))
 
@@ -136,35 +146,43 @@ class CustomUI:
         visible_height = self.visible_area.height
         self.max_scroll = max(0, total_height - visible_height)
 
+    def route_buttons(self, creating_question, selected_slot):
+        """Register the buttons of the current view with the UI router when the view changed."""
+        state = (creating_question, selected_slot is not None)
+        if state == self.routed_state:
+            return
+        self.routed_state = state
+        if creating_question:
+            buttons = [self.back_button.button, self.next_button, self.done_button]
+        elif selected_slot is not None:
+            buttons = [self.back_button.button, self.create_button, self.start_battle_button]
+        else:
+            buttons = [self.back_button.button, self.create_button]
+        UIRouter().set_scope(self, buttons)
+
     def update(self, event, creating_question, save_slots, selected_slot):
         """Update UI elements and handle events."""
         if not self.visible:
             return None
 
-        self.back_button.update(event)
+        # Only the button under a click gets it
+        self.route_buttons(creating_question, selected_slot)
+        clicked = UIRouter().dispatch(event, scope=self)
 
         result = None
 
         if creating_question:
-            # Update input boxes and buttons in question creation mode
+            # Update input boxes in question creation mode
             self.question_input.handle_event(event)
             self.answer_input.handle_event(event)
-            self.next_button.update(event)
-            self.done_button.update(event)
 
             # Clear status message after 3 seconds
             if self.status_message and pygame.time.get_ticks() - self.status_timer > 3000:
                 self.status_message = ""
         else:
-            # Update regular slot view
-            self.create_button.update(event)
-
-            # Update start battle button if a slot is selected
-            if selected_slot is not None:
-                self.start_battle_button.update(event)
-                if self.start_battle_button.clicked:
-                    result = {"action": "start_battle"}
-                    self.start_battle_button.clicked = False
+            # The start battle button is only registered while a slot is selected
+            if clicked is self.start_battle_button:
+                result = {"action": "start_battle"}
 
             # Handle mouse wheel scrolling
             if event.type == pygame.MOUSEWHEEL:
@@ -174,7 +192,7 @@ class CustomUI:
 
             # Handle clicks on slots and X buttons
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+                mouse_x, mouse_y = DisplayManager().get_mouse_pos()
 
                 # Check if click is within visible area
                 if self.visible_area.collidepoint(mouse_x, mouse_y):
@@ -188,9 +206,9 @@ class CustomUI:
                                 self.slot_height + self.slot_spacing) - self.scroll_y
                         slot_rect = pygame.Rect(self.visible_area.left, slot_y, self.slot_width, self.slot_height)
                         x_button_rect = pygame.Rect(
-                            slot_rect.right - 40,  # Position 40px from right edge
-                            slot_rect.centery - 15,  # Centered vertically
-                            30, 30  # Size of the button
+                            slot_rect.right - px(40),  # Position 40px from right edge
+                            slot_rect.centery - px(15),  # Centered vertically
+                            px(30), px(30)  # Size of the button
                         )
 
                         if x_button_rect.collidepoint(mouse_x, mouse_y):
@@ -212,6 +230,8 @@ class CustomUI:
         if not self.visible:
             return
 
+        self.route_buttons(creating_question, selected_slot)
+
         # Draw back button
         self.back_button.draw()
 
@@ -232,20 +252,18 @@ class CustomUI:
 
             # Draw question count
             count_text = f"Questions added: {len(current_questions)}"
-            count_surface = self.small_font.render(count_text, True, self.text_color)
-            self.screen.blit(count_surface, (self.question_input.rect.x, 260))
+            self.count_atlas.draw(self.screen, count_text, (self.question_input.rect.x, px(260)))
 
             # Draw status message if any
             if self.status_message:
                 status_surf = self.font.render(self.status_message, True, self.status_color)
-                status_x = 960 - status_surf.get_width() // 2  # Center horizontally
-                status_y = 850  # Position above the buttons
+                status_x = px(960) - status_surf.get_width() // 2  # Center horizontally
+                status_y = px(850)  # Position above the buttons
                 self.screen.blit(status_surf, (status_x, status_y))
         else:
             # Draw slots view
             # Create transparent surface for the gray background area
-            bg_surface = pygame.Surface((self.visible_area.width, self.visible_area.height), pygame.SRCALPHA)
-            bg_surface.fill(self.area_background_color)  # This will use the alpha value
+            bg_surface = SurfacePool().get_overlay(self.visible_area.size, self.area_background_color)
             self.screen.blit(bg_surface, self.visible_area.topleft)
 
             # Draw the border separately
@@ -257,9 +275,10 @@ class CustomUI:
 
             # Reset hovered X button state
             self.hovered_x_button = None
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = DisplayManager().get_mouse_pos()
 
-            # Draw all slots
+            # Draw all slots: backgrounds, then borders, then text and X buttons
+            slots = self.draw_list
             for i, slot_text in enumerate(save_slots):
                 # Calculate position with scrolling offset
                 slot_y = self.visible_area.top + i * (self.slot_height + self.slot_spacing) - self.scroll_y
@@ -271,19 +290,19 @@ class CustomUI:
 
                 # Draw slot background
                 bg_color = self.selected_slot_color if i == selected_slot else self.slot_background_color
-                pygame.draw.rect(self.screen, bg_color, slot_rect)
-                pygame.draw.rect(self.screen, self.slot_border_color, slot_rect, self.border_thickness)
+                slots.fill(bg_color, slot_rect, layer=BOX_LAYER)
+                slots.rect(self.slot_border_color, slot_rect, self.border_thickness, layer=BORDER_LAYER)
 
                 # Draw slot text
-                text_surface = self.font.render(slot_text, True, self.text_color)
-                text_rect = text_surface.get_rect(midleft=(slot_rect.left + 20, slot_rect.centery))
-                self.screen.blit(text_surface, text_rect)
+                text_surface = self.slot_text_cache.render(slot_text)
+                text_rect = text_surface.get_rect(midleft=(slot_rect.left + px(20), slot_rect.centery))
+                slots.blit(text_surface, text_rect, layer=CONTENT_LAYER)
 
                 # Add X button for removing slot
                 x_button_rect = pygame.Rect(
-                    slot_rect.right - 40,  # Position 40px from right edge
-                    slot_rect.centery - 15,  # Centered vertically
-                    30, 30  # Size of the button
+                    slot_rect.right - px(40),  # Position 40px from right edge
+                    slot_rect.centery - px(15),  # Centered vertically
+                    px(30), px(30)  # Size of the button
                 )
 
                 # Check if mouse is hovering over this X button
@@ -294,18 +313,21 @@ class CustomUI:
                     x_img = self.x_button_img
 
                 # Draw the X button
-                self.screen.blit(x_img, x_button_rect)
+                slots.blit(x_img, x_button_rect, layer=CONTENT_LAYER)
+
+            # All rows go out in a few batched calls while the clip is still set
+            slots.flush(self.screen)
 
             # Reset clipping rect
             self.screen.set_clip(original_clip)
 
             # Draw scrollbar if needed
             if self.max_scroll > 0:
-                scrollbar_height = max(30, self.visible_area.height * (
+                scrollbar_height = max(px(30), self.visible_area.height * (
                         self.visible_area.height / (self.max_scroll + self.visible_area.height)))
                 scrollbar_y = self.visible_area.top + (self.scroll_y / self.max_scroll) * (
                         self.visible_area.height - scrollbar_height)
-                scrollbar_rect = pygame.Rect(self.visible_area.right + 10, scrollbar_y, 10, scrollbar_height)
+                scrollbar_rect = pygame.Rect(self.visible_area.right + px(10), scrollbar_y, px(10), scrollbar_height)
                 pygame.draw.rect(self.screen, self.slot_border_color, scrollbar_rect)
 
             # Draw create button
@@ -318,8 +340,8 @@ class CustomUI:
             # Draw status message if any
             if self.status_message:
                 status_surf = self.font.render(self.status_message, True, self.status_color)
-                status_x = 960 - status_surf.get_width() // 2  # Center horizontally
-                status_y = 850  # Position above the create button
+                status_x = px(960) - status_surf.get_width() // 2  # Center horizontally
+                status_y = px(850)  # Position above the create button
                 self.screen.blit(status_surf, (status_x, status_y))
 
     def set_status(self, message, color=pygame.Color('white')):
@@ -347,4 +369,6 @@ class CustomUI:
 
     def hide(self):
         """Hide the UI"""
-        self.visible = False
\ No newline at end of file
+        self.visible = False
+        self.routed_state = None
+        UIRouter().unregister_scope(self)
\ No newline at end of file
@@ -0,0 +1,62 @@
+import timeit
+import tracemalloc
+import pygame
+from gameplay.questions import Question, MathQuestion, AnswerButton
+from managers.level_manager import MapLevel
+from maps.collision_compiler import read_source, SEGMENT_FIELDS
+
+
+def benchmark_data_model(count=10000, reads=200000):
+    """Compare memory and attribute reads of the slotted classes against the dicts they replaced."""
+
+    def measure(name, build, read):
+        tracemalloc.start()
+        items = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        item = items[0]
+        read_ms = timeit.timeit(lambda: read(item), number=reads) * 1000
+        print(f"Data Model: {name:<24} {memory / len(items):7.1f} bytes each, {read_ms:6.1f} ms for {reads} reads")
+        return memory
+
+    rect = pygame.Rect(0, 0, 200, 60)
+    img = pygame.Surface((40, 40))
+    results = {}
+    results["question dict"] = measure(
+        "question dict", lambda: [{name: getattr(q, name) for name in Question.__slots__ + MathQuestion.__slots__}
+                                  for q in (MathQuestion() for _ in range(count))],
+        lambda q: q["answer"] == q["choices"][q["correct_choice"]])
+    results["question slots"] = measure(
+        "question slots", lambda: [MathQuestion() for _ in range(count)],
+        lambda q: q.answer == q.choices[q.correct_choice])
+    results["answer button dict"] = measure(
+        "answer button dict", lambda: [{"rect": rect, "value": i, "text": str(i)} for i in range(count)],
+        lambda b: (b["rect"], b["value"], b["text"]))
+    results["answer button slots"] = measure(
+        "answer button slots", lambda: [AnswerButton(rect, i) for i in range(count)],
+        lambda b: (b.rect, b.value, b.text))
+    results["level dict"] = measure(
+        "level dict", lambda: [{"id": i, "img": img, "locked_img": img, "map_x": i, "map_y": i, "width": 40,
+                                "height": 40, "interaction_radius": 75, "unlocked": True, "center_x": i + 20,
+                                "center_y": i + 20, "radius_sq": 5625} for i in range(count)],
+        lambda l: (l["unlocked"], l["center_x"], l["center_y"], l["radius_sq"]))
+    results["level slots"] = measure(
+        "level slots", lambda: [MapLevel(i, img, img, i, i, 75, True) for i in range(count)],
+        lambda l: (l.unlocked, l.center_x, l.center_y, l.radius_sq))
+
+    # Collision segments: a list of tuples against the flat float array the map loads
+    segments = read_source()[0]
+    segment_count = len(segments) // SEGMENT_FIELDS
+    tracemalloc.start()
+    tuples = [tuple(segments[i * SEGMENT_FIELDS:(i + 1) * SEGMENT_FIELDS]) for i in range(segment_count)]
+    results["segment tuples"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    results["segment array"] = segments.buffer_info()[1] * segments.itemsize
+    print(f"Data Model: {segment_count} collision segments take {results['segment tuples']} bytes as tuples, "
+          f"{results['segment array']} bytes as array('f')")
+    del tuples
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_data_model()
@@ -1,6 +1,10 @@
 import pygame
 import os
 from characters.enemy import MiniBoss
+from managers.asset_manager import AssetManager
+from managers.display_manager import DisplayManager
+
+baked_backgrounds = {}  # (path, canvas size) -> background scaled to the canvas, shared by replays
 
 
 class Level:
@@ -42,12 +46,16 @@ class Level:
         bg_path = f"{script_dir}/assets/images/battle/backgrounds/{bg_filename}"
 
         # Check if the background file exists, if not use default
-        if os.path.exists(bg_path):
-            self.background = pygame.image.load(bg_path)
-        else:
-            self.background = pygame.image.load(f"{script_dir}/assets/images/battle/backgrounds/level1_bg.png")
+        if not os.path.exists(bg_path):
+            bg_path = f"{script_dir}/assets/images/battle/backgrounds/level1_bg.png"
 
-        self.background = pygame.transform.scale(self.background, (1920, 1080))
+        # Bake the background at the canvas size once, so drawing it is a plain copy
+        size = DisplayManager().render_size
+        key = (os.path.normpath(bg_path), size)
+        self.background = baked_backgrounds.get(key)
+        if self.background is None:
+            background = AssetManager().load_image(bg_path, alpha=False)
+            self.background = baked_backgrounds[key] = pygame.transform.scale(background, size)
 
     def create_enemy(self):
         """Creates the enemy for this level with appropriate range"""
@@ -69,4 +77,4 @@ class Level:
 
     def draw_background(self, screen):
         """Draws the level background"""
-        screen.blit(self.background, (0, 0))
\ No newline at end of file
+        DisplayManager().draw_background(self.background)
\ No newline at end of file
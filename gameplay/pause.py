@@ -1,7 +1,12 @@
 import pygame
 import os
-import time
 from ui.button import Button
+from managers.game_clock import GameClock
+from managers.sprite_variants import SpriteVariants
+from managers.surface_pool import SurfacePool
+from managers.draw_list import DrawList
+from managers.ui_router import UIRouter
+from managers.display_manager import px
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
 
 class Pause:
@@ -11,17 +16,16 @@ class Pause:
         self.audio_manager = audio_manager
         self.paused = False
         self.scale = scale
-        self.pause_start_time = 0
-        self.total_paused_time = 0
         self.show_confirmation = False
         self.confirmation_type = None  # 'menu' only
         self.confirmation_buttons = []
+        self.draw_list = DrawList()  # Overlay, border and icons of the paused frame
 
         # Callbacks for menu actions
         self.menu_callback = menu_callback
 
         # Load fonts
-        self.font = pygame.font.Font(FONT_PATH, 50)
+        self.font = pygame.font.Font(FONT_PATH, px(50))
 
         # Load pause button images
         pause_idle_path = os.path.join(script_dir, "assets", "images", "battle", "pause", "pause", "pause_icon_img.png")
@@ -39,8 +43,8 @@ class Pause:
 
         # Create pause button
         self.pause_button = Button(
-            x=100,
-            y=100,
+            x=px(100),
+            y=px(100),
             idle_img=self.pause_idle,
             hover_img=self.pause_hover,
             action=self.toggle_pause,
@@ -51,18 +55,19 @@ class Pause:
         # Initialize pause menu icons only
         self.pause_icons = []
         self.init_pause_icons()
+        self.route_buttons()
 
     def init_pause_icons(self):
         """Initialize the pause menu icons"""
         icons = [
             {
                 "name": "menu",
-                "pos": (SCREEN_WIDTH // 2 - 125, SCREEN_HEIGHT // 2 + 40),
+                "pos": (px(SCREEN_WIDTH // 2 - 125), px(SCREEN_HEIGHT // 2 + 40)),
                 "action": self.show_menu_confirmation
             },
             {
                 "name": "resume",
-                "pos": (SCREEN_WIDTH // 2 + 125, SCREEN_HEIGHT // 2 + 40),
+                "pos": (px(SCREEN_WIDTH // 2 + 125), px(SCREEN_HEIGHT // 2 + 40)),
                 "action": self.toggle_pause
             },
         ]
@@ -118,8 +123,8 @@ class Pause:
 
         # Create buttons
         yes_button = Button(
-            x=SCREEN_WIDTH // 2 - 250,
-            y=SCREEN_HEIGHT // 2 + 150,
+            x=px(SCREEN_WIDTH // 2 - 250),
+            y=px(SCREEN_HEIGHT // 2 + 150),
             idle_img=yes_idle,
             hover_img=yes_hover,
             action=self.confirm_action,
@@ -128,8 +133,8 @@ class Pause:
         )
 
         no_button = Button(
-            x=SCREEN_WIDTH // 2 + 250,
-            y=SCREEN_HEIGHT // 2 + 150,
+            x=px(SCREEN_WIDTH // 2 + 250),
+            y=px(SCREEN_HEIGHT // 2 + 150),
             idle_img=no_idle,
             hover_img=no_hover,
             action=self.cancel_confirmation,
@@ -144,6 +149,7 @@ class Pause:
         self.show_confirmation = True
         self.confirmation_type = 'menu'
         self.init_confirmation_buttons()
+        self.route_buttons()
 
     def confirm_action(self):
         """Handle confirmation (Yes button click)"""
@@ -156,6 +162,7 @@ class Pause:
                 print("Calling menu callback")
                 self.menu_callback()  # Ensure this function is correctly defined
                 self.paused = False  # Unpause the game before returning to menu
+                GameClock().set_paused(False)
             else:
                 print("No menu callback provided.")
 
@@ -167,28 +174,25 @@ class Pause:
         self.show_confirmation = False
         self.confirmation_type = None
         self.confirmation_buttons = []
+        self.route_buttons()
 
     def load_scaled_image(self, path, scale=None):
         """Load an image and scale it. If scale is None, use self.scale"""
-        image = pygame.image.load(path).convert_alpha()
         scale_factor = scale if scale is not None else self.scale
-        if scale_factor != 1.0:
-            new_width = int(image.get_width() * scale_factor)
-            new_height = int(image.get_height() * scale_factor)
-            return pygame.transform.scale(image, (new_width, new_height))
-        return image
+        return SpriteVariants().get(path, scale_factor)  # Shared with every other pause menu
 
     def toggle_pause(self):
         """Toggle pause state and play click sound"""
         self.paused = not self.paused
+        # Every gameplay timer reads the game clock, so this one switch freezes them all
+        GameClock().set_paused(self.paused)
+        self.route_buttons()
         if self.audio_manager:
             self.audio_manager.play_sfx()
 
             if self.paused:
-                self.pause_start_time = time.time()
                 pygame.mixer.music.pause()
             else:
-                self.total_paused_time += time.time() - self.pause_start_time
                 pygame.mixer.music.unpause()
 
     def return_to_menu(self):
@@ -197,36 +201,33 @@ class Pause:
         if self.audio_manager:
             self.audio_manager.play_sfx()
 
-    def get_total_paused_time(self):
-        """Returns the total time spent paused and resets the counter"""
-        paused_time = self.total_paused_time
-        self.total_paused_time = 0
-        return paused_time
-
     def draw_pause_overlay(self):
         """Draw the pause overlay when game is paused"""
         if self.paused:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
+            # Everything here is a plain blit, so the whole menu goes out in one blits call
+            draw_list = self.draw_list
+
+            # Semi-transparent overlay, shared instead of created every paused frame
+            draw_list.blit(SurfacePool().get_overlay(self.screen.get_size(), (0, 0, 0, 128)), (0, 0))
 
             if not self.show_confirmation:
                 # Draw normal pause menu
-                border_rect = self.border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(self.border_img, border_rect)
+                border_rect = self.border_img.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
+                draw_list.blit(self.border_img, border_rect)
 
                 # Draw pause icons
                 for icon in self.pause_icons:
-                    icon.draw(self.screen)
+                    icon.draw(draw_list)
             else:
                 # Draw confirmation dialog
-                confirm_rect = self.confirm_border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(self.confirm_border_img, confirm_rect)
+                confirm_rect = self.confirm_border_img.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
+                draw_list.blit(self.confirm_border_img, confirm_rect)
 
                 # Draw confirmation buttons
                 for button in self.confirmation_buttons:
-                    button.draw(self.screen)
+                    button.draw(draw_list)
+
+            draw_list.flush(self.screen)
 
     def draw(self):
         """Draw the pause button (always visible) and overlay when paused"""
@@ -234,19 +235,19 @@ class Pause:
             self.pause_button.draw(self.screen)
         self.draw_pause_overlay()
 
-    def update(self, event):
-        """Handle pause button events"""
+    def route_buttons(self):
+        """Register the pause button, the menu icons or the confirmation buttons with the UI router."""
         if not self.paused:
-            self.pause_button.update(event)
+            buttons = [self.pause_button]
+        elif self.show_confirmation:
+            buttons = self.confirmation_buttons
         else:
-            if self.show_confirmation:
-                # Handle confirmation dialog events
-                for button in self.confirmation_buttons:
-                    button.update(event)
-            else:
-                # Handle pause menu events
-                for icon in self.pause_icons:
-                    icon.update(event)
+            buttons = self.pause_icons
+        UIRouter().set_scope(self, buttons)
+
+    def update(self, event):
+        """Handle pause button events"""
+        UIRouter().dispatch(event, scope=self)
 
     def is_paused(self):
         """Check if game is paused"""
@@ -2,6 +2,8 @@ import os
 import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from .pvp_battle import PVPBattle
+from managers.asset_manager import get_scene_manifest
+from effects.transition import Transition
 
 class PVP:
     def __init__(self, game_instance):
@@ -21,14 +23,18 @@ class PVP:
             print("Error: Heroes not selected!")
             return None
 
-        # Create and run the PVP battle
-        battle = PVPBattle(
-            self.screen,
-            self.script_dir,
-            p1_hero=self.game_instance.p1_hero,
-            p2_hero=self.game_instance.p2_hero,
-            audio_manager=self.audio_manager,
-            game_instance=self.game_instance
+        # Create the PVP battle while the hero selection fades out, then run it
+        battle = Transition(self.screen, style="cross").run(
+            lambda: PVPBattle(
+                self.screen,
+                self.script_dir,
+                p1_hero=self.game_instance.p1_hero,
+                p2_hero=self.game_instance.p2_hero,
+                audio_manager=self.audio_manager,
+                game_instance=self.game_instance
+            ),
+            get_scene_manifest(self.script_dir, "pvp"),
+            draw_incoming=PVPBattle.draw_background_for_coin_toss
         )
 
         # Run the battle and get the result
@@ -1,23 +1,47 @@
 import pygame
-import time
 import os
 import random
 from characters.player import Player
-from gameplay.questions import QuestionGenerator
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH
+from gameplay.questions import QuestionGenerator, AnswerButton
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.display_manager import DisplayManager, px
+from managers.frame_governor import FrameGovernor
+from managers.fixed_timestep import FixedTimestep
+from managers.game_clock import GameClock
+from managers.ui_router import UIRouter
+from managers.draw_list import DrawList, BOX_LAYER, BORDER_LAYER, CONTENT_LAYER
+from ui.text_layout import TextCache
+from ui.glyph_atlas import get_atlas
 from .pause import Pause
 from .coin_toss import CoinToss
+from .battle_animation import BattleAnimator
+from effects.particles import ParticleSystem
+from effects.backgrounds import get_background
+from managers.performance_manager import PerformanceManager
+
+BATTLE_END_SECONDS = 2  # How long the result stays on screen before the battle closes
 
 
 class PVPBattle:
     def __init__(self, screen, script_dir, p1_hero="boy", p2_hero="girl", audio_manager=None, game_instance=None):
         self.screen = screen
+        get_background(screen.get_size(), "pvp")  # Generated now, while the scene transition covers the screen
         self.script_dir = script_dir
         self.running = True
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(FONT_PATH, 50)
-        self.small_font = pygame.font.Font(FONT_PATH, 30)
-        self.turn_font = pygame.font.Font(FONT_PATH, 40)
+        self.frame_governor = FrameGovernor()
+        self.timestep = FixedTimestep()
+        self.game_clock = GameClock()
+        self.font = pygame.font.Font(FONT_PATH, px(50))
+        self.small_font = pygame.font.Font(FONT_PATH, px(30))
+        self.text_cache = TextCache(self.font, (255, 255, 255))
+        self.label_cache = TextCache(self.small_font, (255, 255, 255))
+        self.message_cache = TextCache(self.font, (255, 255, 0))
+        self.draw_list = DrawList()  # Interface commands of the frame being drawn
+        self.timer_atlas = get_atlas(50, (255, 255, 255))  # The countdown changes every second
+        self.health_atlas = get_atlas(30, (255, 255, 255))
+        self.turn_font = pygame.font.Font(FONT_PATH, px(40))
+        # Turn text per player color, rendered once for each player
+        self.turn_caches = {1: TextCache(self.turn_font, (0, 255, 0)), 2: TextCache(self.turn_font, (0, 200, 255))}
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
@@ -26,19 +50,24 @@ class PVPBattle:
 
         # Initialize players with their chosen heroes
         self.player1 = Player(script_dir, p1_hero)
-        self.player2 = Player(script_dir, p2_hero)
+        self.player2 = Player(script_dir, p2_hero, flip_x=True)  # Faces player 1
 
         # Disable the built-in health bars in the Player class
         self.player1.show_health_bar = False
         self.player2.show_health_bar = False
 
         # Set player positions properly (left and right sides)
-        self.player1.rect.x = 300  # Left side position
-        self.player1.rect.bottom = 700
+        self.player1.rect.x = px(300)  # Left side position
+        self.player1.rect.bottom = px(700)
+
+        self.player2.rect.x = px(SCREEN_WIDTH - 475)  # Right side position
+        self.player2.rect.bottom = px(700)
 
-        self.player2.rect.x = SCREEN_WIDTH - 475  # Right side position
-        self.player2.rect.bottom = 700
-        self.player2.image = pygame.transform.flip(self.player2.image, True, False)
+        # Attack lunges, hit flashes, screen shake, HP bar easing and hit bursts; sprites use the flipped image
+        self.particles = ParticleSystem(PerformanceManager().get("particles"))
+        self.animator = BattleAnimator(self.particles)
+        self.animator.add_fighter(self.player1, facing=1)
+        self.animator.add_fighter(self.player2, facing=-1)
 
         # Determine which player goes first with a coin toss
         self.coin_toss = CoinToss(screen, script_dir, audio_manager, battle_instance=self)
@@ -49,9 +78,10 @@ class PVPBattle:
         self.current_question = None
         self.selected_answer = None
         self.answer_buttons = []
-        self.timer_start = 0
+        self.hovered_button = None  # Answer button under the cursor this frame
         self.battle_message = ""
         self.message_timer = 0
+        self.end_time = None  # Game clock time at which a decided battle closes
 
         # Initialize pause menu with specific callbacks
         self.pause_menu = Pause(
@@ -106,60 +136,60 @@ class PVPBattle:
     def generate_new_question(self):
         """Generates a new question for the battle"""
         self.current_question = QuestionGenerator.get_random_question(self.difficulty)  # Use self.difficulty
-        self.timer_start = time.time()
         self.time_left = self.timer_seconds  # Use self.timer_seconds
         self.selected_answer = None
         self.create_answer_buttons()
 
     def create_answer_buttons(self):
         """Creates the answer buttons based on the current question"""
+        choices = self.current_question.choices
+        # Questions keep the same number of choices, so the buttons are relabelled rather than rebuilt
+        if len(choices) == len(self.answer_buttons):
+            for button, choice in zip(self.answer_buttons, choices):
+                button.set_value(choice)
+            return
+
+        UIRouter().unregister_scope(self)  # The previous question's buttons
         self.answer_buttons = []
         # Create a button for each choice
-        button_width = 200
-        button_height = 60
-        button_margin = 20
-        total_width = (button_width + button_margin) * len(self.current_question.choices)
-        start_x = (SCREEN_WIDTH - total_width) // 2
+        button_width = px(200)
+        button_height = px(60)
+        button_margin = px(20)
+        total_width = (button_width + button_margin) * len(choices)
+        start_x = (px(SCREEN_WIDTH) - total_width) // 2
 
-        for i, choice in enumerate(self.current_question.choices):
+        for i, choice in enumerate(choices):
             button_rect = pygame.Rect(
                 start_x + i * (button_width + button_margin),
-                SCREEN_HEIGHT - 150,
+                px(SCREEN_HEIGHT - 150),
                 button_width,
                 button_height
             )
-            self.answer_buttons.append({
-                'rect': button_rect,
-                'value': choice,
-                'text': str(choice),
-                'hovered': False
-            })
+            self.answer_buttons.append(AnswerButton(button_rect, choice))
+            UIRouter().register(self.answer_buttons[-1], scope=self)
 
     def handle_events(self):
         """Handle user input during battle"""
-        for event in pygame.event.get():
+        for event in self.frame_governor.get_events(not self.pause_menu.is_paused()):
             if event.type == pygame.QUIT:
                 self.running = False
 
             # Only process other events if not paused
             if not self.pause_menu.is_paused():
-                if event.type == pygame.MOUSEMOTION:
-                    # Check if mouse is hovering over any answer button
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        button['hovered'] = button['rect'].collidepoint(mouse_pos)
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Check if an answer button was clicked
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        if button['rect'].collidepoint(mouse_pos):
-                            self.selected_answer = button['value']
-                            self.check_answer()
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    # The router hit-tests the click against the answer buttons
+                    button = UIRouter().widget_at(event.pos, scope=self)
+                    # Answers are ignored once the battle is decided
+                    if button is not None and self.end_time is None:
+                        self.selected_answer = button.value
+                        self.check_answer()
 
             # Always process pause menu events
             self.pause_menu.update(event)
 
+        # Hover is resolved once per frame rather than on every mouse motion
+        self.hovered_button = None if self.pause_menu.is_paused() else UIRouter().hovered_widget(scope=self)
+
     def check_answer(self):
         """Checks if the selected answer is correct"""
         current = self.player1 if self.current_player == 1 else self.player2
@@ -168,26 +198,24 @@ class PVPBattle:
         if self.selected_answer == self.current_question.answer:
             # Correct answer - opponent takes damage
             opponent.take_damage(1)
+            self.animator.attack(current, opponent, correct=True)
             self.battle_message = f"Correct! Player {3 - self.current_player} takes damage!"
 
             if opponent.hp <= 0:
                 self.battle_message = f"Victory! Player {self.current_player} wins!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=True)
         else:
             # Wrong answer - current player takes damage
             current.take_damage(1)
+            self.animator.hurt(current, correct=False)
             self.battle_message = f"Wrong! Player {self.current_player} takes damage!"
 
             if current.hp <= 0:
                 self.battle_message = f"Victory! Player {3 - self.current_player} wins!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=True)
 
         # Set message timer
-        self.message_timer = time.time()
+        self.message_timer = self.game_clock.now()
 
         # Switch to the other player's turn
         self.current_player = 3 - self.current_player  # Toggle between 1 and 2
@@ -195,20 +223,20 @@ class PVPBattle:
         # Generate a new question for the next player
         self.generate_new_question()
 
-    def update_timer(self):
-        """Updates the time left to answer the question"""
-        # If paused, don't update anything
-        if self.pause_menu.is_paused():
-            return
+    def end_battle(self, victory):
+        """Let the last hit play out for a moment before the battle loop ends."""
+        if victory:
+            self.particles.confetti()
+        self.end_time = self.game_clock.now() + BATTLE_END_SECONDS
 
-        # Adjust timer for any time spent paused
-        paused_time = self.pause_menu.get_total_paused_time()
-        if paused_time > 0:
-            self.timer_start += paused_time  # Move the start time forward by paused duration
+    def update_timer(self, step):
+        """Counts the time left to answer the question down by one simulation step"""
+        # If paused or already decided, don't update anything
+        if self.pause_menu.is_paused() or self.end_time is not None:
+            return
 
         # Calculate remaining time
-        elapsed = time.time() - self.timer_start
-        self.time_left = max(0, self.timer_seconds - elapsed)
+        self.time_left = max(0, self.time_left - step)
 
         # If time runs out, treat as wrong answer
         if self.time_left <= 0 and self.running:
@@ -216,12 +244,11 @@ class PVPBattle:
 
             self.battle_message = f"Time's up! Player {self.current_player} takes damage!"
             current.take_damage(1)
+            self.animator.hurt(current, correct=False)
 
             if current.hp <= 0:
                 self.battle_message = f"Victory! Player {3 - self.current_player} wins!"
-                # Wait a bit before ending the battle
-                pygame.time.delay(2000)
-                self.running = False  # End the battle
+                self.end_battle(victory=True)
             else:
                 # Switch to the other player's turn
                 self.current_player = 3 - self.current_player
@@ -229,123 +256,145 @@ class PVPBattle:
                 self.generate_new_question()
 
             # Set message timer
-            self.message_timer = time.time()
+            self.message_timer = self.game_clock.now()
 
     def draw_background_for_coin_toss(self):
         """Draws only the background for the coin toss, without UI elements that need game state."""
         # Draw background
-        self.screen.fill((50, 50, 100))
+        self.screen.blit(get_background(self.screen.get_size(), "pvp"), (0, 0))
 
         # Draw players with their correct positions
         self.player1.draw(self.screen)
         self.player2.draw(self.screen)
 
         # Draw player health bars (which don't change during coin toss)
-        self.draw_health_bar(self.player1, SCREEN_WIDTH // 4, 30, "Player 1")
-        self.draw_health_bar(self.player2, 3 * SCREEN_WIDTH // 4, 30, "Player 2")
+        self.draw_health_bar(self.player1, px(SCREEN_WIDTH // 4), px(30), "Player 1")
+        self.draw_health_bar(self.player2, px(3 * SCREEN_WIDTH // 4), px(30), "Player 2")
+        self.draw_list.flush(self.screen)
 
     def draw(self):
         """Draws the battle screen"""
         # Draw background
-        self.screen.fill((50, 50, 100))
+        self.screen.blit(get_background(self.screen.get_size(), "pvp"), (0, 0))
 
         # Draw players in their proper positions
         self.player1.draw(self.screen)
         self.player2.draw(self.screen)
+        self.animator.apply_shake(self.screen)
+
+        # The interface is queued and drawn in batches: boxes, then borders, then text
+        hud = self.draw_list
 
         # Draw timer
-        timer_text = self.font.render(f"Time: {int(self.time_left)}", True, (255, 255, 255))
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        pygame.draw.rect(self.screen, (0, 0, 0), (timer_rect.x - 10, timer_rect.y - 10, timer_rect.width + 20, timer_rect.height + 20))
-        self.screen.blit(timer_text, timer_rect)
+        timer_text = f"Time: {int(self.time_left)}"
+        timer_rect = self.timer_atlas.get_rect(timer_text, center=(px(SCREEN_WIDTH // 2), px(50)))
+        hud.fill((0, 0, 0), timer_rect.inflate(px(20), px(20)), layer=BOX_LAYER)
+        hud.blits(self.timer_atlas.glyph_blits(timer_text, timer_rect.topleft), layer=CONTENT_LAYER)
 
         # Draw current player turn indicator
-        turn_text = self.turn_font.render(f"Player {self.current_player}'s Turn", True, (0, 255, 0) if self.current_player == 1 else (0, 200, 255))
-        turn_rect = turn_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        pygame.draw.rect(self.screen, (0, 0, 0), (turn_rect.x - 10, turn_rect.y - 10, turn_rect.width + 20, turn_rect.height + 20))
-        self.screen.blit(turn_text, turn_rect)
+        turn_cache = self.turn_caches[1 if self.current_player == 1 else 2]
+        turn_text = turn_cache.render(f"Player {self.current_player}'s Turn")
+        turn_rect = turn_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(100)))
+        hud.fill((0, 0, 0), turn_rect.inflate(px(20), px(20)), layer=BOX_LAYER)
+        hud.blit(turn_text, turn_rect, layer=CONTENT_LAYER)
 
         # Draw question box
-        question_box = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 200)
-        pygame.draw.rect(self.screen, (0, 0, 0, 200), question_box)
-        pygame.draw.rect(self.screen, (255, 255, 255), question_box, 3)
+        question_box = pygame.Rect(px(50), px(SCREEN_HEIGHT - 300), px(SCREEN_WIDTH - 100), px(200))
+        hud.fill((0, 0, 0, 200), question_box, layer=BOX_LAYER)
+        hud.rect((255, 255, 255), question_box, px(3), layer=BORDER_LAYER)
 
         # Draw question text
-        question_text = self.font.render(self.current_question.question_text, True, (255, 255, 255))
-        question_rect = question_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250))
-        self.screen.blit(question_text, question_rect)
+        question_text = self.text_cache.render(self.current_question.question_text)
+        question_rect = question_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT - 250)))
+        hud.blit(question_text, question_rect, layer=CONTENT_LAYER)
 
         # Draw answer buttons if not paused
         if not self.pause_menu.is_paused():
             for button in self.answer_buttons:
-                color = (100, 100, 255) if button['hovered'] else (50, 50, 200)
-                pygame.draw.rect(self.screen, color, button['rect'])
-                pygame.draw.rect(self.screen, (255, 255, 255), button['rect'], 2)
-                text = self.small_font.render(button['text'], True, (255, 255, 255))
-                text_rect = text.get_rect(center=button['rect'].center)
-                self.screen.blit(text, text_rect)
+                color = (100, 100, 255) if button is self.hovered_button else (50, 50, 200)
+                hud.fill(color, button.rect, layer=BOX_LAYER)
+                hud.rect((255, 255, 255), button.rect, px(2), layer=BORDER_LAYER)
+                text = self.label_cache.render(button.text)
+                hud.blit(text, text.get_rect(center=button.rect.center), layer=CONTENT_LAYER)
 
         # Draw battle message
-        if self.battle_message and time.time() - self.message_timer < 2:
-            message_text = self.font.render(self.battle_message, True, (255, 255, 0))
-            message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            pygame.draw.rect(self.screen, (0, 0, 0),(message_rect.x - 10, message_rect.y - 10, message_rect.width + 20, message_rect.height + 20))
-            self.screen.blit(message_text, message_rect)
+        if self.battle_message and self.game_clock.now() - self.message_timer < 2:
+            message_text = self.message_cache.render(self.battle_message)
+            message_rect = message_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
+            hud.fill((0, 0, 0), message_rect.inflate(px(20), px(20)), layer=BOX_LAYER)
+            hud.blit(message_text, message_rect, layer=CONTENT_LAYER)
 
         # Draw player health bars
-        self.draw_health_bar(self.player1, SCREEN_WIDTH // 4, 30, "Player 1")
-        self.draw_health_bar(self.player2, 3 * SCREEN_WIDTH // 4, 30, "Player 2")
+        self.draw_health_bar(self.player1, px(SCREEN_WIDTH // 4), px(30), "Player 1")
+        self.draw_health_bar(self.player2, px(3 * SCREEN_WIDTH // 4), px(30), "Player 2")
+        hud.flush(self.screen)
+
+        # Particles over the scene and the UI
+        self.particles.draw(self.screen)
 
         # Draw pause menu
         self.pause_menu.draw()
 
     def draw_health_bar(self, player, x, y, label):
-        """Draw a health bar for the given player at the specified position."""
+        """Queue a health bar for the given player at the specified position."""
+        hud = self.draw_list
+
         # Draw label
-        label_text = self.small_font.render(label, True, (255, 255, 255))
-        label_rect = label_text.get_rect(center=(x, y))
-        self.screen.blit(label_text, label_rect)
+        label_text = self.label_cache.render(label)
+        hud.blit(label_text, label_text.get_rect(center=(x, y)), layer=CONTENT_LAYER)
 
         # Draw health bar background
-        bar_width = 200
-        bar_height = 20
-        bar_bg_rect = pygame.Rect(x - bar_width // 2, y + 20, bar_width, bar_height)
-        pygame.draw.rect(self.screen, (100, 0, 0), bar_bg_rect)
+        bar_width = px(200)
+        bar_height = px(20)
+        bar_bg_rect = pygame.Rect(x - bar_width // 2, y + px(20), bar_width, bar_height)
+        hud.fill((100, 0, 0), bar_bg_rect, layer=BOX_LAYER)
 
         # Draw current health
-        health_percentage = max(0, player.hp / player.max_hp)
+        health_percentage = max(0, player.display_hp / player.max_hp)
         health_width = int(bar_width * health_percentage)
-        health_rect = pygame.Rect(x - bar_width // 2, y + 20, health_width, bar_height)
-        pygame.draw.rect(self.screen, (0, 200, 0), health_rect)
+        health_rect = pygame.Rect(x - bar_width // 2, y + px(20), health_width, bar_height)
+        hud.fill((0, 200, 0), health_rect, layer=BOX_LAYER)
 
         # Draw border
-        pygame.draw.rect(self.screen, (255, 255, 255), bar_bg_rect, 2)
+        hud.rect((255, 255, 255), bar_bg_rect, px(2), layer=BORDER_LAYER)
 
         # Draw health text
-        health_text = self.small_font.render(f"{player.hp}/{player.max_hp}", True, (255, 255, 255))
-        health_text_rect = health_text.get_rect(center=(x, y + 20 + bar_height // 2))
-        self.screen.blit(health_text, health_text_rect)
+        health_text = f"{player.hp}/{player.max_hp}"
+        health_text_rect = self.health_atlas.get_rect(health_text, center=(x, y + px(20) + bar_height // 2))
+        hud.blits(self.health_atlas.glyph_blits(health_text, health_text_rect.topleft), layer=CONTENT_LAYER)
 
     def run(self):
         """Main battle loop"""
         # Start with the coin toss
         self.start_battle()
 
+        self.game_clock.tick()  # Time before the battle loop does not count
         while self.running:
             # Handle events
             self.handle_events()
 
-            # Update timer
-            self.update_timer()
+            # Advance the timer in fixed steps; the game clock stands still while paused
+            for _ in range(self.timestep.advance(self.game_clock.tick())):
+                self.update_timer(self.timestep.step)
+                self.animator.step()
+
+            # The result stays on screen, still animating, until the end time
+            if self.end_time is not None and self.game_clock.now() >= self.end_time:
+                self.running = False
 
             # Draw battle
             self.draw()
 
             # Update display
-            pygame.display.flip()
+            DisplayManager().present()
+
+            # Cap the frame rate; a paused battle drops to the idle rate
+            self.frame_governor.tick(not self.pause_menu.is_paused() or self.animator.is_animating())
 
-            # Cap the frame rate
-            self.clock.tick(FPS)
+        # Leaving from the pause menu must not keep the clock stopped
+        self.game_clock.set_paused(False)
+        UIRouter().unregister_scope(self)
+        UIRouter().unregister_scope(self.pause_menu)
 
         # Stop battle music when the battle ends
         self.stop_battle_music()
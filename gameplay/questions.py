@@ -2,6 +2,9 @@ import random
 import operator
 
 class Question:
+    # Slots keep each question small and its attributes fast to read in the battle loop
+    __slots__ = ("question_text", "answer", "choices", "correct_choice")
+
     def __init__(self):
         self.question_text = ""
         self.answer = None
@@ -13,6 +16,8 @@ class Question:
         return user_answer == self.answer
 
 class MathQuestion(Question):
+    __slots__ = ("difficulty",)
+
     def __init__(self, difficulty=1):
         super().__init__()
         self.difficulty = difficulty
@@ -90,9 +95,23 @@ class MathQuestion(Question):
         self.correct_choice = self.choices.index(self.answer)
 
 
+class AnswerButton:
+    # __weakref__ lets the UI router track the button without keeping it alive
+    __slots__ = ("rect", "value", "text", "__weakref__")
+
+    def __init__(self, rect, value):
+        """A clickable choice of a battle question."""
+        self.rect = rect
+        self.set_value(value)
+
+    def set_value(self, value):
+        self.value = value
+        self.text = str(value)
+
+
 class QuestionGenerator:
     @staticmethod
     def get_random_question(difficulty=1):
         """Factory method to get a random question"""
         # Currently only generates math questions, but can be expanded
-        return MathQuestion(difficulty)
\ No newline at end of file
+        return MathQuestion(difficulty)
@@ -1,11 +1,17 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 from managers.audio_manager import AudioManager
 from managers.auth_manager import AuthManager
 from managers.game_manager import GameManager
 from managers.custom_manager import CustomManager
+from managers.asset_manager import get_preload_manifest, get_scene_manifest
+from managers.display_manager import DisplayManager
+from managers.performance_manager import PerformanceManager
+from managers.frame_governor import FrameGovernor
+from managers.sprite_variants import SpriteVariants
+from managers.ui_router import UIRouter
 from ui.menu_background import MenuBackground
+from ui.splash_screen import SplashScreen
 from ui.main_menu import MainMenu
 from ui.game_modes import GameModes
 from ui.hero_selection import HeroSelection
@@ -13,13 +19,16 @@ from ui.pvp_hero_selection import PVPHeroSelection
 from maps.map import Map
 from gameplay.battle import Battle
 from gameplay.pvp import PVP
+from gameplay.battle_animation import warm_battle_sprites
 from gameplay.custom import CustomMode
+from effects.transition import Transition
 
 class FinalQuiztasy:
     def __init__(self):
         pygame.init()
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.display_manager = DisplayManager()
+        self.screen = self.display_manager.canvas
         pygame.display.set_caption('Final Quiztasy')
 
         icon_path = os.path.join(self.script_dir, "images", "logo", "logo.png")
@@ -28,6 +37,22 @@ class FinalQuiztasy:
             pygame.display.set_icon(window_icon)
 
         self.running = True
+
+        # Decode the menu, hero selection and first map assets behind a loading screen
+        splash_screen = SplashScreen(self.screen, get_preload_manifest(self.script_dir))
+        if not splash_screen.run():
+            self.running = False
+
+        # Pick a graphics preset: saved for this machine, or measured on first launch
+        self.performance_manager = PerformanceManager()
+        if self.running and not self.performance_manager.has_saved_preset():
+            self.performance_manager.run_benchmark(self.script_dir)
+        else:
+            self.performance_manager.apply_preset(self.performance_manager.get_preset(), save=False)
+
+        # Battle sprites are prepared a little each frame while the menus and the map run
+        warm_battle_sprites(self.script_dir)
+
         self.auth_manager = AuthManager()
         self.game_manager = GameManager()
         self.custom_manager = CustomManager()
@@ -45,18 +70,25 @@ class FinalQuiztasy:
 
         self.setup_background()
         self.setup_audio()
+        self.build_screens()
+        self.battle = None
+
+        # Frame governor caps the frame rate and idles static screens
+        self.frame_governor = FrameGovernor()
+
+    def build_screens(self):
+        """Create the menus for the current canvas; called again when the render resolution changes."""
+        self.screen = self.display_manager.canvas
+        UIRouter().clear()  # The old screens' buttons must not take clicks any more
         self.main_menu = MainMenu(self.screen, self.audio_manager, self.script_dir, exit_callback=self.exit_game, game_instance=self)
         self.hero_selection = HeroSelection(self, self.background_menu)
         self.pvp_hero_selection = PVPHeroSelection(self, self.background_menu)
 
         self.game_modes = GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self, auth_manager=self.game_manager.auth_manager)
         self.custom_mode = CustomMode(self.screen, self.audio_manager, self.script_dir, game_instance=self)
-        self.lspu_map = None
-        self.battle = None
+        self.lspu_map = None  # The map is laid out for the canvas too, so it is built again on the next visit
         self.pvp = PVP(self)
-
-        # Clock for controlling frame rate
-        self.clock = pygame.time.Clock()
+        self.last_screen_state = None
 
     def setup_background(self):
         self.background_menu = MenuBackground(
@@ -83,8 +115,17 @@ class FinalQuiztasy:
         if self.audio_manager.audio_enabled:
             self.audio_manager.play_music()
 
-        # Create the LSPU map
-        self.lspu_map = Map(self.screen, self.script_dir, self.return_to_main_menu, self.audio_manager, self.selected_hero, game_instance=self)
+        # Create the LSPU map once per session; later visits keep its state
+        def build_map():
+            if self.lspu_map is None:
+                # Built in stages so the transition keeps drawing while the map loads
+                self.lspu_map = yield from Map.build(self.screen, self.script_dir, self.return_to_main_menu, self.audio_manager, self.selected_hero, game_instance=self)
+            else:
+                self.lspu_map.resume(self.selected_hero)
+            return self.lspu_map
+
+        # The map's images load while the menu fades out
+        Transition(self.screen).run(build_map, get_scene_manifest(self.script_dir, "map"), draw_incoming=Map.draw)
         self.hero_selection.hide()
         self.lspu_map.run()
 
@@ -103,8 +144,7 @@ class FinalQuiztasy:
         print("Switching to main menu")
         self.running_map = False
         self.main_menu.show()
-        if hasattr(self, 'lspu_map'):
-            self.lspu_map = None
+        # The map session stays alive so the next visit is instant
         if hasattr(self, 'battle'):
             self.battle = None
 
@@ -147,25 +187,73 @@ class FinalQuiztasy:
                 user_id = current_user.get('id')
         return self.custom_manager.get_question_sets(user_id)
 
+    def is_animating(self):
+        """The menu video counts as animation unless a dialog or form covers the menu."""
+        if not self.performance_manager.get("menu_video"):
+            return False
+        login_screen = self.main_menu.login_screen
+        dialog_open = (self.main_menu.exit_handler.show_exit_confirmation or
+                       self.main_menu.options_handler.show_settings or
+                       login_screen.visible or
+                       getattr(login_screen, 'register_screen', None) and login_screen.register_screen.visible or
+                       self.main_menu.logout_screen.visible or
+                       self.game_modes.visible or self.custom_mode.visible)
+        return not dialog_open
+
+    def get_event_handler(self):
+        """The handler of the screen on top; events go to it alone."""
+        if self.hero_selection.visible:
+            return self.hero_selection.update
+        if self.pvp_hero_selection.visible:
+            return self.pvp_hero_selection.update
+        if self.custom_mode.visible:
+            return self.custom_mode.update
+        if self.game_modes.visible:
+            return self.game_modes.update
+        return self.main_menu.handle_events
+
     def handle_events(self):
-        for event in pygame.event.get():
+        events = self.frame_governor.get_events(self.is_animating())
+        handler = self.get_event_handler()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
-            if hasattr(self, 'hero_selection') and self.hero_selection.visible:
-                self.hero_selection.update(event)
-            elif hasattr(self, 'pvp_hero_selection') and self.pvp_hero_selection.visible:
-                self.pvp_hero_selection.update(event)
-            elif hasattr(self, 'custom_mode') and self.custom_mode.visible:  # Add this check
-                self.custom_mode.update(event)
-            elif hasattr(self, 'game_modes') and self.game_modes.visible:
-                self.game_modes.update(event)
-            else:
-                self.main_menu.handle_events(event)
+            handler(event)
+            # Only clicks and key presses switch screens, so only they need a new lookup
+            if event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN):
+                handler = self.get_event_handler()
+
+    def get_screen_state(self):
+        """Describe what the menu shows; None when the screen must always be fully presented."""
+        if self.performance_manager.get("menu_video") or not self.main_menu.visible:
+            return None
+        if self.hero_selection.visible or self.pvp_hero_selection.visible or self.custom_mode.visible:
+            return None
+        login_screen = self.main_menu.login_screen
+        if login_screen.visible or getattr(login_screen, 'register_screen', None) and login_screen.register_screen.visible:
+            return None  # Text input and cursor blink
+        if self.main_menu.logout_screen.visible:
+            return None
+
+        options = self.main_menu.options_handler
+        return (self.main_menu.show_game_logo,
+                self.game_modes.visible, self.game_modes.show_new_continue,
+                self.main_menu.exit_handler.show_exit_confirmation,
+                options.show_settings, options.show_apply_changes, options.temp_audio_enabled, options.temp_preset,
+                self.is_user_logged_in(),
+                tuple(getattr(button, 'visible', True) for button in self.main_menu.menu_buttons))
 
     def draw(self):
-        frame_surface = self.background_menu.get_frame()
-        frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.screen.blit(frame_surface, (0, 0))
+        # Unchanged static menus only need the buttons that changed presented
+        screen_state = self.get_screen_state()
+        if screen_state is not None and screen_state == self.last_screen_state:
+            self.display_manager.begin_partial_frame()
+        self.last_screen_state = screen_state
+
+        # The video holds its frame behind an idle dialog
+        advance = not self.frame_governor.is_idle(self.is_animating())
+        frame_surface = self.background_menu.get_frame(self.screen.get_size(), advance)
+        self.display_manager.draw_background(frame_surface)
 
         if hasattr(self, 'hero_selection') and self.hero_selection.visible:
             self.hero_selection.draw()
@@ -182,9 +270,13 @@ class FinalQuiztasy:
         # Main game loop
         while self.running:
             self.handle_events()
+            if self.display_manager.canvas is not self.screen:
+                self.build_screens()  # A preset with another render resolution was applied
             self.draw()
-            pygame.display.update()
-            self.clock.tick(FPS)
+            self.display_manager.present()
+            SpriteVariants().poll()
+            self.frame_governor.tick(self.is_animating())
+        self.frame_governor.report()
         # Clean up resources
         self.background_menu.close()
         pygame.quit()
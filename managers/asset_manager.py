@@ -0,0 +1,182 @@
+import pygame
+import os
+from concurrent.futures import ThreadPoolExecutor
+from settings import PRELOAD_PRIORITIES, PRELOAD_WORKERS
+
+# Assets needed by each startup screen, relative to assets/images.
+# Folders are scanned for every .png inside them.
+PRELOAD_GROUPS = {
+    "main_menu": [
+        "logo",
+        os.path.join("buttons", "menu"),
+        os.path.join("buttons", "settings"),
+        os.path.join("buttons", "exit"),
+        os.path.join("buttons", "back button"),
+        os.path.join("buttons", "game modes", "modes"),
+        os.path.join("buttons", "game modes", "new or continue"),
+        "login&register",
+    ],
+    "hero_selection": [
+        os.path.join("buttons", "game modes", "hero selection"),
+    ],
+    "map": [
+        os.path.join("map", "lspu_map.png"),
+        os.path.join("map", "animation"),
+        os.path.join("buttons", "enter level"),
+        "levels",
+    ],
+    # Scene groups that scene transitions load behind their cover
+    "battle": [
+        os.path.join("battle", "backgrounds"),
+        os.path.join("battle", "boy"),
+        os.path.join("battle", "girl"),
+        os.path.join("battle", "enemy"),
+        os.path.join("battle", "pause"),
+    ],
+    "pvp": [
+        os.path.join("battle", "boy"),
+        os.path.join("battle", "girl"),
+        os.path.join("battle", "pause"),
+        "coin",
+    ],
+}
+
+# Images (or folders of images) that are drawn without per-pixel alpha
+OPAQUE_IMAGES = {os.path.join("map", "lspu_map.png"), os.path.join("battle", "backgrounds")}
+
+
+class AssetManager:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.images = {}  # (path, alpha) -> converted surface
+        self._initialized = True
+
+    def load_image(self, path, alpha=True):
+        """Return a converted image, decoding it now if it was not preloaded."""
+        path = os.path.normpath(path)
+        key = (path, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+
+        decoded = pygame.image.load(path)
+        image = decoded.convert_alpha() if alpha else decoded.convert()
+        self.images[key] = image
+        return image
+
+    def add_decoded(self, path, surface, alpha=True):
+        """Convert a surface decoded off the main thread and store it."""
+        path = os.path.normpath(path)
+        self.images[(path, alpha)] = surface.convert_alpha() if alpha else surface.convert()
+
+    def is_loaded(self, path, alpha=True):
+        return (os.path.normpath(path), alpha) in self.images
+
+    def unload(self, path):
+        """Drop every cached version of an image."""
+        path = os.path.normpath(path)
+        for key in [key for key in self.images if key[0] == path]:
+            del self.images[key]
+
+
+def get_group_entries(images_dir, group, priority):
+    """(priority, path, alpha) entries for every image in a preload group."""
+    entries = []
+    for entry in PRELOAD_GROUPS[group]:
+        full_path = os.path.join(images_dir, entry)
+        alpha = entry not in OPAQUE_IMAGES
+        if os.path.isdir(full_path):
+            for root, _, files in os.walk(full_path):
+                for name in sorted(files):
+                    if name.lower().endswith(".png"):
+                        entries.append((priority, os.path.join(root, name), alpha))
+        elif os.path.exists(full_path):
+            entries.append((priority, full_path, alpha))
+    return entries
+
+
+def get_preload_manifest(script_dir):
+    """Build the list of (priority, path, alpha) entries to preload, highest priority first."""
+    images_dir = os.path.join(script_dir, "assets", "images")
+    manifest = []
+
+    for group in PRELOAD_GROUPS:
+        priority = PRELOAD_PRIORITIES.get(group)
+        if priority is None:
+            continue  # Group disabled in settings
+        manifest += get_group_entries(images_dir, group, priority)
+
+    # Stable sort keeps the folder order inside each priority
+    manifest.sort(key=lambda item: item[0])
+    return manifest
+
+
+def get_scene_manifest(script_dir, group):
+    """Entries a scene transition preloads for one group; images already loaded are skipped by the preloader."""
+    return get_group_entries(os.path.join(script_dir, "assets", "images"), group, 0)
+
+
+class AssetPreloader:
+    def __init__(self, manifest, workers=PRELOAD_WORKERS):
+        """Decode images on a thread pool; conversion happens on the main thread in poll()."""
+        self.asset_manager = AssetManager()
+        self.manifest = [item for item in manifest if not self.asset_manager.is_loaded(item[1], item[2])]
+        self.total = len(self.manifest)
+        self.completed = 0
+        self.failed = []
+        self.pending = []
+        self.executor = None
+        self.workers = workers
+
+    def start(self):
+        """Queue every image; workers pick them up in priority order."""
+        if not self.manifest:
+            return
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preload")
+        for priority, path, alpha in self.manifest:
+            future = self.executor.submit(pygame.image.load, path)
+            self.pending.append((path, alpha, future))
+
+    def poll(self, time_budget_ms=8):
+        """Convert finished images in load order until the frame's time budget is spent."""
+        start = pygame.time.get_ticks()
+        while self.pending and self.pending[0][2].done():
+            path, alpha, future = self.pending.pop(0)
+            try:
+                self.asset_manager.add_decoded(path, future.result(), alpha)
+            except Exception as e:
+                print(f"Preloader: Could not load {path}: {e}")
+                self.failed.append(path)
+            self.completed += 1
+
+            if pygame.time.get_ticks() - start >= time_budget_ms:
+                break
+
+        if self.done() and self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def cancel(self):
+        """Stop the workers without waiting, dropping the images they have not started on."""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending = []
+
+    def progress(self):
+        """Fraction of the manifest that is ready to use."""
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def done(self):
+        return self.completed >= self.total
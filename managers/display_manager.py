@@ -0,0 +1,143 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_WIDTH, RENDER_HEIGHT, DRAW_LIST_DEBUG
+from managers.surface_pool import SurfacePool
+
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+class DisplayManager:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DisplayManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # The window keeps the layout resolution every screen is designed for; scenes draw on the canvas
+        self.window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.canvas = None
+        self.set_render_resolution((RENDER_WIDTH, RENDER_HEIGHT))
+
+        # Dirty-rect presentation: a screen opts in per frame with begin_partial_frame()
+        self.dirty_rects_enabled = False
+        self.dirty_rects = []
+        self.partial_frame = False
+
+        # Draw-list statistics for the frame being drawn and the last presented one
+        self.draw_debug = DRAW_LIST_DEBUG
+        self.frame_draws = [0, 0]  # Commands queued, draw calls issued
+        self.last_frame_draws = (0, 0)
+
+        self._initialized = True
+
+    def set_render_resolution(self, size):
+        """Draw every scene on a canvas of this size, upscaled into the window once per frame.
+
+        Screens lay themselves out for the canvas when they are built, so they are rebuilt after a change.
+        """
+        width = max(1, min(int(size[0]), SCREEN_WIDTH))
+        self.scale = width / SCREEN_WIDTH  # The canvas keeps the window's aspect ratio
+        self.render_size = (width, max(1, round(SCREEN_HEIGHT * self.scale)))
+        if self.canvas is not None and self.canvas.get_size() == self.render_size:
+            return
+
+        if self.is_scaled():
+            self.canvas = pygame.Surface(self.render_size).convert()
+        else:
+            self.canvas = self.window  # Native mode draws straight into the window
+        SurfacePool().clear()  # Overlays and scratch surfaces are sized for the old canvas
+
+    def is_scaled(self):
+        return self.render_size != (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def to_canvas(self, pos):
+        """Convert a window (mouse) position into canvas coordinates."""
+        return int(pos[0] * self.scale), int(pos[1] * self.scale)
+
+    def to_window(self, pos):
+        """Convert a canvas position into window coordinates, which are also layout coordinates."""
+        return int(pos[0] / self.scale), int(pos[1] / self.scale)
+
+    def get_mouse_pos(self):
+        return self.to_canvas(pygame.mouse.get_pos())
+
+    def translate_event(self, event):
+        """Return a mouse event with its position in canvas coordinates; other events pass through."""
+        if not self.is_scaled() or event.type not in MOUSE_EVENTS:
+            return event
+        attributes = dict(event.dict, pos=self.to_canvas(event.pos))
+        if event.type == pygame.MOUSEMOTION:
+            attributes["rel"] = self.to_canvas(event.rel)
+        return pygame.event.Event(event.type, attributes)
+
+    def draw_background(self, surface):
+        """Present a full-screen background; bake it at the canvas size so this stays a plain copy."""
+        if surface.get_bitsize() != self.canvas.get_bitsize():
+            surface = surface.convert()  # scale() into the canvas needs a matching format
+        if surface.get_size() == self.render_size:
+            self.canvas.blit(surface, (0, 0))
+        else:
+            pygame.transform.scale(surface, self.render_size, self.canvas)
+
+    def set_dirty_rects(self, enabled):
+        self.dirty_rects_enabled = enabled
+        self.dirty_rects = []
+
+    def begin_partial_frame(self):
+        """Present only the marked rects this frame; the screen must know nothing else changed."""
+        self.partial_frame = self.dirty_rects_enabled
+
+    def mark_dirty(self, rect):
+        """Record a canvas area that changed since the last frame."""
+        if self.dirty_rects_enabled:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def upscale(self, rect):
+        """Scale a canvas area into the window and return the window area it covers."""
+        rect = rect.clip(self.canvas.get_rect())
+        if not self.is_scaled() or not rect:
+            return rect
+        left, top = self.to_window(rect.topleft)
+        right, bottom = self.to_window(rect.bottomright)
+        target = pygame.Rect(left, top, right - left, bottom - top).clip(self.window.get_rect())
+        if target:
+            pygame.transform.scale(self.canvas.subsurface(rect), target.size, self.window.subsurface(target))
+        return target
+
+    def record_draws(self, commands, calls):
+        """Count a flushed draw list towards this frame's totals."""
+        self.frame_draws[0] += commands
+        self.frame_draws[1] += calls
+
+    def present(self):
+        """Show the frame, updating only dirty rects when the screen allowed it."""
+        if self.partial_frame:
+            if self.dirty_rects:
+                pygame.display.update([self.upscale(rect) for rect in self.dirty_rects])
+        else:
+            if self.is_scaled():
+                pygame.transform.scale(self.canvas, self.window.get_size(), self.window)
+            pygame.display.flip()
+        self.dirty_rects = []
+        self.partial_frame = False
+        SurfacePool().end_frame()  # Every frame passes here, so this is where the pool counts frames
+
+        self.last_frame_draws = tuple(self.frame_draws)
+        if self.draw_debug and self.frame_draws[0]:
+            print(f"Display Manager: {self.frame_draws[0]} draw commands in {self.frame_draws[1]} calls")
+        self.frame_draws = [0, 0]
+
+
+def px(value):
+    """A length in layout pixels (the 1920x1080 design size) in canvas pixels.
+
+    Lengths that are not zero never round to zero, so thin borders stay borders.
+    """
+    scaled = int(value * DisplayManager().render_size[0] / SCREEN_WIDTH)  # Exact for whole canvas pixels
+    if scaled == 0 and value:
+        return 1 if value > 0 else -1
+    return scaled
@@ -0,0 +1,108 @@
+import pygame
+from managers.display_manager import DisplayManager
+
+BLIT, FILL, OUTLINE = 0, 1, 2
+
+# Layers for interface panels: boxes first, their borders over them, then text and icons on top
+BOX_LAYER = 0
+BORDER_LAYER = 1
+CONTENT_LAYER = 2
+
+
+class DrawList:
+    def __init__(self):
+        """Draw commands collected over a frame and issued in as few calls as possible on flush().
+
+        It takes blit() and fill() like a surface, so widgets that draw onto a screen can draw onto it too.
+        """
+        self.commands = []  # (layer, order, kind, payload)
+        self.current_layer = 0
+
+    def set_layer(self, layer):
+        """Layer for the commands added from now on; higher layers are drawn on top."""
+        self.current_layer = layer
+
+    def blit(self, source, dest, area=None, special_flags=0, layer=None):
+        if not isinstance(dest, tuple):
+            dest = tuple(dest.topleft) if hasattr(dest, "topleft") else tuple(dest)
+        self.add(layer, BLIT, (source, dest, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=False, layer=None):
+        """Queue several blits, taking the same (source, dest[, area]) items as Surface.blits."""
+        for item in blit_sequence:
+            self.blit(*item, layer=layer)
+
+    def fill(self, color, rect=None, layer=None):
+        self.add(layer, FILL, (color, None if rect is None else pygame.Rect(rect)))
+
+    def rect(self, color, rect, width=0, layer=None):
+        """Like pygame.draw.rect: filled when width is 0, otherwise only the border."""
+        if width == 0:
+            self.fill(color, rect, layer)
+        else:
+            self.add(layer, OUTLINE, (color, pygame.Rect(rect), width))
+
+    def add(self, layer, kind, payload):
+        layer = self.current_layer if layer is None else layer
+        self.commands.append((layer, len(self.commands), kind, payload))
+
+    def flush(self, target):
+        """Draw every command onto target, layer by layer, then empty the list.
+
+        In a layer, consecutive blits go out in one Surface.blits call and consecutive fills of one
+        color that touch edge to edge are merged. Returns the number of draw calls made.
+        """
+        if not self.commands:
+            return 0
+        self.commands.sort(key=lambda command: (command[0], command[1]))
+
+        calls = 0
+        run_kind, run = None, []
+        last_layer = self.commands[0][0]
+        for layer, _, kind, payload in self.commands:
+            if kind != run_kind or layer != last_layer:
+                calls += self.draw_run(target, run_kind, run)
+                run_kind, run, last_layer = kind, [], layer
+            run.append(payload)
+        calls += self.draw_run(target, run_kind, run)
+
+        DisplayManager().record_draws(len(self.commands), calls)
+        self.commands = []
+        self.current_layer = 0
+        return calls
+
+    def draw_run(self, target, kind, run):
+        if not run:
+            return 0
+        if kind == BLIT:
+            target.blits(run, doreturn=False)
+            return 1
+        if kind == FILL:
+            rects = merge_fills(run)
+            for color, rect in rects:
+                target.fill(color, rect)
+            return len(rects)
+        for color, rect, width in run:
+            pygame.draw.rect(target, color, rect, width)
+        return len(run)
+
+
+def merge_fills(fills):
+    """Merge consecutive same-color rects that continue each other in a row or a column."""
+    merged = []
+    for color, rect in fills:
+        if rect is None:
+            merged.append((color, None))  # The whole target
+            continue
+        if merged and merged[-1][0] == color and merged[-1][1] is not None:
+            last = merged[-1][1]
+            if last.contains(rect):
+                continue
+            if last.x == rect.x and last.width == rect.width and last.bottom == rect.top:
+                last.height += rect.height
+                continue
+            if last.y == rect.y and last.height == rect.height and last.right == rect.left:
+                last.width += rect.width
+                continue
+        merged.append((color, pygame.Rect(rect)))
+    return merged
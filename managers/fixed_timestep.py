@@ -0,0 +1,38 @@
+from settings import SIMULATION_HZ, SIMULATION_MAX_STEPS
+from managers.game_clock import GameClock
+
+
+class FixedTimestep:
+    def __init__(self, step_hz=SIMULATION_HZ, max_steps=SIMULATION_MAX_STEPS):
+        """Accumulate frame time and hand it out as fixed simulation steps."""
+        self.step = 1 / step_hz  # Seconds per step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """Add elapsed game seconds and return how many steps to simulate now."""
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step + 1e-9)  # Tolerate float error in whole steps
+
+        # Fast-forward needs proportionally more steps per frame
+        max_steps = self.max_steps * max(1, int(GameClock().time_scale))
+        if steps > max_steps:
+            # Too far behind (long load, window drag): drop the backlog instead of catching up
+            steps = max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    def get_alpha(self):
+        """How far the current frame is between the last step and the next, from 0 to 1."""
+        return min(self.accumulator / self.step, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+def interpolate(previous, current, alpha):
+    """Blend two positions for drawing between simulation steps."""
+    return (previous[0] + (current[0] - previous[0]) * alpha,
+            previous[1] + (current[1] - previous[1]) * alpha)
@@ -0,0 +1,69 @@
+import pygame
+from settings import IDLE_FPS, IDLE_DELAY_MS
+from managers.display_manager import DisplayManager
+from managers.performance_manager import PerformanceManager
+from managers.ui_router import UIRouter
+
+
+class FrameGovernor:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FrameGovernor, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.clock = pygame.time.Clock()
+        self.idle_fps = IDLE_FPS
+        self.idle_delay_ms = IDLE_DELAY_MS
+        self.last_activity = pygame.time.get_ticks()
+        self.time_at_rate = {}  # fps -> seconds spent running at that rate
+        self._initialized = True
+
+    def notify_activity(self):
+        """Return to full rate, e.g. after input or a screen change."""
+        self.last_activity = pygame.time.get_ticks()
+
+    def is_idle(self, animating=False):
+        """True when nothing animates and there has been no input for a while."""
+        if animating:
+            self.notify_activity()
+            return False
+        return pygame.time.get_ticks() - self.last_activity >= self.idle_delay_ms
+
+    def get_events(self, animating=False):
+        """Return this frame's events, sleeping until input (or the idle frame) when the screen is idle."""
+        if self.is_idle(animating):
+            event = pygame.event.wait(1000 // self.idle_fps)
+            events = [event] if event.type != pygame.NOEVENT else []
+            events += pygame.event.get()
+        else:
+            events = pygame.event.get()
+
+        if events:
+            self.notify_activity()
+            display_manager = DisplayManager()
+            events = [display_manager.translate_event(event) for event in events]  # Mouse positions on the canvas
+
+        # Hover is resolved once here, so widgets handling these events only look it up
+        UIRouter().begin_frame()
+        return events
+
+    def tick(self, animating=False):
+        """End the frame at full rate while active, or at the idle rate otherwise."""
+        fps = self.idle_fps if self.is_idle(animating) else PerformanceManager().get_fps()
+        elapsed_ms = self.clock.tick(fps)
+        self.time_at_rate[fps] = self.time_at_rate.get(fps, 0) + elapsed_ms / 1000
+        return elapsed_ms
+
+    def report(self):
+        """Print how long the game ran at each frame rate."""
+        total = sum(self.time_at_rate.values())
+        if not total:
+            return
+        for fps, seconds in sorted(self.time_at_rate.items(), reverse=True):
+            print(f"Frame Governor: {fps} FPS for {seconds:.1f}s ({seconds / total:.0%})")
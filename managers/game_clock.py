@@ -0,0 +1,63 @@
+import time
+
+
+class GameClock:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GameClock, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.game_time = 0.0  # Seconds of game time; only moves forward
+        self.time_scale = 1.0  # 2.0 runs twice as fast, 100.0 fast-forwards
+        self.paused = False
+        self.manual = False  # When True, time only moves through step()
+        self.last_real_time = time.perf_counter()
+        self.last_tick_time = 0.0
+        self._initialized = True
+
+    def sync(self):
+        """Fold the wall-clock time since the last call into game time."""
+        real_time = time.perf_counter()
+        if not self.paused and not self.manual:
+            self.game_time += (real_time - self.last_real_time) * self.time_scale
+        self.last_real_time = real_time
+
+    def now(self):
+        """Current game time in seconds; use it instead of time.time() for gameplay timers."""
+        self.sync()
+        return self.game_time
+
+    def tick(self):
+        """Game time elapsed since the previous tick; simulation loops call it once per frame."""
+        now = self.now()
+        elapsed = now - self.last_tick_time
+        self.last_tick_time = now
+        return elapsed
+
+    def set_paused(self, paused):
+        self.sync()
+        self.paused = paused
+
+    def is_paused(self):
+        return self.paused
+
+    def set_time_scale(self, time_scale):
+        self.sync()
+        self.time_scale = max(0.0, time_scale)
+
+    def set_manual(self, manual):
+        """Stop following the wall clock so time can be stepped deterministically."""
+        self.sync()
+        self.manual = manual
+
+    def step(self, seconds):
+        """Advance game time by a fixed amount (headless runs and tests)."""
+        self.sync()
+        if not self.paused:
+            self.game_time += seconds * self.time_scale
@@ -3,6 +3,32 @@ import os
 from gameplay.battle import Battle
 from gameplay.levels import Level
 from managers.save_manager import SaveManager
+from managers.asset_manager import AssetManager, get_scene_manifest
+from effects.transition import Transition
+
+LEVEL_CELL_SIZE = 512  # Map pixels per spatial cell; larger than any interaction radius
+
+
+class MapLevel:
+    # Fixed attributes instead of a per-level dict; the map and minimap read these every frame
+    __slots__ = ("id", "img", "locked_img", "map_x", "map_y", "width", "height", "interaction_radius",
+                 "unlocked", "center_x", "center_y", "radius_sq", "zoomed")
+
+    def __init__(self, level_id, img, locked_img, map_x, map_y, interaction_radius, unlocked=False):
+        """A level marker on the world map."""
+        self.id = level_id
+        self.img = img
+        self.locked_img = locked_img
+        self.map_x = map_x
+        self.map_y = map_y
+        self.width = img.get_width()
+        self.height = img.get_height()
+        self.interaction_radius = interaction_radius
+        self.unlocked = unlocked
+        self.center_x = map_x + self.width // 2
+        self.center_y = map_y + self.height // 2
+        self.radius_sq = interaction_radius ** 2
+        self.zoomed = {}  # Map zoom -> (image, locked image)
 
 class Levels:
     def __init__(self, script_dir):
@@ -10,6 +36,9 @@ class Levels:
         self.script_dir = script_dir
         self.levels = []
         self.level_images = {}
+        self.locked_level_images = {}  # Dimmed copies, made once instead of every frame
+        self.levels_by_id = {}
+        self.level_cells = {}  # (cell_x, cell_y) -> levels whose center is in that cell
         self.active_level = None
         self.screen = None
         self.hero_type = None
@@ -26,7 +55,7 @@ class Levels:
         # Load and scale images once
         for name in level_names:
             image_path = os.path.join(self.script_dir, "assets", "images", "levels", f"{name}.png")
-            original_img = pygame.image.load(image_path)
+            original_img = AssetManager().load_image(image_path)
             scaled_img = pygame.transform.scale(
                 original_img,
                 (
@@ -36,6 +65,10 @@ class Levels:
             )
             self.level_images[name] = scaled_img
 
+            locked_img = scaled_img.copy()
+            locked_img.set_alpha(100)
+            self.locked_level_images[name] = locked_img
+
         # Define level positions and interaction radii
         level_data = [
             (0, "spawn_point", 1930, 1830, 0),
@@ -62,18 +95,20 @@ class Levels:
         ]
 
         self.levels = [
-            {
-                "id": lvl_id,
-                "img": self.level_images[name],
-                "map_x": x,
-                "map_y": y,
-                "width": self.level_images[name].get_width(),
-                "height": self.level_images[name].get_height(),
-                "interaction_radius": radius,
-                "unlocked": lvl_id == 1  # Only level 1 is unlocked by default
-            }
+            MapLevel(lvl_id, self.level_images[name], self.locked_level_images[name], x, y, radius,
+                     unlocked=lvl_id == 1)  # Only level 1 is unlocked by default
             for lvl_id, name, x, y, radius in level_data
         ]
+        self.build_index()
+
+    def build_index(self):
+        """Index levels by id and by spatial cell."""
+        self.levels_by_id = {}
+        self.level_cells = {}
+        for level in self.levels:
+            self.levels_by_id[level.id] = level
+            cell = (level.center_x // LEVEL_CELL_SIZE, level.center_y // LEVEL_CELL_SIZE)
+            self.level_cells.setdefault(cell, []).append(level)
 
     def set_context(self, screen, hero_type, audio_manager=None, game_instance=None):
         """Set the screen, hero type, audio_manager and game_instance needed for the enter_level method."""
@@ -82,7 +117,11 @@ class Levels:
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
-        # Load saved levels if user is logged in
+        self.load_saved_progress()
+
+    def load_saved_progress(self):
+        """Unlock levels from the saved progress if a user is logged in."""
+        game_instance = self.game_instance
         if game_instance and hasattr(game_instance, 'is_user_logged_in') and game_instance.is_user_logged_in():
             progress = self.save_manager.load_progress()
             if progress:
@@ -90,48 +129,84 @@ class Levels:
                 for level_id in range(1, progress['level'] + 1):
                     self.unlock_level(level_id)
 
+    def reset_progress(self):
+        """Lock every level except level 1."""
+        for level in self.levels:
+            level.unlocked = level.id == 1
+
     def get_level_by_id(self, level_id):
         """Get a level by its ID."""
-        return next((l for l in self.levels if l["id"] == level_id), None)
+        return self.levels_by_id.get(level_id)
 
     def get_all_levels(self):
         """Return all levels."""
         return self.levels
 
-    def draw_levels(self, screen, map_x, map_y):
-        """Draw all levels on the map at their correct positions."""
-        for level in self.levels:
-            level_screen_x = map_x + level["map_x"]
-            level_screen_y = map_y + level["map_y"]
-
-            if not level["unlocked"]:
-                # Dim locked levels
-                locked_img = level["img"].copy()
-                locked_img.set_alpha(100)
-                screen.blit(locked_img, (level_screen_x, level_screen_y))
-            else:
-                screen.blit(level["img"], (level_screen_x, level_screen_y))
+    def get_level_images(self, level, zoom):
+        """A level's unlocked and locked images for a map zoom, scaled on first use."""
+        if zoom == 1:
+            return level.img, level.locked_img
+        images = level.zoomed.get(zoom)
+        if images is None:
+            size = (max(1, int(level.width * zoom)), max(1, int(level.height * zoom)))
+            img = pygame.transform.smoothscale(level.img, size)
+            locked_img = img.copy()
+            locked_img.set_alpha(100)
+            images = level.zoomed[zoom] = (img, locked_img)
+        return images
 
-    def check_proximity(self, char_map_x, char_map_y):
-        """Check if character is near any level and return the level ID if so."""
+    def draw_levels(self, screen, map_x, map_y, zoom=1.0):
+        """Draw the levels that are on screen at their correct positions."""
+        screen_width, screen_height = screen.get_size()
+        blits = []
         for level in self.levels:
-            if not level["unlocked"]:
+            level_screen_x = map_x + round(level.map_x * zoom)
+            level_screen_y = map_y + round(level.map_y * zoom)
+
+            # Skip markers outside the viewport
+            if (level_screen_x >= screen_width or level_screen_y >= screen_height or
+                    level_screen_x + level.width * zoom <= 0 or level_screen_y + level.height * zoom <= 0):
                 continue
 
-            level_center_x = level["map_x"] + level["width"] // 2
-            level_center_y = level["map_y"] + level["height"] // 2
+            # Locked levels use their pre-dimmed image
+            img, locked_img = self.get_level_images(level, zoom)
+            blits.append((img if level.unlocked else locked_img, (level_screen_x, level_screen_y)))
+        screen.blits(blits, doreturn=False)
+
+    def check_proximity(self, char_map_x, char_map_y):
+        """Check if character is near any level and return the level ID if so."""
+        # Only the character's cell and its neighbours can hold a level in range
+        cell_x = int(char_map_x // LEVEL_CELL_SIZE)
+        cell_y = int(char_map_y // LEVEL_CELL_SIZE)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for level in self.level_cells.get((cell_x + dx, cell_y + dy), ()):
+                    if not level.unlocked:
+                        continue
 
-            distance = ((char_map_x - level_center_x) ** 2 +
-                        (char_map_y - level_center_y) ** 2) ** 0.5
+                    # Compare squared distances to avoid the square root
+                    distance_sq = ((char_map_x - level.center_x) ** 2 +
+                                   (char_map_y - level.center_y) ** 2)
+                    if distance_sq <= level.radius_sq:
+                        return level.id
+        return None
 
-            if distance <= level["interaction_radius"]:
-                return level["id"]
+    def get_level_at(self, map_x, map_y):
+        """Return the level whose marker covers a map position, or None."""
+        cell_x = int(map_x // LEVEL_CELL_SIZE)
+        cell_y = int(map_y // LEVEL_CELL_SIZE)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for level in self.level_cells.get((cell_x + dx, cell_y + dy), ()):
+                    if (level.map_x <= map_x < level.map_x + level.width and
+                            level.map_y <= map_y < level.map_y + level.height):
+                        return level
         return None
 
     def set_active_level(self, level_id):
         """Set the active level."""
         level = self.get_level_by_id(level_id)
-        if level and level["unlocked"]:
+        if level and level.unlocked:
             self.active_level = level_id
 
     def unlock_level(self, level_id):
@@ -140,23 +215,27 @@ class Levels:
             return  # Prevent unlocking beyond max level
         level = self.get_level_by_id(level_id)
         if level:
-            level["unlocked"] = True
+            level.unlocked = True
 
     def enter_level(self, on_enter=None):
         """Enter the currently active level."""
         if self.active_level is not None and self.screen is not None:
             print(f"Level {self.active_level} is clicked")
 
-            level = Level(self.script_dir, self.active_level)
+            def build_battle():
+                level = Level(self.script_dir, self.active_level)
+                return Battle(
+                    self.screen,
+                    self.script_dir,
+                    level,
+                    self.hero_type,
+                    self.audio_manager,
+                    game_instance=self.game_instance
+                )
 
-            battle = Battle(
-                self.screen,
-                self.script_dir,
-                level,
-                self.hero_type,
-                self.audio_manager,
-                game_instance=self.game_instance
-            )
+            # The battle's images load while the map wipes away
+            battle = Transition(self.screen, style="wipe").run(
+                build_battle, get_scene_manifest(self.script_dir, "battle"), draw_incoming=Battle.draw)
             victory = battle.run()
             if victory:
                 print(f"Victory! Level {self.active_level} completed.")
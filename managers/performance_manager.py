@@ -0,0 +1,193 @@
+import pygame
+import os
+import json
+import platform
+from settings import (SCREEN_WIDTH, SCREEN_HEIGHT, PERFORMANCE_PRESETS, PERFORMANCE_PRESET_ORDER,
+                      PERFORMANCE_CONFIG_PATH)
+from managers.display_manager import DisplayManager, px
+from managers.asset_manager import AssetManager
+
+
+class PerformanceManager:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PerformanceManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.config_path = PERFORMANCE_CONFIG_PATH
+        self.machine = platform.node() or "default"  # Presets are saved per machine
+        self.preset = None
+        self.settings = dict(PERFORMANCE_PRESETS["high"])
+        self.benchmark_results = {}  # preset -> average frame time in ms
+        self.load()
+        self._initialized = True
+
+    def load(self):
+        """Read the saved preset for this machine, if any."""
+        try:
+            with open(self.config_path, "r") as f:
+                entry = json.load(f).get(self.machine, {})
+        except (OSError, ValueError):
+            return
+
+        if entry.get("preset") in PERFORMANCE_PRESETS:
+            self.preset = entry["preset"]
+            self.benchmark_results = entry.get("benchmark", {})
+
+    def save(self):
+        """Write the current preset for this machine, keeping other machines' entries."""
+        try:
+            with open(self.config_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+        data[self.machine] = {"preset": self.preset, "benchmark": self.benchmark_results}
+        try:
+            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            with open(self.config_path, "w") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"Performance Manager: Could not save settings: {e}")
+
+    def has_saved_preset(self):
+        return self.preset is not None
+
+    def get_preset(self):
+        return self.preset or "high"
+
+    def get(self, key):
+        return self.settings[key]
+
+    def get_fps(self):
+        return self.settings["fps_cap"]
+
+    def apply_preset(self, name, save=True):
+        """Switch every performance setting to the named preset."""
+        if name not in PERFORMANCE_PRESETS:
+            print(f"Performance Manager: Unknown preset {name}")
+            return
+
+        self.preset = name
+        self.settings = dict(PERFORMANCE_PRESETS[name])
+        display_manager = DisplayManager()
+        display_manager.set_render_resolution(self.settings["render_resolution"])
+        display_manager.set_dirty_rects(self.settings["dirty_rects"])
+        print(f"Performance Manager: Using {name} preset")
+        if save:
+            self.save()
+
+    def run_benchmark(self, script_dir, frames=40):
+        """Time the map, a battle and a menu under each preset, then pick the best preset that keeps its FPS cap.
+
+        Every preset is measured with its own settings applied: canvas size, dirty rects, map tile cache,
+        NPC crowd and particle pool.
+        """
+        from maps.map import MAP_SCALE_FACTOR, MAP_MIP_LEVELS
+        from maps.map_tiles import MapMipCache
+        from maps.map_npcs import NPCCrowd, load_looks
+        from maps.navigation import Navigation
+        from maps.collision_compiler import load_barriers
+        from effects.particles import ParticleSystem
+
+        images_dir = os.path.join(script_dir, "assets", "images")
+        asset_manager = AssetManager()
+        try:
+            map_image = asset_manager.load_image(os.path.join(images_dir, "map", "lspu_map.png"), alpha=False)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Performance Manager: Map benchmark skipped: {e}")
+            map_image = None
+        try:
+            battle_image = asset_manager.load_image(
+                os.path.join(images_dir, "battle", "backgrounds", "level1_bg.png"), alpha=False)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Performance Manager: Battle benchmark skipped: {e}")
+            battle_image = None
+
+        if map_image:
+            # The crowd walks the real campus, so its collision work matches the game's
+            map_width = map_image.get_width() * MAP_SCALE_FACTOR
+            map_height = map_image.get_height() * MAP_SCALE_FACTOR
+            navigation = Navigation(load_barriers(), map_width, map_height)
+            looks = load_looks(script_dir)
+
+        display_manager = DisplayManager()
+        chosen = PERFORMANCE_PRESET_ORDER[0]
+        self.benchmark_results = {}
+
+        # Try the best preset first; stop at the first one that runs fast enough
+        for name in reversed(PERFORMANCE_PRESET_ORDER):
+            preset = PERFORMANCE_PRESETS[name]
+            pygame.event.pump()  # Keep the window responsive between runs
+            self.apply_preset(name, save=False)
+            canvas = display_manager.canvas
+            scale = display_manager.scale
+            width, height = display_manager.render_size
+            scenes = {}
+
+            if map_image:
+                tiles = MapMipCache(map_image, MAP_SCALE_FACTOR, MAP_MIP_LEVELS, max_tiles=preset["map_tile_cache"])
+                crowd = NPCCrowd(navigation, looks, preset["map_npcs"], map_width, map_height, seed=1)
+
+                def draw_map(frame):
+                    # Scroll diagonally across the map like a walking player, at the normal zoom
+                    view_x = -px((frame * 9) % max(1, map_width - SCREEN_WIDTH))
+                    view_y = -px((frame * 9) % max(1, map_height - SCREEN_HEIGHT))
+                    crowd.update(1 / 60)
+                    canvas.fill((0, 0, 0))
+                    tiles.draw(canvas, view_x, view_y, scale)
+                    crowd.draw(canvas, view_x, view_y, zoom=scale)
+                scenes["map"] = draw_map
+
+            background = pygame.Surface((width, height)).convert()
+            if battle_image:
+                background = pygame.transform.scale(battle_image, (width, height)).convert()
+                # A full particle pool, the most a streak of answers can put on screen
+                particles = ParticleSystem(preset["particles"])
+                particles.emit(preset["particles"], width // 2, height // 2,
+                               particles.correct_sprites + particles.confetti_sprites,
+                               speed=(0, px(60)), life=(100, 100), spread=(width // 2, height // 2))
+
+                def draw_battle(frame):
+                    display_manager.draw_background(background)
+                    particles.update(1 / 60)
+                    particles.draw(canvas)
+                scenes["battle"] = draw_battle
+
+            # An idle menu where only a hovered button changes, the frames dirty rects are meant for
+            button = pygame.Rect(px(760), px(490), px(400), px(100))
+
+            def draw_menu(frame):
+                if frame == 0:
+                    display_manager.draw_background(background)  # The first frame is always presented whole
+                else:
+                    display_manager.begin_partial_frame()
+                canvas.fill((90, 60, 30) if frame % 2 else (120, 80, 40), button)
+                display_manager.mark_dirty(button)
+            scenes["menu"] = draw_menu
+
+            # The preset is only as fast as its slowest scene
+            worst_ms = 0
+            for scene, draw_frame in scenes.items():
+                start = pygame.time.get_ticks()
+                for frame in range(frames):
+                    draw_frame(frame)
+                    display_manager.present()
+                average_ms = (pygame.time.get_ticks() - start) / frames
+                print(f"Performance Manager: {name} preset {scene} averaged {average_ms:.2f} ms per frame")
+                worst_ms = max(worst_ms, average_ms)
+            self.benchmark_results[name] = round(worst_ms, 2)
+
+            # Leave a quarter of the frame budget for game logic
+            if worst_ms <= 1000 / preset["fps_cap"] * 0.75:
+                chosen = name
+                break
+
+        self.apply_preset(chosen)
+        return chosen
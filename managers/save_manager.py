@@ -50,6 +50,13 @@ class SaveManager:
                                   id
                               ))''')
 
+            # Older tables predate the explored map bitset
+            try:
+                cursor.execute("ALTER TABLE game_progress ADD COLUMN explored_cells BLOB DEFAULT NULL")
+            except mysql.connector.Error as e:
+                if e.errno != 1060:  # Duplicate column: already migrated
+                    raise
+
             conn.commit()
             cursor.close()
             conn.close()
@@ -173,6 +180,51 @@ class SaveManager:
             print(f"Save Manager: Error updating level: {e}")
             return False
 
+    def save_explored(self, explored):
+        """Save the explored map cells as a packed bitset"""
+        current_user = self.auth_manager.get_current_user()
+        if not current_user:
+            return False
+
+        try:
+            conn = mysql.connector.connect(**self.conn_params)
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE game_progress SET explored_cells = %s WHERE user_id = %s",
+                (bytes(explored), current_user["id"])
+            )
+            updated = cursor.rowcount > 0
+            conn.commit()
+            cursor.close()
+            conn.close()
+            if not updated:
+                print("Save Manager: No existing progress found to save explored map")
+            return updated
+        except Exception as e:
+            print(f"Save Manager: Error saving explored map: {e}")
+            return False
+
+    def load_explored(self):
+        """Load the explored map bitset, or None if nothing was saved"""
+        current_user = self.auth_manager.get_current_user()
+        if not current_user:
+            return None
+
+        try:
+            conn = mysql.connector.connect(**self.conn_params)
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT explored_cells FROM game_progress WHERE user_id = %s",
+                (current_user["id"],)
+            )
+            result = cursor.fetchone()
+            cursor.close()
+            conn.close()
+            return bytes(result[0]) if result and result[0] is not None else None
+        except Exception as e:
+            print(f"Save Manager: Error loading explored map: {e}")
+            return None
+
     def reset_progress(self):
         """Reset the player's progress to level 1"""
         current_user = self.auth_manager.get_current_user()
@@ -195,9 +247,9 @@ class SaveManager:
                 # Get the current hero_type to maintain it
                 hero_type = result[0]
 
-                # Reset the level to 1 but keep the same hero_type
+                # Reset the level to 1 and forget the explored map, but keep the same hero_type
                 cursor.execute(
-                    "UPDATE game_progress SET current_level = 1 WHERE user_id = %s",
+                    "UPDATE game_progress SET current_level = 1, explored_cells = NULL WHERE user_id = %s",
                     (current_user["id"],)
                 )
                 conn.commit()
@@ -0,0 +1,93 @@
+import os
+import pygame
+from managers.asset_manager import AssetManager, AssetPreloader
+from managers.display_manager import DisplayManager
+from settings import SPRITE_WARM_BUDGET_MS
+
+
+class SpriteVariants:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SpriteVariants, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.variants = {}  # (path, scale, flip_x, tint, canvas scale) -> transformed surface
+        self.warm_queue = []  # (key, on_built) still to build in the background
+        self.warm_steps = None  # Iterator returned by the last on_built, advanced a step at a time
+        self.preloader = None  # Decodes the queued images that are not loaded yet
+        self._initialized = True
+
+    def get(self, path, scale=1, flip_x=False, tint=None):
+        """An image scaled, mirrored and tinted, made on first use and shared after that.
+
+        scale is relative to the image's layout size; the variant is baked for the current canvas.
+        """
+        key = (os.path.normpath(path), scale, flip_x, None if tint is None else tuple(tint), DisplayManager().scale)
+        surface = self.variants.get(key)
+        if surface is None:
+            surface = self.variants[key] = self.build(key)
+        return surface
+
+    def build(self, key):
+        # Each step starts from the cached variant before it, so e.g. a flipped copy reuses the scaled one
+        path, scale, flip_x, tint, canvas_scale = key
+        if tint is not None:
+            surface = self.get(path, scale, flip_x).copy()
+            surface.fill(tint + (255,) * (4 - len(tint)), special_flags=pygame.BLEND_RGBA_MULT)
+            return surface
+        if flip_x:
+            return pygame.transform.flip(self.get(path, scale), True, False)
+        image = AssetManager().load_image(path)
+        scale *= canvas_scale
+        if scale == 1:
+            return image
+        return pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+
+    def warm(self, keys, on_built=None):
+        """Queue (path, scale, flip_x, tint) variants to be made by poll().
+
+        on_built(key, surface) runs after each; if it returns an iterator, poll() advances it over the next frames.
+        """
+        queued = [(key, on_built) for key in keys]
+        self.warm_queue += queued
+
+        # Images that are not loaded yet are decoded on worker threads first
+        paths = dict.fromkeys(os.path.normpath(key[0]) for key, _ in queued)
+        manifest = [(0, path, True) for path in paths]
+        self.preloader = AssetPreloader(manifest)
+        self.preloader.start()
+
+    def poll(self, time_budget_ms=SPRITE_WARM_BUDGET_MS):
+        """Make queued variants until the frame's time budget is spent."""
+        if self.is_warm():
+            return
+        start = pygame.time.get_ticks()
+        if self.preloader is not None:
+            self.preloader.poll(time_budget_ms)
+            if not self.preloader.done():
+                return
+            self.preloader = None
+
+        while not self.is_warm() and pygame.time.get_ticks() - start < time_budget_ms:
+            if self.warm_steps is not None:
+                if next(self.warm_steps, None) is None:
+                    self.warm_steps = None
+                continue
+
+            key, on_built = self.warm_queue.pop(0)
+            try:
+                surface = self.get(*key)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Sprite Variants: Could not build {key}: {e}")
+                continue
+            if on_built is not None:
+                self.warm_steps = on_built(key, surface)
+
+    def is_warm(self):
+        return not self.warm_queue and self.warm_steps is None
@@ -0,0 +1,62 @@
+import pygame
+from settings import SURFACE_POOL_DEBUG
+
+
+class SurfacePool:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SurfacePool, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.scratch = {}  # (size, flags) -> reusable surface
+        self.overlays = {}  # (size, color) -> filled surface that never changes
+        self.debug = SURFACE_POOL_DEBUG
+        # Surfaces the pool had to create since the last end_frame(); only pooled paths are counted,
+        # surfaces made elsewhere (font renders, copies, transforms) do not show up here
+        self.frame_misses = 0
+        self.total_misses = 0
+        self._initialized = True
+
+    def allocate(self, size, flags):
+        self.frame_misses += 1
+        self.total_misses += 1
+        return pygame.Surface(size, flags)
+
+    def get_scratch(self, size, flags=pygame.SRCALPHA, fill=(0, 0, 0, 0)):
+        """A surface to draw on and blit right away; the next request for the same size and flags reuses it.
+
+        It is filled with fill first, or handed back as last drawn when fill is None.
+        """
+        key = (tuple(size), flags)
+        surface = self.scratch.get(key)
+        if surface is None:
+            surface = self.scratch[key] = self.allocate(key[0], flags)
+        if fill is not None:
+            surface.fill(fill)
+        return surface
+
+    def get_overlay(self, size, color):
+        """A surface filled with an RGBA color, made once and shared by every screen that dims with it."""
+        key = (tuple(size), tuple(color))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = self.overlays[key] = self.allocate(key[0], pygame.SRCALPHA)
+            overlay.fill(color)
+        return overlay
+
+    def end_frame(self):
+        """Reset the per-frame counter; in debug mode report frames in which the pool had to create a surface."""
+        if self.debug and self.frame_misses:
+            print(f"Surface Pool: {self.frame_misses} pooled surfaces created this frame ({self.total_misses} total)")
+        self.frame_misses = 0
+
+    def clear(self):
+        """Drop every pooled surface, e.g. after the layout size changed."""
+        self.scratch = {}
+        self.overlays = {}
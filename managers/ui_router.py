@@ -0,0 +1,151 @@
+import weakref
+import pygame
+from settings import UI_HIT_CELL_SIZE
+from managers.display_manager import DisplayManager
+
+
+class UIRouter:
+    _instance = None
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(UIRouter, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.cell_size = UI_HIT_CELL_SIZE
+        self.cells = {}  # (column, row) -> keys of the widgets whose rect touches that cell
+        self.entries = {}  # key -> (widget reference, registered rect, scope, registration order)
+        self.order = 0
+        self.mouse_pos = (0, 0)
+        self.hovered = set()  # Keys of every widget under the cursor this frame
+        self.hits_pos = None  # Position of the last hit test and its result
+        self.hits_keys = ()
+        self._initialized = True
+
+    def register(self, widget, rect=None, scope=None):
+        """Make a widget hit-testable at rect (its own rect by default); scope groups widgets of one screen.
+
+        Widgets that support weak references are dropped when their screen is gone, others (such as
+        plain dicts) stay until they are unregistered.
+        """
+        key = id(widget)
+        if key in self.entries:
+            self.remove(key)
+        try:
+            reference = weakref.ref(widget, lambda _, key=key: self.remove(key))
+        except TypeError:
+            reference = lambda: widget
+        rect = pygame.Rect(widget.rect if rect is None else rect)
+        self.order += 1
+        self.entries[key] = (reference, rect, scope, self.order)
+        for cell in self.cells_for(rect):
+            self.cells.setdefault(cell, []).append(key)
+        self.hits_pos = None
+
+    def clear(self):
+        """Forget every registered widget, e.g. when the screens are built again."""
+        self.cells = {}
+        self.entries = {}
+        self.hovered = set()
+        self.hits_pos = None
+
+    def unregister(self, widget):
+        self.remove(id(widget))
+
+    def set_scope(self, scope, widgets):
+        """Make widgets the whole registered set of a scope, e.g. when a screen opens or swaps dialogs.
+
+        Widgets already registered under the scope keep their place and hover; an empty list clears it.
+        """
+        keep = {id(widget) for widget in widgets}
+        self.unregister_scope(scope, keep)
+        for widget in widgets:
+            entry = self.entries.get(id(widget))
+            if entry is None or entry[2] is not scope:
+                self.register(widget, scope=scope)
+
+    def unregister_scope(self, scope, keep=()):
+        """Drop every widget a screen registered, e.g. when the screen closes."""
+        for key in [key for key, entry in self.entries.items() if entry[2] is scope and key not in keep]:
+            self.remove(key)
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for cell in self.cells_for(entry[1]):
+            keys = self.cells.get(cell)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del self.cells[cell]
+        if key in self.hovered:
+            self.hovered.discard(key)
+            self.push_hover(entry[0](), False)  # So the widget is idle when it is registered again
+        self.hits_pos = None
+
+    def move(self, widget, rect=None):
+        """Re-index a registered widget after its rect changed."""
+        entry = self.entries.get(id(widget))
+        if entry is not None:
+            self.register(widget, rect, entry[2])
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        for column in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield column, row
+
+    def keys_at(self, pos):
+        """Keys of the registered widgets under pos, topmost (latest registered) first."""
+        if pos == self.hits_pos:
+            return self.hits_keys
+        keys = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ())
+        hits = [key for key in keys if self.entries[key][1].collidepoint(pos)]
+        hits.sort(key=lambda key: self.entries[key][3], reverse=True)
+        self.hits_pos, self.hits_keys = tuple(pos), hits
+        return hits
+
+    def begin_frame(self):
+        """Read the mouse once and resolve which widgets it is over for the whole frame."""
+        self.mouse_pos = DisplayManager().get_mouse_pos()  # Widgets are laid out on the canvas
+        hovered = set(self.keys_at(self.mouse_pos))
+        changed = hovered ^ self.hovered
+        self.hovered = hovered
+
+        # Only widgets the cursor entered or left hear about it
+        for key in changed:
+            self.push_hover(self.entries[key][0](), key in hovered)
+
+    def push_hover(self, widget, hovered):
+        set_hovered = getattr(widget, "set_hovered", None)
+        if set_hovered is not None:
+            set_hovered(hovered)
+
+    def widget_at(self, pos, scope=None):
+        """Topmost visible, active registered widget of a scope under pos, or None."""
+        for key in self.keys_at(pos):
+            reference, _, widget_scope, _ = self.entries[key]
+            widget = reference()
+            if widget is None or (scope is not None and widget_scope is not scope):
+                continue
+            if getattr(widget, "visible", True) and getattr(widget, "active", True):
+                return widget
+        return None
+
+    def dispatch(self, event, scope=None):
+        """Hand a click to the widget of a scope under it only; returns that widget, or None."""
+        if event.type != pygame.MOUSEBUTTONDOWN:
+            return None
+        widget = self.widget_at(event.pos, scope)
+        if widget is not None:
+            widget.update(event)
+        return widget
+
+    def hovered_widget(self, scope=None):
+        """Topmost widget of a scope under the cursor this frame, or None."""
+        return self.widget_at(self.mouse_pos, scope)
@@ -0,0 +1,159 @@
+import os
+import json
+import struct
+import hashlib
+from array import array
+
+# Compiled barrier file layout (little endian):
+#   header   MAGIC, version, source sha256, radius, cell size, columns, rows, segment count, index count
+#   segments float32 x1, y1, x2, y2, width per segment
+#   offsets  uint32 per grid cell + 1; segments of cell i are indices[offsets[i]:offsets[i + 1]]
+#   indices  uint32 segment indices
+MAGIC = b"FQCB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sI32sffIIII")
+SEGMENT_FIELDS = 5
+GRID_CELL_SIZE = 256  # Map pixels per broad-phase cell
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SOURCE_PATH = os.path.join(DATA_DIR, "collision_barriers.json")
+COMPILED_PATH = os.path.join(DATA_DIR, "collision_barriers.bin")
+
+
+class CollisionData:
+    __slots__ = ("segments", "radius", "cell_size", "columns", "rows", "offsets", "indices", "source_hash")
+
+    def __init__(self, segments, radius, cell_size, columns, rows, offsets, indices, source_hash=b""):
+        """Flat segment arrays and the broad-phase grid built over them."""
+        self.segments = segments  # array('f'), SEGMENT_FIELDS values per segment
+        self.radius = radius
+        self.cell_size = cell_size
+        self.columns = columns
+        self.rows = rows
+        self.offsets = offsets  # array('I')
+        self.indices = indices  # array('I')
+        self.source_hash = source_hash
+
+
+def read_source(source_path=SOURCE_PATH):
+    """Turn the declarative barrier file into a flat segment array and the character radius."""
+    with open(source_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    default_width = data.get("line_width", 3)
+    segments = array("f")
+    for area in data["areas"]:
+        for shape in area["shapes"]:
+            width = shape.get("width", default_width)
+            if "line" in shape:
+                (x1, y1), (x2, y2) = shape["line"]
+                segments.extend((x1, y1, x2, y2, width))
+            elif "rectangle" in shape:
+                x, y, w, h = shape["rectangle"]
+                segments.extend((x, y, x + w, y, width))  # Top
+                segments.extend((x + w, y, x + w, y + h, width))  # Right
+                segments.extend((x, y + h, x + w, y + h, width))  # Bottom
+                segments.extend((x, y, x, y + h, width))  # Left
+            elif "polygon" in shape:
+                points = shape["polygon"]
+                for i in range(len(points)):
+                    (x1, y1), (x2, y2) = points[i], points[(i + 1) % len(points)]
+                    segments.extend((x1, y1, x2, y2, width))
+            else:
+                print(f"Collision Compiler: Unknown shape in {area.get('name')}: {shape}")
+    return segments, data.get("character_radius", 20)
+
+
+def build_grid(segments, radius, cell_size=GRID_CELL_SIZE):
+    """Bucket each segment into every cell where a character could touch it."""
+    count = len(segments) // SEGMENT_FIELDS
+    if count == 0:
+        return CollisionData(segments, radius, cell_size, 0, 0, array("I", [0]), array("I"))
+
+    max_x = max(max(segments[i], segments[i + 2]) for i in range(0, len(segments), SEGMENT_FIELDS))
+    max_y = max(max(segments[i + 1], segments[i + 3]) for i in range(0, len(segments), SEGMENT_FIELDS))
+    columns = int((max_x + radius) // cell_size) + 2
+    rows = int((max_y + radius) // cell_size) + 2
+
+    cells = [[] for _ in range(columns * rows)]
+    for index in range(count):
+        x1, y1, x2, y2, width = segments[index * SEGMENT_FIELDS:(index + 1) * SEGMENT_FIELDS]
+        reach = radius + width / 2  # Collision distance from the segment
+        first_col = max(0, int((min(x1, x2) - reach) // cell_size))
+        last_col = min(columns - 1, int((max(x1, x2) + reach) // cell_size))
+        first_row = max(0, int((min(y1, y2) - reach) // cell_size))
+        last_row = min(rows - 1, int((max(y1, y2) + reach) // cell_size))
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cells[row * columns + col].append(index)
+
+    offsets = array("I", [0])
+    indices = array("I")
+    for cell in cells:
+        indices.extend(cell)
+        offsets.append(len(indices))
+    return CollisionData(segments, radius, cell_size, columns, rows, offsets, indices)
+
+
+def hash_source(source_path=SOURCE_PATH):
+    with open(source_path, "rb") as f:
+        return hashlib.sha256(f.read() + bytes([FORMAT_VERSION])).digest()
+
+
+def compile_barriers(source_path=SOURCE_PATH, output_path=COMPILED_PATH):
+    """Compile the barrier file into the binary format and return the data."""
+    segments, radius = read_source(source_path)
+    data = build_grid(segments, radius)
+    data.source_hash = hash_source(source_path)
+
+    try:
+        with open(output_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, data.source_hash, data.radius, data.cell_size,
+                                data.columns, data.rows, len(segments) // SEGMENT_FIELDS, len(data.indices)))
+            f.write(segments.tobytes())
+            f.write(data.offsets.tobytes())
+            f.write(data.indices.tobytes())
+        print(f"Collision Compiler: {len(segments) // SEGMENT_FIELDS} segments, "
+              f"{data.columns}x{data.rows} grid -> {output_path}")
+    except OSError as e:
+        print(f"Collision Compiler: Could not write {output_path}: {e}")
+    return data
+
+
+def load_compiled(path=COMPILED_PATH):
+    """Read a compiled barrier file in one go. Returns None if it is missing or malformed."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version, source_hash, radius, cell_size, columns, rows, segment_count, index_count = \
+            HEADER.unpack_from(blob)
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+
+    position = HEADER.size
+    def take(typecode, count):
+        nonlocal position
+        values = array(typecode)
+        size = count * values.itemsize
+        values.frombytes(blob[position:position + size])
+        position += size
+        return values
+
+    segments = take("f", segment_count * SEGMENT_FIELDS)
+    offsets = take("I", columns * rows + 1)
+    indices = take("I", index_count)
+    return CollisionData(segments, radius, cell_size, columns, rows, offsets, indices, source_hash)
+
+
+def load_barriers(source_path=SOURCE_PATH, compiled_path=COMPILED_PATH):
+    """Load the compiled barriers, recompiling first if the source file changed."""
+    data = load_compiled(compiled_path)
+    if data is not None and (not os.path.exists(source_path) or data.source_hash == hash_source(source_path)):
+        return data
+    return compile_barriers(source_path, compiled_path)
+
+
+if __name__ == "__main__":
+    compile_barriers()
@@ -1,16 +1,49 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+import random
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from ui.back_button import BackButton
 from ui.button import Button
 from .map_character_movement import MapCharacterMovement
 from .map_collision import MapCollisionHandler
 from .map_collision_setup import MapCollisionSetup
+from .map_tiles import MapMipCache
+from .navigation import Navigation
+from .map_npcs import NPCCrowd, load_looks
+from .minimap import Minimap
+from effects.particles import ParticleSystem
 from managers.level_manager import Levels
+from managers.asset_manager import AssetManager
+from managers.save_manager import SaveManager
+from managers.display_manager import DisplayManager, px
+from managers.performance_manager import PerformanceManager
+from managers.frame_governor import FrameGovernor
+from managers.sprite_variants import SpriteVariants
+from managers.fixed_timestep import FixedTimestep, interpolate
+from managers.game_clock import GameClock
+from managers.ui_router import UIRouter
+
+MAP_SCALE_FACTOR = 3  # Map pixels per pixel of lspu_map.png
+MAP_ZOOM_LEVELS = [0.25, 0.35, 0.5, 0.7, 1.0]  # Mouse wheel steps, from overview to the normal close-up
+MAP_MIP_LEVELS = (0.25, 0.5, 1.0)  # Zooms the map tiles are cached at; other zooms shrink the nearest larger one
+AUTO_WALK_STUCK_STEPS = 30  # Give up auto-walking after this many steps without progress
+METEOR_SECONDS = (4.0, 10.0)  # Random wait between shooting stars over the map
 
 class Map:
     def __init__(self, screen, script_dir, go_back_callback, audio_manager, hero_type=None, game_instance=None):
         """Initialize the LSPU map with a Back button and navigation features."""
+        for _ in self.load(screen, script_dir, go_back_callback, audio_manager, hero_type, game_instance):
+            pass
+
+    @classmethod
+    def build(cls, *args, **kwargs):
+        """Build a map one stage at a time for a transition, yielding the progress between stages."""
+        lspu_map = cls.__new__(cls)
+        yield from lspu_map.load(*args, **kwargs)
+        return lspu_map
+
+    def load(self, screen, script_dir, go_back_callback, audio_manager, hero_type=None, game_instance=None):
+        """Set up the map, yielding the fraction done after each slow stage."""
         self.script_dir = script_dir
         self.screen = screen
         self.running = True
@@ -20,6 +53,7 @@ class Map:
         # Initialize collision handler
         self.collision_handler = MapCollisionHandler()
         self.setup_map_collision_barriers()
+        yield 0.15
 
         # Set the hero type (boy or girl)
         self.hero_type = hero_type if hero_type else "boy"  # Default to boy if not specified
@@ -32,26 +66,49 @@ class Map:
             self.audio_manager.play_music()
 
         # Load and scale the map
-        self.map_original = pygame.image.load(os.path.join(script_dir, "assets", "images", "map", "lspu_map.png"))
-        SCALE_FACTOR = 3
-        self.map_width = int(self.map_original.get_width() * SCALE_FACTOR)
-        self.map_height = int(self.map_original.get_height() * SCALE_FACTOR)
-        self.map = pygame.transform.scale(self.map_original, (self.map_width, self.map_height))
+        self.map_original = AssetManager().load_image(
+            os.path.join(script_dir, "assets", "images", "map", "lspu_map.png"), alpha=False)
+        self.map_width = int(self.map_original.get_width() * MAP_SCALE_FACTOR)
+        self.map_height = int(self.map_original.get_height() * MAP_SCALE_FACTOR)
+        # The map is scaled in tiles; positions stay in full-scale map pixels
+        self.display_manager = DisplayManager()
+        self.performance_manager = PerformanceManager()
+        self.map_tiles = None
+        self.refresh_display()
+        self.zoom_index = len(MAP_ZOOM_LEVELS) - 1
+        self.zoom = MAP_ZOOM_LEVELS[self.zoom_index]
+        yield 0.3
+
+        # Distance field for collision and the grid for click-to-move pathfinding
+        self.navigation = Navigation(self.collision_handler.data, self.map_width, self.map_height)
+        self.auto_path = None  # Waypoints in map pixels while walking to a clicked level
+        self.auto_walk_stuck = 0
+        yield 0.5
+
+        # Students and monsters wandering the campus; the preset decides how many
+        self.npcs = NPCCrowd(self.navigation, load_looks(script_dir), self.performance_manager.get("map_npcs"),
+                             self.map_width, self.map_height)
+        yield 0.65
+
+        # Shooting stars crossing the screen now and then
+        self.ambience = ParticleSystem(16)
+        self.meteor_timer = random.uniform(*METEOR_SECONDS)
+
+        # Corner overview with the explored parts of the map
+        self.minimap = Minimap(self.map_original, self.map_width, self.map_height)
+        yield 0.75
 
         # Initial map position - center the map
         self.map_x = (SCREEN_WIDTH - self.map_width) // 2
         self.map_y = (SCREEN_HEIGHT - self.map_height) // 2
 
         # Initialize the Back button
-        self.back_button = BackButton(screen, script_dir, self.go_back, position=(100, 100), scale=0.25)
+        self.back_button = BackButton(screen, script_dir, self.go_back, position=(px(100), px(100)), scale=0.25)
 
-        # Initialize character movement handler
-        self.character_movement = MapCharacterMovement(
-            self.hero_type,
-            self.script_dir,
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT // 2
-        )
+        # Initialize character movement handler; one per hero so swapping back is free
+        self.character_movements = {}
+        self.character_movement = self.get_character_movement(self.hero_type)
+        yield 0.85
 
         # Initialize levels
         self.levels_manager = Levels(script_dir)
@@ -62,15 +119,98 @@ class Map:
             self.audio_manager,
             game_instance=self.game_instance  # Assuming Map is created with game_instance reference
         )
+        yield 0.95
 
         # Initialize enter button (but don't create it yet - will be created dynamically)
         self.enter_button = None
 
-        # Initialize clock for the run method
-        self.clock = pygame.time.Clock()
+        # Frame governor idles the map while the character stands still
+        self.frame_governor = FrameGovernor()
+        # Movement runs in fixed steps; drawing interpolates between the last two
+        self.timestep = FixedTimestep()
+        self.game_clock = GameClock()
+
+        # The user whose progress the levels show; re-entry only reloads it if this changes
+        self.session_user_id = self.get_current_user_id()
+        self.load_explored()
 
         # Set the character to spawn at level 0
         self.spawn_at_level(0)
+        self.store_previous_positions()
+
+    def get_character_movement(self, hero_type):
+        """Return the movement handler for a hero, loading its animations on first use."""
+        movement = self.character_movements.get(hero_type)
+        if movement is None:
+            movement = MapCharacterMovement(hero_type, self.script_dir, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            self.character_movements[hero_type] = movement
+        return movement
+
+    def get_current_user_id(self):
+        if self.game_instance and hasattr(self.game_instance, 'is_user_logged_in') and self.game_instance.is_user_logged_in():
+            current_user = self.game_instance.get_current_user()
+            return current_user.get('id') if current_user else None
+        return None
+
+    def refresh_display(self):
+        """Build the tile cache on the first visit, or resize it if the preset changed since the last one."""
+        if self.map_tiles is None:
+            self.map_tiles = MapMipCache(self.map_original, MAP_SCALE_FACTOR, MAP_MIP_LEVELS,
+                                          max_tiles=self.performance_manager.get("map_tile_cache"))
+        else:
+            self.map_tiles.set_max_tiles(self.performance_manager.get("map_tile_cache"))
+
+    def resume(self, hero_type=None):
+        """Re-enter the map kept from an earlier visit, keeping position, camera and unlocked levels."""
+        self.running = True
+
+        hero_type = hero_type if hero_type else self.hero_type
+        if hero_type != self.hero_type:
+            # Swap the hero in place
+            previous = self.character_movement
+            self.character_movement = self.get_character_movement(hero_type)
+            self.character_movement.character_x = previous.character_x
+            self.character_movement.character_y = previous.character_y
+            self.character_movement.direction = previous.direction
+            self.hero_type = hero_type
+            self.levels_manager.hero_type = hero_type
+
+        # Progress only has to come from the database when a different user logged in
+        user_id = self.get_current_user_id()
+        if user_id != self.session_user_id:
+            self.levels_manager.reset_progress()
+            self.levels_manager.load_saved_progress()
+            self.session_user_id = user_id
+            self.load_explored()
+            self.spawn_at_level(0)
+
+        self.refresh_display()
+        self.npcs.set_count(self.performance_manager.get("map_npcs"))
+        self.auto_path = None
+        self.store_previous_positions()
+
+    def reset_progress(self):
+        """Start over: lock the levels again and return to the spawn point."""
+        self.levels_manager.reset_progress()
+        self.minimap.reset()
+        self.spawn_at_level(0)
+        self.auto_path = None
+        self.store_previous_positions()
+
+    def load_explored(self):
+        """Restore the fog of war saved for the current user."""
+        explored = SaveManager().load_explored() if self.session_user_id is not None else None
+        self.minimap.load_explored(explored)
+
+    def save_explored(self):
+        """Save newly explored map cells with the user's progress."""
+        if self.minimap.unsaved and self.session_user_id is not None:
+            if SaveManager().save_explored(self.minimap.explored):
+                self.minimap.unsaved = False
+
+    def enter_level(self):
+        self.save_explored()
+        self.levels_manager.enter_level()
 
     def spawn_at_level(self, level_id):
         """Spawn the character at the specified level."""
@@ -81,8 +221,8 @@ class Map:
             character_screen_x = SCREEN_WIDTH // 2
             character_screen_y = SCREEN_HEIGHT // 2 + 50
             # The map needs to be positioned so that the level is under the character
-            self.map_x = character_screen_x - level["map_x"] - level["width"] // 2
-            self.map_y = character_screen_y - level["map_y"] - level["height"] // 2
+            self.map_x = character_screen_x - level.map_x - level.width // 2
+            self.map_y = character_screen_y - level.map_y - level.height // 2
 
             # Ensure map stays within bounds
             map_bounds = {
@@ -98,8 +238,9 @@ class Map:
         # Path to button images
         idle_img = os.path.join(self.script_dir, "assets", "images", "buttons", "enter level", "enter_btn_img.png")
         hover_img = os.path.join(self.script_dir, "assets", "images", "buttons", "enter level", "enter_btn_hover.png")
-        # Create button - now using the levels_manager's enter_level method
-        self.enter_button = Button(x=x, y=y, idle_img=idle_img, hover_img=hover_img, action=self.levels_manager.enter_level, scale=0.5, audio_manager=self.audio_manager)
+        # Create button - entering a level saves the explored map first
+        self.enter_button = Button(x=x, y=y, idle_img=idle_img, hover_img=hover_img, action=self.enter_level, scale=0.5, audio_manager=self.audio_manager)
+        UIRouter().register(self.enter_button, scope=self)
 
     def setup_map_collision_barriers(self):
         MapCollisionSetup.setup_collision_barriers(self.collision_handler)
@@ -112,7 +253,7 @@ class Map:
         self.running = False  # Stop the map loop
 
     def move_character(self):
-        """Handle character movement based on keyboard input."""
+        """Handle character movement based on keyboard input or the auto-walk path."""
         # Get map boundaries for character movement
         map_bounds = {
             'min_x': SCREEN_WIDTH - self.map_width,
@@ -126,31 +267,124 @@ class Map:
         # Store current position before movement
         prev_map_x, prev_map_y = self.map_x, self.map_y
         prev_char_x, prev_char_y = self.character_movement.character_x, self.character_movement.character_y
+        prev_char_map_pos = (prev_char_x - prev_map_x, prev_char_y - prev_map_y)
 
-        # Call the character movement handler
-        map_adjustment, character_pos = self.character_movement.handle_movement(
-            map_bounds,
-            (self.map_x, self.map_y),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-
-        # Calculate character's absolute position on the map
-        char_map_x = character_pos[0] - map_adjustment[0]
-        char_map_y = character_pos[1] - map_adjustment[1]
+        # Arrow keys always win over walking to a clicked level
+        move_input = self.character_movement.read_input()
+        if move_input != (0, 0):
+            self.auto_path = None
+        elif self.auto_path:
+            move_input = self.follow_auto_path(prev_char_map_pos)
 
-        # Check collision with barriers
-        if self.collision_handler.check_collision((char_map_x, char_map_y)):
-            # If collision detected, revert to previous position
+        # Try the full move first, then slide along whatever wall blocked it
+        for attempt in self.get_move_attempts(move_input, prev_char_map_pos):
             self.map_x, self.map_y = prev_map_x, prev_map_y
             self.character_movement.character_x = prev_char_x
             self.character_movement.character_y = prev_char_y
+
+            # Call the character movement handler
+            map_adjustment, character_pos = self.character_movement.handle_movement(
+                map_bounds,
+                (self.map_x, self.map_y),
+                (SCREEN_WIDTH, SCREEN_HEIGHT),
+                attempt
+            )
+
+            # Character's absolute position on the map, checked against the distance field
+            char_map_x = character_pos[0] - map_adjustment[0]
+            char_map_y = character_pos[1] - map_adjustment[1]
+            if not self.navigation.is_blocked((char_map_x, char_map_y)):
+                self.map_x, self.map_y = map_adjustment
+                break
         else:
-            # No collision, update map position
-            self.map_x, self.map_y = map_adjustment
+            # Every attempt collided, revert to previous position
+            self.map_x, self.map_y = prev_map_x, prev_map_y
+            self.character_movement.character_x = prev_char_x
+            self.character_movement.character_y = prev_char_y
+            character_pos = (prev_char_x, prev_char_y)
+
+        if self.auto_path:
+            self.check_auto_walk_progress(prev_char_map_pos)
+
+        # Clear the minimap fog around the character
+        self.minimap.reveal(character_pos[0] - self.map_x, character_pos[1] - self.map_y)
 
         # Check for level proximity after movement
         self.check_level_proximity(character_pos)
 
+    def get_move_attempts(self, move_input, char_map_pos):
+        """Moves to try in order: the requested one, then slides along the blocking wall."""
+        step_x, step_y = move_input
+        if step_x and step_y:
+            return [move_input, (step_x, 0), (0, step_y)]
+        if step_x or step_y:
+            # Against a slanted wall, also step sideways along it (the way the distance grows)
+            grad_x, grad_y = self.navigation.gradient(char_map_pos)
+            if step_x and abs(grad_y) > abs(grad_x) * 0.25:
+                return [move_input, (step_x, 1 if grad_y > 0 else -1)]
+            if step_y and abs(grad_x) > abs(grad_y) * 0.25:
+                return [move_input, (1 if grad_x > 0 else -1, step_y)]
+        return [move_input]
+
+    def walk_to_level(self, level):
+        """Find a path to a level marker and start walking along it."""
+        movement = self.character_movement
+        start = (movement.character_x - self.map_x, movement.character_y - self.map_y)
+        path = self.navigation.find_path(start, (level.center_x, level.center_y))
+        if path is None:
+            print(f"Map: No path to level {level.id}")
+            return
+        self.auto_path = path
+        self.auto_walk_stuck = 0
+
+    def follow_auto_path(self, char_map_pos):
+        """Steer towards the next waypoint, dropping the ones already reached."""
+        speed = self.character_movement.character_speed
+        while self.auto_path:
+            target_x, target_y = self.auto_path[0]
+            dx = target_x - char_map_pos[0]
+            dy = target_y - char_map_pos[1]
+            if abs(dx) > speed or abs(dy) > speed:
+                # Step each axis only while it is more than half a step off, so the path stays straight
+                return ((dx > 0) - (dx < 0) if abs(dx) > speed / 2 else 0,
+                        (dy > 0) - (dy < 0) if abs(dy) > speed / 2 else 0)
+            self.auto_path.pop(0)
+        self.auto_path = None  # Arrived
+        return 0, 0
+
+    def check_auto_walk_progress(self, prev_char_map_pos):
+        """Cancel auto-walk if the character stopped making progress."""
+        movement = self.character_movement
+        if (movement.character_x - self.map_x, movement.character_y - self.map_y) == prev_char_map_pos:
+            self.auto_walk_stuck += 1
+            if self.auto_walk_stuck >= AUTO_WALK_STUCK_STEPS:
+                self.auto_path = None
+        else:
+            self.auto_walk_stuck = 0
+
+    def store_previous_positions(self):
+        """Remember positions before a step so frames can be drawn between steps."""
+        self.prev_map_pos = (self.map_x, self.map_y)
+        self.prev_character_pos = (self.character_movement.character_x, self.character_movement.character_y)
+
+    def update(self, elapsed):
+        """Run as many fixed movement steps as elapsed game seconds call for."""
+        step_ms = self.timestep.step * 1000
+        for _ in range(self.timestep.advance(elapsed)):
+            self.store_previous_positions()
+            self.move_character()
+            self.update_character_animation(step_ms)
+            self.npcs.update(self.timestep.step)
+            self.update_ambience(self.timestep.step)
+
+    def update_ambience(self, step):
+        """Launch a shooting star when the timer runs out and move the ones in flight."""
+        self.meteor_timer -= step
+        if self.meteor_timer <= 0:
+            self.ambience.meteor()
+            self.meteor_timer = random.uniform(*METEOR_SECONDS)
+        self.ambience.update(step)
+
     def check_level_proximity(self, character_pos):
         """Check if character is near a level to display the enter button."""
         char_x, char_y = character_pos
@@ -164,15 +398,16 @@ class Map:
             self.levels_manager.set_active_level(nearby_level_id)
 
             # Create or update enter button position
-            button_x = char_x
-            button_y = char_y + 125
+            button_x = px(char_x)
+            button_y = px(char_y + 125)
 
             if self.enter_button is None:
                 self.create_enter_button(button_x, button_y)
             else:
-                # Update button position
-                self.enter_button.rect.centerx = button_x
-                self.enter_button.rect.centery = button_y
+                # Update button position, re-indexing it for hit tests only when it moved
+                if self.enter_button.rect.center != (button_x, button_y):
+                    self.enter_button.rect.center = (button_x, button_y)
+                    UIRouter().move(self.enter_button)
 
             self.enter_button.visible = True
         else:
@@ -182,19 +417,59 @@ class Map:
             # Clear active level in the levels manager
             self.levels_manager.set_active_level(None)
 
+    def set_zoom(self, zoom_index):
+        self.zoom_index = max(0, min(zoom_index, len(MAP_ZOOM_LEVELS) - 1))
+        self.zoom = MAP_ZOOM_LEVELS[self.zoom_index]
+
+    def get_view_offset(self, map_x, map_y, character_pos):
+        """Screen position of the map's top-left at the current zoom; zooming keeps the character in place."""
+        if self.zoom == 1:
+            return map_x, map_y
+        char_x, char_y = character_pos
+        return (round(char_x + (map_x - char_x) * self.zoom),
+                round(char_y + (map_y - char_y) * self.zoom))
+
+    def screen_to_map(self, pos):
+        """Map position under a screen position at the current zoom."""
+        movement = self.character_movement
+        view_x, view_y = self.get_view_offset(self.map_x, self.map_y, (movement.character_x, movement.character_y))
+        return (pos[0] - view_x) / self.zoom, (pos[1] - view_y) / self.zoom
+
     def draw(self):
         """Draw the map, levels, and player icon on the screen."""
+        # Draw between the last two simulation steps
+        alpha = self.timestep.get_alpha()
+        map_x, map_y = interpolate(self.prev_map_pos, (self.map_x, self.map_y), alpha)
+        map_x, map_y = round(map_x), round(map_y)
+        character_x, character_y = interpolate(
+            self.prev_character_pos,
+            (self.character_movement.character_x, self.character_movement.character_y), alpha)
+
+        # Everything in the world is drawn relative to the zoomed view
+        view_x, view_y = self.get_view_offset(map_x, map_y, (character_x, character_y))
+
+        # The world is laid out in layout pixels; the canvas shows it zoomed by its own scale too
+        view_x, view_y = px(view_x), px(view_y)
+        zoom = self.zoom * DisplayManager().scale
+
+        # Draw the map
         self.screen.fill((0, 0, 0))
-        self.screen.blit(self.map, (self.map_x, self.map_y))
+        self.map_tiles.draw(self.screen, view_x, view_y, zoom)
 
         # Draw levels on the map using the levels manager
-        self.levels_manager.draw_levels(self.screen, self.map_x, self.map_y)
+        self.levels_manager.draw_levels(self.screen, view_x, view_y, zoom)
+
+        # Draw the NPCs that are on screen
+        self.npcs.draw(self.screen, view_x, view_y, alpha, zoom)
 
         # Draw collision lines for debugging
-        self.collision_handler.draw_lines(self.screen, self.map_x, self.map_y)
+        self.collision_handler.draw_lines(self.screen, view_x, view_y, zoom=zoom)
 
         # Draw character
-        self.character_movement.draw(self.screen)
+        self.character_movement.draw(self.screen, (px(round(character_x)), px(round(character_y))), zoom)
+
+        # Shooting stars pass over the world but under the buttons
+        self.ambience.draw(self.screen)
 
         # Draw enter button if it exists and is visible
         if self.enter_button and self.enter_button.visible:
@@ -203,39 +478,66 @@ class Map:
         # Draw back button
         self.back_button.draw()
 
+        # Draw the minimap over everything else
+        self.minimap.draw(self.screen, (character_x - map_x, character_y - map_y),
+                          self.levels_manager.get_all_levels())
+
     def toggle_collision_debug(self):
         """Toggle collision line visibility."""
         self.collision_handler.set_debug_mode(not self.collision_handler.debug_mode)
 
     def handle_events(self):
         """Handle map interactions and level selection."""
-        for event in pygame.event.get():
+        for event in self.frame_governor.get_events(self.is_animating()):
             if event.type == pygame.QUIT:
                 self.running = False
 
-            # Handle back button
-            self.back_button.update(event)
+            # The mouse wheel zooms between the overview and the close-up
+            if event.type == pygame.MOUSEWHEEL and event.y:
+                self.set_zoom(self.zoom_index + (1 if event.y > 0 else -1))
+
+            # M shows or hides the minimap
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+                self.minimap.toggle()
 
-            # Handle enter button if it exists and is visible
-            if self.enter_button and self.enter_button.visible:
-                self.enter_button.update(event)
+            # Only the back or enter button under a click gets it
+            clicked = UIRouter().dispatch(event, scope=self)
 
-    def update_character_animation(self):
+            # Clicking an unlocked level marker walks the character there
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.running and clicked is None:
+                level = self.levels_manager.get_level_at(
+                    *self.screen_to_map(DisplayManager().to_window(event.pos)))  # Layout position of the click
+                if level and level.unlocked:
+                    self.walk_to_level(level)
+
+    def is_animating(self):
+        if self.game_clock.is_paused():
+            return False  # Nothing moves while the game clock is stopped
+        return (self.character_movement.is_walking or bool(self.auto_path) or self.npcs.visible_walking or
+                self.ambience.is_active())
+
+    def update_character_animation(self, step_ms):
         """Update character animation frames"""
-        self.character_movement.update_animation()
+        self.character_movement.update_animation(step_ms)
 
     def run(self):
         """Main map loop."""
+        self.game_clock.tick()  # Time before the map loop does not count
+        UIRouter().set_scope(self, [button for button in (self.back_button.button, self.enter_button) if button])
         while self.running:
             # Handle events
             self.handle_events()
-            # Handle character movement - this should be called every frame
-            self.move_character()
-            # Update animation
-            self.update_character_animation()
+            # Move and animate the character in fixed steps, independent of the frame rate
+            self.update(self.game_clock.tick())
             # Draw everything
             self.draw()
             # Update display
-            pygame.display.flip()
+            self.display_manager.present()
+            # Keep preparing battle sprites in the frame's spare time
+            SpriteVariants().poll()
             # Cap the frame rate
-            self.clock.tick(FPS)
\ No newline at end of file
+            self.frame_governor.tick(self.is_animating())
+
+        # Keep what was explored this visit
+        self.save_explored()
+        UIRouter().unregister_scope(self)
@@ -1,169 +1,67 @@
 import pygame
-import sys
 import os
+from .sprite_animation import load_animation_set, FRONT, BACK, LEFT, RIGHT
 
 
 class MapCharacterMovement:
     def __init__(self, hero_type, script_dir, initial_x, initial_y):
         """Initialize character movement and animations."""
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.root_dir = os.path.normpath(script_dir)
         self.hero_type = hero_type
 
         # Character position
         self.character_x = initial_x
         self.character_y = initial_y
-        self.character_speed = 9  # 9 normal
+        self.character_speed = 9  # Pixels per simulation step (9 normal)
 
         # Animation properties
-        self.direction = "front"
+        self.direction = FRONT
         self.is_walking = False
         self.animation_frame = 0
-        self.animation_cooldown = 120
-        self.last_animation_update = pygame.time.get_ticks()
+        self.animation_timer = 0  # Milliseconds of simulated time since the last frame change
+        self.zoomed_frames = {}  # (frame id, zoom) -> frame scaled for a zoomed-out map
 
         # Load character animations
         self.load_character_animations()
 
     def load_character_animations(self):
-        """Load all character animation frames based on hero_type."""
-        base_path = os.path.join(self.script_dir, "..", "assets", "images", "map", "animation", self.hero_type)
-
-        # Initialize animation dictionaries
-        self.animations = {
-            "back": {"stand": None, "walk_left": None, "walk_right": None},
-            "front": {"stand": None, "walk_left": None, "walk_right": None},
-            "left": {"stand": None, "walk_left": None, "walk_right": None},
-            "right": {"stand": None, "walk_left": None, "walk_right": None}
-        }
-
-        # Load back animations
-        self.animations["back"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_stand.png")
-        ).convert_alpha()
-        self.animations["back"]["walk_left"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_walkl.png")
-        ).convert_alpha()
-        self.animations["back"]["walk_right"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_walkr.png")
-        ).convert_alpha()
-
-        # Load front animations
-        self.animations["front"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_stand.png")
-        ).convert_alpha()
-        self.animations["front"]["walk_left"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_walkl.png")
-        ).convert_alpha()
-        self.animations["front"]["walk_right"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_walkr.png")
-        ).convert_alpha()
-
-        # Load sideway animations - with enhanced boy animations
-        if self.hero_type == "boy":
-            # Enhanced animations for boy character
-            self.animations["left"]["stand"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_left_stand.png")
-            ).convert_alpha()
-            self.animations["left"]["walk_left"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_leftl_walk.png")
-            ).convert_alpha()
-            self.animations["left"]["walk_right"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_leftr_walk.png")
-            ).convert_alpha()
-
-            self.animations["right"]["stand"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_right_stand.png")
-            ).convert_alpha()
-            self.animations["right"]["walk_left"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_rightl_walk.png")
-            ).convert_alpha()
-            self.animations["right"]["walk_right"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_rightr_walk.png")
-            ).convert_alpha()
-        else:
-            # Default animations for other characters
-            self.animations["left"]["stand"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_left_stand.png")
-            ).convert_alpha()
-            self.animations["left"]["walk_left"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_left_walk.png")
-            ).convert_alpha()
-            self.animations["left"]["walk_right"] = self.animations["left"]["stand"]  # For girl, stand is walk_right
-
-            self.animations["right"]["stand"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_right_stand.png")
-            ).convert_alpha()
-            self.animations["right"]["walk_left"] = pygame.image.load(
-                os.path.join(base_path, "sideway and walk", f"{self.hero_type}_right_walk.png")
-            ).convert_alpha()
-            self.animations["right"]["walk_right"] = self.animations["right"]["stand"]  # For girl, stand is walk_right
-
-        # Scale all animations to an appropriate size
-        scale_factor = 2.5  # Adjust as needed 3 Last Time
-        for direction in self.animations:
-            for animation_type in self.animations[direction]:
-                img = self.animations[direction][animation_type]
-                scaled_width = int(img.get_width() * scale_factor)
-                scaled_height = int(img.get_height() * scale_factor)
-                self.animations[direction][animation_type] = pygame.transform.scale(
-                    img, (scaled_width, scaled_height)
-                )
-
-    def update_animation(self):
-        """Update character animation frame based on movement and direction."""
-        current_time = pygame.time.get_ticks()
-        animation_speed = self.animation_cooldown
-
-        # Make sideways animation slightly faster for girl character
-        if self.hero_type != "boy" and self.direction in ["left", "right"]:
-            animation_speed = int(self.animation_cooldown * 0.50)
-
-        if current_time - self.last_animation_update >= animation_speed:
-            self.last_animation_update = current_time
+        """Load the hero's frames and walk cycles from its animation data file."""
+        self.animation_set = load_animation_set(self.root_dir, self.hero_type)
+
+    def update_animation(self, step_ms):
+        """Advance the animation by one simulation step of step_ms milliseconds."""
+        self.animation_timer += step_ms
+        if self.animation_timer >= self.animation_set.frame_ms[self.direction]:
+            self.animation_timer = 0
             if self.is_walking:
-                self.animation_frame = (self.animation_frame + 1) % 4  # Same 4-step cycle for both characters
+                self.animation_frame = (self.animation_frame + 1) % len(self.animation_set.walk[self.direction])
             else:
                 # When not walking, always reset to standing frame
                 self.animation_frame = 0
 
     def get_current_frame(self):
-        """Get the current animation frame based on character type and direction."""
-        # If not walking, always return standing position for both boy and girl
+        """Get the current animation frame for the facing and walk cycle position."""
+        animation_set = self.animation_set
         if not self.is_walking:
-            return self.animations[self.direction]["stand"]
-
-        if self.hero_type == "boy":
-            # Boy animation cycle: walk_left, stand, walk_right, stand
-            frame_cycle = ["walk_left", "stand", "walk_right", "stand"]
-            key = frame_cycle[self.animation_frame % 4]
-            return self.animations[self.direction].get(key, self.animations[self.direction]["stand"])
-        else:
-            # Girl animation cycle with very short stand time for sideways movement
-            if self.direction in ["left", "right"]:
-                # For sideways, we want walk frames to be most frequent
-                # Using custom cycle that minimizes stand time
-                frame_cycle = ["walk_left", "walk_left", "stand", "walk_right"]
-                key = frame_cycle[self.animation_frame % 4]
-
-                if key == "walk_left":
-                    return self.animations[self.direction]["walk_left"]
-                elif key == "walk_right":
-                    return self.animations[self.direction]["stand"]  # For girl, stand is used as walk_right
-                else:
-                    return self.animations[self.direction]["stand"]
-            else:
-                # For front/back directions, use normal cycle
-                frame_cycle = ["walk_left", "stand", "walk_right", "stand"]
-                key = frame_cycle[self.animation_frame % 4]
-                return self.animations[self.direction].get(key, self.animations[self.direction]["stand"])
+            return animation_set.frames[animation_set.stand[self.direction]]
+        cycle = animation_set.walk[self.direction]
+        return animation_set.frames[cycle[self.animation_frame % len(cycle)]]
 
-    def handle_movement(self, map_bounds, map_pos, screen_size):
+    def read_input(self):
+        """Arrow keys as (x, y) steps of -1, 0 or 1."""
+        keys = pygame.key.get_pressed()
+        step_x = -1 if keys[pygame.K_LEFT] else 1 if keys[pygame.K_RIGHT] else 0
+        step_y = -1 if keys[pygame.K_UP] else 1 if keys[pygame.K_DOWN] else 0
+        return step_x, step_y
+
+    def handle_movement(self, map_bounds, map_pos, screen_size, move_input=None):
         # Unpack parameters
         map_x, map_y = map_pos
         screen_width, screen_height = screen_size
 
-        # Get keyboard state
-        keys = pygame.key.get_pressed()
+        # Keyboard state unless the map steers the character (wall sliding, auto-walk)
+        step_x, step_y = move_input if move_input is not None else self.read_input()
 
         dx = 0
         dy = 0
@@ -171,22 +69,22 @@ class MapCharacterMovement:
         self.is_walking = False
 
         # Check arrow keys
-        if keys[pygame.K_LEFT]:
+        if step_x < 0:
             dx = -self.character_speed
-            self.direction = "left"
+            self.direction = LEFT
             self.is_walking = True
-        elif keys[pygame.K_RIGHT]:
+        elif step_x > 0:
             dx = self.character_speed
-            self.direction = "right"
+            self.direction = RIGHT
             self.is_walking = True
 
-        if keys[pygame.K_UP]:
+        if step_y < 0:
             dy = -self.character_speed
-            self.direction = "back"
+            self.direction = BACK
             self.is_walking = True
-        elif keys[pygame.K_DOWN]:
+        elif step_y > 0:
             dy = self.character_speed
-            self.direction = "front"
+            self.direction = FRONT
             self.is_walking = True
 
         # Only process if movement keys are pressed
@@ -348,23 +246,33 @@ class MapCharacterMovement:
             self.character_x = max(char_width // 2, min(self.character_x, screen_width - char_width // 2))
             self.character_y = max(char_height // 2, min(self.character_y, screen_height - char_height // 2))
 
-        # Update animation state if movement state changed
+        # Restart the animation if movement state changed; update_animation() advances it
         if was_walking != self.is_walking:
             self.animation_frame = 0
-            self.last_animation_update = pygame.time.get_ticks()
-        else:
-            # Update animation frames
-            self.update_animation()
+            self.animation_timer = 0
 
         return (map_x, map_y), (self.character_x, self.character_y)
 
-    def draw(self, screen):
+    def get_zoomed_frame(self, image, zoom):
+        """Scale a frame for a map zoom once and reuse it."""
+        key = (id(image), zoom)
+        zoomed = self.zoomed_frames.get(key)
+        if zoomed is None:
+            size = (max(1, int(image.get_width() * zoom)), max(1, int(image.get_height() * zoom)))
+            zoomed = pygame.transform.smoothscale(image, size)
+            self.zoomed_frames[key] = zoomed
+        return zoomed
+
+    def draw(self, screen, position=None, zoom=1.0):
         # Get current character frame
         character_image = self.get_current_frame()
+        if zoom != 1:
+            character_image = self.get_zoomed_frame(character_image, zoom)
 
-        # Calculate character position (centered at character_x, character_y)
-        char_x = self.character_x - character_image.get_width() // 2
-        char_y = self.character_y - character_image.get_height() // 2
+        # Calculate character position (centered at character_x, character_y unless interpolated)
+        center_x, center_y = position if position else (self.character_x, self.character_y)
+        char_x = center_x - character_image.get_width() // 2
+        char_y = center_y - character_image.get_height() // 2
 
         # Draw character
         screen.blit(character_image, (char_x, char_y))
\ No newline at end of file
@@ -0,0 +1,235 @@
+import pygame
+import os
+import numpy as np
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.asset_manager import AssetManager
+from .sprite_animation import get_hero_types, load_animation_set, FRONT, BACK, LEFT, RIGHT
+
+NPC_RADIUS = 25  # Collision radius in map pixels; smaller than the hero's
+NPC_SPEED_RANGE = (60, 150)  # Map pixels per second
+NPC_BEHAVIOUR_SECONDS = (1.0, 4.0)  # How long an NPC keeps walking or idling
+NPC_WALK_CHANCE = 0.6
+NPC_STEP_FPS = 6  # Walk cycle frames per second
+NPC_STUDENT_SCALE = 0.8  # Relative to the hero's map sprite
+NPC_MONSTER_HEIGHT = 90
+NPC_DRAW_MARGIN = 100  # Sprites this far off screen may still overlap it
+
+
+def load_looks(script_dir):
+    """Frame tables for every NPC look: [(surface, half_width, half_height)] per facing and step."""
+    looks = []
+
+    # Students reuse the heroes' map animations at a smaller size: standing and first walk frame per facing
+    for hero_type in get_hero_types():
+        animation_set = load_animation_set(os.path.normpath(script_dir), hero_type)
+        frames = []
+        for direction in (FRONT, BACK, LEFT, RIGHT):
+            for index in (animation_set.stand[direction], animation_set.walk[direction][0]):
+                image = animation_set.frames[index]
+                size = (int(image.get_width() * NPC_STUDENT_SCALE), int(image.get_height() * NPC_STUDENT_SCALE))
+                frames.append(pygame.transform.scale(image, size))
+        looks.append(frames)
+
+    # Roaming monsters are the battle's mini enemies: one frame, mirrored when facing right
+    mini_dir = os.path.join(script_dir, "assets", "images", "battle", "enemy", "mini")
+    for mini_id in range(1, 20):
+        try:
+            image = AssetManager().load_image(os.path.join(mini_dir, f"mini_{mini_id}.png"))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Map NPCs: Skipping mini_{mini_id}: {e}")
+            continue
+        scale = NPC_MONSTER_HEIGHT / image.get_height()
+        image = pygame.transform.scale(image, (int(image.get_width() * scale), NPC_MONSTER_HEIGHT))
+        flipped = pygame.transform.flip(image, True, False)
+        looks.append([image, image, image, image, image, image, flipped, flipped])
+
+    return [[(frame, frame.get_width() // 2, frame.get_height() // 2) for frame in frames] for frames in looks]
+
+
+class NPCCrowd:
+    def __init__(self, navigation, looks, count, map_width, map_height, seed=None):
+        """Wandering NPCs whose state lives in NumPy arrays, one row per NPC."""
+        self.navigation = navigation
+        self.looks = looks
+        self.map_width = map_width
+        self.map_height = map_height
+        self.rng = np.random.default_rng(seed)
+        self.visible_walking = False  # Whether anything on screen moved in the last draw
+        self.stepped = False  # Whether update() ran since the last draw; frozen NPCs do not animate
+        self.zoomed_looks = {1.0: looks}  # Map zoom -> frame tables scaled for it
+
+        self.pos = np.zeros((0, 2), dtype=np.float32)
+        self.prev_pos = np.zeros((0, 2), dtype=np.float32)
+        self.vel = np.zeros((0, 2), dtype=np.float32)
+        self.timer = np.zeros(0, dtype=np.float32)  # Seconds until the next behaviour change
+        self.look = np.zeros(0, dtype=np.int16)
+        self.facing = np.zeros(0, dtype=np.int8)
+        self.walking = np.zeros(0, dtype=bool)
+        self.phase = np.zeros(0, dtype=np.float32)  # Walk cycle offset so NPCs don't step in sync
+        self.time = 0.0
+        self.set_count(count)
+
+    def __len__(self):
+        return len(self.pos)
+
+    def set_count(self, count):
+        """Grow or shrink the crowd, keeping the NPCs that already exist."""
+        current = len(self.pos)
+        if count <= current:
+            for name in ("pos", "prev_pos", "vel", "timer", "look", "facing", "walking", "phase"):
+                setattr(self, name, getattr(self, name)[:count])
+            return
+
+        added = count - current
+        pos = self.navigation.random_walkable_positions(added, self.rng)
+        pos += self.rng.uniform(-15, 15, (added, 2)).astype(np.float32)
+        self.pos = np.concatenate([self.pos, pos])
+        self.prev_pos = self.pos.copy()
+        self.vel = np.concatenate([self.vel, np.zeros((added, 2), dtype=np.float32)])
+        self.timer = np.concatenate([self.timer, np.zeros(added, dtype=np.float32)])
+        self.look = np.concatenate([self.look, self.rng.integers(0, len(self.looks), added).astype(np.int16)])
+        self.facing = np.concatenate([self.facing, np.zeros(added, dtype=np.int8)])
+        self.walking = np.concatenate([self.walking, np.zeros(added, dtype=bool)])
+        self.phase = np.concatenate([self.phase, self.rng.uniform(0, 1, added).astype(np.float32)])
+
+    def choose_behaviour(self, indices):
+        """Give the NPCs at indices a new random walk or idle spell."""
+        count = len(indices)
+        walking = self.rng.random(count) < NPC_WALK_CHANCE
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        speed = self.rng.uniform(*NPC_SPEED_RANGE, count) * walking
+        vel_x = (np.cos(angle) * speed).astype(np.float32)
+        vel_y = (np.sin(angle) * speed).astype(np.float32)
+
+        self.vel[indices, 0] = vel_x
+        self.vel[indices, 1] = vel_y
+        self.walking[indices] = walking
+        self.timer[indices] = self.rng.uniform(*NPC_BEHAVIOUR_SECONDS, count)
+
+        # Face along the dominant axis of movement
+        horizontal = np.abs(vel_x) >= np.abs(vel_y)
+        facing = np.where(horizontal, np.where(vel_x < 0, LEFT, RIGHT), np.where(vel_y < 0, BACK, FRONT))
+        self.facing[indices[walking]] = facing[walking]
+
+    def update(self, step):
+        """Advance every NPC by one fixed step of step seconds."""
+        if len(self.pos) == 0:
+            return
+        self.stepped = True
+        self.time += step
+        self.prev_pos[:] = self.pos
+
+        self.timer -= step
+        expired = np.flatnonzero(self.timer <= 0)
+        if len(expired):
+            self.choose_behaviour(expired)
+
+        # Move everyone at once, then keep the ones the distance field and map edges allow
+        new_pos = self.pos + self.vel * step
+        xs, ys = new_pos[:, 0], new_pos[:, 1]
+        blocked = self.navigation.is_blocked_many(xs, ys, NPC_RADIUS)
+        blocked |= (xs < NPC_RADIUS) | (xs > self.map_width - NPC_RADIUS)
+        blocked |= (ys < NPC_RADIUS) | (ys > self.map_height - NPC_RADIUS)
+        moved = ~blocked
+        self.pos[moved] = new_pos[moved]
+
+        # Walkers that hit something pick a new direction next step
+        self.timer[blocked & self.walking] = 0
+
+    def get_looks(self, zoom):
+        """Frame tables scaled for a map zoom, built on first use."""
+        looks = self.zoomed_looks.get(zoom)
+        if looks is None:
+            scaled = {}  # Monsters reuse one surface for several frames; scale it once
+            looks = []
+            for frames in self.looks:
+                zoomed_frames = []
+                for frame, _, _ in frames:
+                    zoomed = scaled.get(id(frame))
+                    if zoomed is None:
+                        size = (max(1, int(frame.get_width() * zoom)), max(1, int(frame.get_height() * zoom)))
+                        zoomed = scaled[id(frame)] = pygame.transform.smoothscale(frame, size)
+                    zoomed_frames.append((zoomed, zoomed.get_width() // 2, zoomed.get_height() // 2))
+                looks.append(zoomed_frames)
+            self.zoomed_looks[zoom] = looks
+        return looks
+
+    def draw(self, screen, map_x, map_y, alpha=1.0, zoom=1.0):
+        """Draw the NPCs that are on screen, interpolated between the last two steps."""
+        if len(self.pos) == 0:
+            self.visible_walking = self.stepped = False
+            return
+
+        pos = self.prev_pos + (self.pos - self.prev_pos) * alpha
+        screen_x = pos[:, 0] * zoom + map_x
+        screen_y = pos[:, 1] * zoom + map_y
+        screen_width, screen_height = screen.get_size()
+        visible = ((screen_x > -NPC_DRAW_MARGIN) & (screen_x < screen_width + NPC_DRAW_MARGIN) &
+                   (screen_y > -NPC_DRAW_MARGIN) & (screen_y < screen_height + NPC_DRAW_MARGIN))
+        indices = np.flatnonzero(visible)
+        if len(indices) == 0:
+            self.visible_walking = self.stepped = False
+            return
+
+        # Lower NPCs are drawn last so they overlap the ones behind them
+        indices = indices[np.argsort(screen_y[indices], kind="stable")]
+        walking = self.walking[indices]
+        step_frame = ((self.time * NPC_STEP_FPS + self.phase[indices]).astype(np.int32) & 1) & walking
+        frames = self.facing[indices].astype(np.int32) * 2 + step_frame
+
+        looks = self.get_looks(zoom)
+        blits = []
+        for look, frame, x, y in zip(self.look[indices].tolist(), frames.tolist(),
+                                     screen_x[indices].tolist(), screen_y[indices].tolist()):
+            surface, half_width, half_height = looks[look][frame]
+            blits.append((surface, (int(x) - half_width, int(y) - half_height)))
+        screen.blits(blits, doreturn=False)
+        self.visible_walking = self.stepped and bool(walking.any())
+        self.stepped = False
+
+
+def benchmark_crowd(script_dir, start_count=50, frames=60, budget_ms=1000 / 60, max_count=1 << 16):
+    """Double the crowd until a map frame (tiles, NPC update and draw) takes longer than the budget."""
+    from .map import MAP_SCALE_FACTOR
+    from .map import MAP_MIP_LEVELS
+    from .map_tiles import MapMipCache
+    from .navigation import Navigation
+    from .collision_compiler import load_barriers
+    from managers.display_manager import DisplayManager, px
+
+    display_manager = DisplayManager()
+    map_image = AssetManager().load_image(os.path.join(script_dir, "assets", "images", "map", "lspu_map.png"),
+                                          alpha=False)
+    map_width = map_image.get_width() * MAP_SCALE_FACTOR
+    map_height = map_image.get_height() * MAP_SCALE_FACTOR
+    tiles = MapMipCache(map_image, MAP_SCALE_FACTOR, MAP_MIP_LEVELS)
+    navigation = Navigation(load_barriers(), map_width, map_height)
+    looks = load_looks(script_dir)
+
+    # A fixed view in the middle of the map, so the visible share of the crowd stays similar
+    screen = display_manager.canvas
+    zoom = display_manager.scale
+    map_x = px((SCREEN_WIDTH - map_width) // 2)
+    map_y = px((SCREEN_HEIGHT - map_height) // 2)
+    results = {}
+    count = start_count
+    while True:
+        crowd = NPCCrowd(navigation, looks, count, map_width, map_height, seed=count)
+        start = pygame.time.get_ticks()
+        for _ in range(frames):
+            pygame.event.pump()
+            crowd.update(1 / 60)
+            tiles.draw(screen, map_x, map_y, zoom)
+            crowd.draw(screen, map_x, map_y, zoom=zoom)
+            display_manager.present()
+        average_ms = (pygame.time.get_ticks() - start) / frames
+        results[count] = round(average_ms, 2)
+        print(f"Map NPCs: {count} NPCs averaged {average_ms:.2f} ms per frame")
+        if average_ms > budget_ms or count >= max_count:
+            break
+        count *= 2
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_crowd(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,130 @@
+import pygame
+import math
+from collections import OrderedDict
+
+
+class MapTileCache:
+    def __init__(self, source, scale, tile_size=128, max_tiles=96):
+        """Scale the map lazily in tiles instead of keeping one huge scaled surface."""
+        self.source = source  # Unscaled map image
+        self.scale = scale  # Baked pixels per source pixel
+        self.tile_size = tile_size  # Tile size in source pixels
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()  # (col, row) -> scaled tile, least recently used first
+
+        self.source_rect = source.get_rect()
+        self.columns = math.ceil(self.source_rect.width / tile_size)
+        self.rows = math.ceil(self.source_rect.height / tile_size)
+        self.width = int(self.source_rect.width * scale)
+        self.height = int(self.source_rect.height * scale)
+
+    def set_max_tiles(self, max_tiles):
+        self.max_tiles = max_tiles
+        self.trim(0)
+
+    def tile_edge(self, index, limit):
+        """Baked pixel position of a tile edge; shared by neighbours so tiles never leave seams."""
+        return min(int(index * self.tile_size * self.scale), limit)
+
+    def get_tile(self, col, row):
+        """Return a scaled tile, creating it on first use."""
+        key = (col, row)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+
+        src_rect = pygame.Rect(col * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size)
+        src_rect = src_rect.clip(self.source_rect)
+        size = (self.tile_edge(col + 1, self.width) - self.tile_edge(col, self.width),
+                self.tile_edge(row + 1, self.height) - self.tile_edge(row, self.height))
+
+        tile = pygame.transform.scale(self.source.subsurface(src_rect), size)
+        self.tiles[key] = tile
+        return tile
+
+    def visible_range(self, offset_x, offset_y, view_width, view_height):
+        """Columns and rows that overlap the view when the map's top-left is at the offset."""
+        step = self.tile_size * self.scale
+        first_col = max(0, int(-offset_x // step))
+        last_col = min(self.columns - 1, int((view_width - offset_x) // step))
+        first_row = max(0, int(-offset_y // step))
+        last_row = min(self.rows - 1, int((view_height - offset_y) // step))
+        return range(first_col, last_col + 1), range(first_row, last_row + 1)
+
+    def draw(self, surface, offset_x, offset_y):
+        """Blit the visible tiles with the map's top-left at the offset (in baked pixels)."""
+        cols, rows = self.visible_range(offset_x, offset_y, surface.get_width(), surface.get_height())
+        blits = []
+        for row in rows:
+            y = offset_y + self.tile_edge(row, self.height)
+            for col in cols:
+                x = offset_x + self.tile_edge(col, self.width)
+                blits.append((self.get_tile(col, row), (x, y)))
+        surface.blits(blits, doreturn=False)
+
+        # Never evict the tiles this frame needs, even if the cache is smaller
+        self.trim(len(blits))
+
+    def trim(self, keep):
+        """Drop least recently used tiles over the cache limit."""
+        while len(self.tiles) > max(self.max_tiles, keep):
+            self.tiles.popitem(last=False)
+
+    def clear(self):
+        self.tiles.clear()
+
+
+class MapMipCache:
+    def __init__(self, source, scale, mip_levels=(0.25, 0.5, 1.0), max_tiles=96):
+        """Tile caches of the map at a few zoom levels, each created on first use."""
+        self.source = source
+        self.scale = scale  # Baked pixels per source pixel at zoom 1
+        self.mip_levels = sorted(mip_levels)
+        self.max_tiles = max_tiles
+        self.caches = {}  # mip level -> MapTileCache
+        self.scratch = None  # Reused surface for zooms between mip levels
+
+    def set_max_tiles(self, max_tiles):
+        self.max_tiles = max_tiles
+        for cache in self.caches.values():
+            cache.set_max_tiles(max_tiles)
+
+    def get_mip(self, zoom):
+        """The smallest mip level at or above the zoom, so the remaining scale only shrinks."""
+        for mip in self.mip_levels:
+            if mip >= zoom - 1e-6:
+                return mip
+        return self.mip_levels[-1]
+
+    def get_cache(self, mip):
+        cache = self.caches.get(mip)
+        if cache is None:
+            cache = MapTileCache(self.source, self.scale * mip, max_tiles=self.max_tiles)
+            self.caches[mip] = cache
+        return cache
+
+    def draw(self, surface, offset_x, offset_y, zoom=1.0):
+        """Blit the visible map at a zoom, with its top-left at the offset (in baked pixels at that zoom)."""
+        mip = self.get_mip(zoom)
+        cache = self.get_cache(mip)
+        residual = zoom / mip
+        if abs(residual - 1) < 1e-6:
+            cache.draw(surface, round(offset_x), round(offset_y))
+            return
+
+        # Draw the visible region at the mip level, then scale just that region into place
+        width, height = surface.get_size()
+        size = (math.ceil(width / residual), math.ceil(height / residual))
+        if self.scratch is None or self.scratch.get_size() != size:
+            self.scratch = pygame.Surface(size).convert(surface)
+        scratch_x, scratch_y = round(offset_x / residual), round(offset_y / residual)
+        if (scratch_x > 0 or scratch_y > 0 or scratch_x + cache.width < size[0] or
+                scratch_y + cache.height < size[1]):
+            self.scratch.fill((0, 0, 0))  # Only needed where the map does not cover the view
+        cache.draw(self.scratch, scratch_x, scratch_y)
+        pygame.transform.scale(self.scratch, (width, height), surface)
+
+    def clear(self):
+        self.caches.clear()
+        self.scratch = None
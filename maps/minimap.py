@@ -0,0 +1,115 @@
+import pygame
+import math
+from settings import SCREEN_WIDTH
+from managers.display_manager import px
+
+MINIMAP_WIDTH = 320
+MINIMAP_MARGIN = 30
+FOG_CELL_SIZE = 250  # Map pixels per fog-of-war cell
+FOG_REVEAL_RADIUS = 2  # Cells revealed around the player
+FOG_COLOR = (10, 10, 20, 220)
+BORDER_COLOR = (255, 255, 255)
+PLAYER_COLOR = (255, 60, 60)
+UNLOCKED_COLOR = (255, 215, 0)
+LOCKED_COLOR = (120, 120, 120)
+
+
+class Minimap:
+    def __init__(self, map_image, map_width, map_height):
+        """Corner overview of the map with a fog of war over the parts not yet visited."""
+        self.map_width = map_width
+        self.map_height = map_height
+        self.scale = px(MINIMAP_WIDTH) / map_width  # Minimap pixels per map pixel, on the canvas
+        size = (px(MINIMAP_WIDTH), round(map_height * self.scale))
+        self.rect = pygame.Rect((px(SCREEN_WIDTH) - size[0] - px(MINIMAP_MARGIN), px(MINIMAP_MARGIN)), size)
+        self.visible = True
+
+        # Downscaled once; level markers are drawn over a copy only when their lock state changes
+        self.base = pygame.transform.smoothscale(map_image, size)
+        self.marker_layer = None
+        self.marker_state = None
+
+        # One bit per fog cell, row-major; the fog surface only changes where a bit gets set
+        self.columns = math.ceil(map_width / FOG_CELL_SIZE)
+        self.rows = math.ceil(map_height / FOG_CELL_SIZE)
+        self.explored = bytearray((self.columns * self.rows + 7) // 8)
+        self.fog = pygame.Surface(size, pygame.SRCALPHA)
+        self.fog.fill(FOG_COLOR)
+        self.last_cell = None
+        self.unsaved = False  # Cells revealed since the last save
+
+    def is_explored(self, col, row):
+        index = row * self.columns + col
+        return self.explored[index >> 3] & (1 << (index & 7)) != 0
+
+    def cell_rect(self, col, row):
+        """Minimap rect of a fog cell; neighbours share edges so no seams are left."""
+        x0 = int(col * FOG_CELL_SIZE * self.scale)
+        y0 = int(row * FOG_CELL_SIZE * self.scale)
+        x1 = int((col + 1) * FOG_CELL_SIZE * self.scale)
+        y1 = int((row + 1) * FOG_CELL_SIZE * self.scale)
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+
+    def reveal(self, map_x, map_y):
+        """Clear the fog around a map position; does nothing until the player enters a new cell."""
+        cell = (int(map_x // FOG_CELL_SIZE), int(map_y // FOG_CELL_SIZE))
+        if cell == self.last_cell:
+            return
+        self.last_cell = cell
+
+        col, row = cell
+        radius_sq = FOG_REVEAL_RADIUS * FOG_REVEAL_RADIUS + FOG_REVEAL_RADIUS  # Rounder than a square
+        for dr in range(-FOG_REVEAL_RADIUS, FOG_REVEAL_RADIUS + 1):
+            for dc in range(-FOG_REVEAL_RADIUS, FOG_REVEAL_RADIUS + 1):
+                c, r = col + dc, row + dr
+                if dc * dc + dr * dr > radius_sq or not (0 <= c < self.columns and 0 <= r < self.rows):
+                    continue
+                if not self.is_explored(c, r):
+                    index = r * self.columns + c
+                    self.explored[index >> 3] |= 1 << (index & 7)
+                    self.fog.fill((0, 0, 0, 0), self.cell_rect(c, r))
+                    self.unsaved = True
+
+    def load_explored(self, explored):
+        """Restore saved explored cells; data for a different grid size is ignored."""
+        self.reset()
+        if not explored or len(explored) != len(self.explored):
+            return
+        self.explored = bytearray(explored)
+        for row in range(self.rows):
+            for col in range(self.columns):
+                if self.is_explored(col, row):
+                    self.fog.fill((0, 0, 0, 0), self.cell_rect(col, row))
+
+    def reset(self):
+        self.explored = bytearray(len(self.explored))
+        self.fog.fill(FOG_COLOR)
+        self.last_cell = None
+        self.unsaved = False
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def update_markers(self, levels):
+        """Redraw the level markers only when a level was locked or unlocked."""
+        state = tuple(level.unlocked for level in levels)
+        if state == self.marker_state:
+            return
+        self.marker_state = state
+        self.marker_layer = self.base.copy()
+        for level in levels:
+            if level.id == 0:
+                continue  # The spawn point is not a level
+            center = (int(level.center_x * self.scale), int(level.center_y * self.scale))
+            pygame.draw.circle(self.marker_layer, UNLOCKED_COLOR if level.unlocked else LOCKED_COLOR, center, px(4))
+
+    def draw(self, screen, player_map_pos, levels):
+        if not self.visible:
+            return
+        self.update_markers(levels)
+        screen.blit(self.marker_layer, self.rect)
+        screen.blit(self.fog, self.rect)
+
+        player = (self.rect.x + int(player_map_pos[0] * self.scale), self.rect.y + int(player_map_pos[1] * self.scale))
+        pygame.draw.circle(screen, PLAYER_COLOR, player, px(5))
+        pygame.draw.rect(screen, BORDER_COLOR, self.rect.inflate(px(4), px(4)), px(2))
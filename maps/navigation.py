@@ -0,0 +1,259 @@
+import os
+import math
+import heapq
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from .collision_compiler import DATA_DIR, SEGMENT_FIELDS
+
+NAV_FIELD_CELL = 10  # Map pixels per distance field sample
+NAV_GRID_CELL = 50  # Map pixels per pathfinding node
+NAV_MAX_DISTANCE = 255  # Distances are only tracked this far from a barrier
+NAV_PATH_CACHE_SIZE = 64
+NAV_CACHE_PATH = os.path.join(DATA_DIR, "navigation_cache.npz")
+
+# Pathfinding neighbours: (column step, row step, cost)
+NEIGHBOURS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2))]
+
+
+class Navigation:
+    def __init__(self, collision_data, map_width, map_height, cache_path=NAV_CACHE_PATH):
+        """Distance field and walkability grid built from the compiled barriers."""
+        self.radius = collision_data.radius
+        self.collision_data = collision_data  # Segments and broad-phase grid for exact wall checks
+        self.map_width = map_width
+        self.map_height = map_height
+        self.cache_path = cache_path
+        self.path_cache = OrderedDict()  # (start cell, goal cell) -> list of cells
+
+        key = self.get_cache_key(collision_data)
+        self.field = self.load_cache(key)
+        if self.field is None:
+            self.field = self.build_distance_field(collision_data)
+            self.save_cache(key)
+        self.field_rows, self.field_cols = self.field.shape
+
+        # A node is walkable when the character fits at its center
+        self.grid_cols = int(math.ceil(map_width / NAV_GRID_CELL))
+        self.grid_rows = int(math.ceil(map_height / NAV_GRID_CELL))
+        centers_x = (np.arange(self.grid_cols) + 0.5) * NAV_GRID_CELL
+        centers_y = (np.arange(self.grid_rows) + 0.5) * NAV_GRID_CELL
+        rows = np.minimum((centers_y / NAV_FIELD_CELL).astype(int), self.field_rows - 1)
+        cols = np.minimum((centers_x / NAV_FIELD_CELL).astype(int), self.field_cols - 1)
+        self.walkable = self.field[np.ix_(rows, cols)] >= self.radius
+        self.walkable_flat = self.walkable.ravel().tobytes()  # Fast per-node lookups for A*
+
+    def get_cache_key(self, collision_data):
+        parameters = f"{self.map_width}x{self.map_height}:{NAV_FIELD_CELL}:{NAV_MAX_DISTANCE}"
+        return hashlib.sha256(collision_data.segments.tobytes() + parameters.encode()).hexdigest()
+
+    def load_cache(self, key):
+        """Load the distance field saved for the same barriers and map size."""
+        try:
+            with np.load(self.cache_path) as cache:
+                if str(cache["key"]) == key:
+                    return cache["field"]
+        except (OSError, KeyError, ValueError):
+            pass
+        return None
+
+    def save_cache(self, key):
+        try:
+            np.savez_compressed(self.cache_path, key=np.array(key), field=self.field)
+        except OSError as e:
+            print(f"Navigation: Could not save cache: {e}")
+
+    def build_distance_field(self, collision_data):
+        """Distance from each sample to the nearest barrier surface; negative inside a barrier line."""
+        cols = int(math.ceil(self.map_width / NAV_FIELD_CELL)) + 1
+        rows = int(math.ceil(self.map_height / NAV_FIELD_CELL)) + 1
+        field = np.full((rows, cols), NAV_MAX_DISTANCE, dtype=np.float32)
+
+        segments = np.frombuffer(collision_data.segments.tobytes(), dtype=np.float32).reshape(-1, SEGMENT_FIELDS)
+        for x1, y1, x2, y2, width in segments:
+            # Only the samples within reach of this segment can change
+            reach = NAV_MAX_DISTANCE + width / 2
+            col0 = max(0, int((min(x1, x2) - reach) // NAV_FIELD_CELL))
+            col1 = min(cols, int((max(x1, x2) + reach) // NAV_FIELD_CELL) + 2)
+            row0 = max(0, int((min(y1, y2) - reach) // NAV_FIELD_CELL))
+            row1 = min(rows, int((max(y1, y2) + reach) // NAV_FIELD_CELL) + 2)
+            if col0 >= col1 or row0 >= row1:
+                continue
+
+            px = (np.arange(col0, col1, dtype=np.float32) * NAV_FIELD_CELL)[None, :]
+            py = (np.arange(row0, row1, dtype=np.float32) * NAV_FIELD_CELL)[:, None]
+            dx, dy = x2 - x1, y2 - y1
+            length_sq = dx * dx + dy * dy
+            if length_sq > 0:
+                t = np.clip(((px - x1) * dx + (py - y1) * dy) / length_sq, 0.0, 1.0)
+            else:
+                t = np.zeros((row1 - row0, col1 - col0), dtype=np.float32)
+            distance = np.hypot(px - (x1 + dx * t), py - (y1 + dy * t)) - width / 2
+            np.minimum(field[row0:row1, col0:col1], distance, out=field[row0:row1, col0:col1])
+        return field
+
+    def sample(self, x, y):
+        """Bilinearly interpolated barrier distance at a map position."""
+        fx = x / NAV_FIELD_CELL
+        fy = y / NAV_FIELD_CELL
+        col = int(fx)
+        row = int(fy)
+        if not (0 <= col < self.field_cols - 1 and 0 <= row < self.field_rows - 1):
+            return NAV_MAX_DISTANCE  # Off the map: the map bounds stop the character instead
+        tx = fx - col
+        ty = fy - row
+        field = self.field
+        top = field[row, col] * (1 - tx) + field[row, col + 1] * tx
+        bottom = field[row + 1, col] * (1 - tx) + field[row + 1, col + 1] * tx
+        return float(top * (1 - ty) + bottom * ty)
+
+    def is_blocked(self, pos):
+        """Exact character collision, testing only the segments bucketed into the position's grid cell."""
+        px, py = pos
+        data = self.collision_data
+        col = int(px // data.cell_size)
+        row = int(py // data.cell_size)
+        if not (0 <= col < data.columns and 0 <= row < data.rows):
+            return False  # Off the grid: the map bounds stop the character instead
+        cell = row * data.columns + col
+        segments = data.segments
+        for index in data.indices[data.offsets[cell]:data.offsets[cell + 1]]:
+            base = index * SEGMENT_FIELDS
+            x1, y1, x2, y2, width = segments[base:base + SEGMENT_FIELDS]
+
+            # Closest point on the segment, compared as squared distance
+            dx, dy = x2 - x1, y2 - y1
+            length_sq = dx * dx + dy * dy
+            t = ((px - x1) * dx + (py - y1) * dy) / length_sq if length_sq > 0 else 0
+            t = max(0.0, min(1.0, t))
+            ox = px - (x1 + dx * t)
+            oy = py - (y1 + dy * t)
+            reach = self.radius + width / 2
+            if ox * ox + oy * oy < reach * reach:
+                return True
+        return False
+
+    def is_blocked_many(self, xs, ys, radius):
+        """Vectorized collision test for arrays of map positions, using the nearest field sample."""
+        cols = np.clip((xs * (1 / NAV_FIELD_CELL) + 0.5).astype(np.intp), 0, self.field_cols - 1)
+        rows = np.clip((ys * (1 / NAV_FIELD_CELL) + 0.5).astype(np.intp), 0, self.field_rows - 1)
+        return self.field[rows, cols] < radius
+
+    def random_walkable_positions(self, count, rng):
+        """Map positions at the centers of randomly chosen walkable nodes."""
+        cells = np.flatnonzero(self.walkable.ravel())
+        if len(cells) == 0:
+            return np.zeros((count, 2), dtype=np.float32)
+        chosen = rng.choice(cells, count)
+        positions = np.empty((count, 2), dtype=np.float32)
+        positions[:, 0] = (chosen % self.grid_cols + 0.5) * NAV_GRID_CELL
+        positions[:, 1] = (chosen // self.grid_cols + 0.5) * NAV_GRID_CELL
+        return positions
+
+    def gradient(self, pos):
+        """Direction away from the nearest barrier (not normalized)."""
+        x, y = pos
+        step = NAV_FIELD_CELL
+        return (self.sample(x + step, y) - self.sample(x - step, y),
+                self.sample(x, y + step) - self.sample(x, y - step))
+
+    def to_cell(self, pos):
+        col = min(max(int(pos[0] // NAV_GRID_CELL), 0), self.grid_cols - 1)
+        row = min(max(int(pos[1] // NAV_GRID_CELL), 0), self.grid_rows - 1)
+        return col, row
+
+    def is_walkable_cell(self, col, row):
+        return 0 <= col < self.grid_cols and 0 <= row < self.grid_rows and \
+            self.walkable_flat[row * self.grid_cols + col]
+
+    def nearest_walkable_cell(self, cell, max_rings=10):
+        """The walkable node closest to a cell, searching outwards ring by ring."""
+        col, row = cell
+        if self.is_walkable_cell(col, row):
+            return cell
+        for ring in range(1, max_rings + 1):
+            candidates = [(col + dc, row + dr) for dr in range(-ring, ring + 1) for dc in range(-ring, ring + 1)
+                          if max(abs(dc), abs(dr)) == ring and self.is_walkable_cell(col + dc, row + dr)]
+            if candidates:
+                return min(candidates, key=lambda c: (c[0] - col) ** 2 + (c[1] - row) ** 2)
+        return None
+
+    def find_path(self, start, goal):
+        """Waypoints in map pixels from start to goal, or None if the goal cannot be reached."""
+        start_cell = self.nearest_walkable_cell(self.to_cell(start))
+        goal_cell = self.nearest_walkable_cell(self.to_cell(goal))
+        if start_cell is None or goal_cell is None:
+            return None
+
+        key = (start_cell, goal_cell)
+        cells = self.path_cache.get(key)
+        if cells is None:
+            cells = self.astar(start_cell, goal_cell)
+            self.path_cache[key] = cells
+            while len(self.path_cache) > NAV_PATH_CACHE_SIZE:
+                self.path_cache.popitem(last=False)
+        else:
+            self.path_cache.move_to_end(key)
+        if cells is None:
+            return None
+
+        waypoints = [((col + 0.5) * NAV_GRID_CELL, (row + 0.5) * NAV_GRID_CELL) for col, row in cells]
+        if not self.is_blocked(goal):
+            waypoints.append(goal)
+        return waypoints
+
+    def astar(self, start_cell, goal_cell):
+        """A* over the walkability grid; returns the turning points of the path."""
+        cols = self.grid_cols
+        walkable = self.walkable_flat
+        start = start_cell[1] * cols + start_cell[0]
+        goal = goal_cell[1] * cols + goal_cell[0]
+        goal_col, goal_row = goal_cell
+
+        def heuristic(node):
+            # Octile distance
+            dc = abs(node % cols - goal_col)
+            dr = abs(node // cols - goal_row)
+            return max(dc, dr) + (math.sqrt(2) - 1) * min(dc, dr)
+
+        open_heap = [(heuristic(start), 0.0, start)]
+        came_from = {}
+        cost_so_far = {start: 0.0}
+        while open_heap:
+            _, cost, node = heapq.heappop(open_heap)
+            if node == goal:
+                break
+            if cost > cost_so_far[node]:
+                continue  # Stale heap entry
+
+            col, row = node % cols, node // cols
+            for dc, dr, step_cost in NEIGHBOURS:
+                ncol, nrow = col + dc, row + dr
+                if not self.is_walkable_cell(ncol, nrow):
+                    continue
+                # Diagonals may not cut a blocked corner
+                if dc and dr and not (walkable[row * cols + ncol] and walkable[nrow * cols + col]):
+                    continue
+                neighbour = nrow * cols + ncol
+                new_cost = cost + step_cost
+                if new_cost < cost_so_far.get(neighbour, math.inf):
+                    cost_so_far[neighbour] = new_cost
+                    came_from[neighbour] = node
+                    heapq.heappush(open_heap, (new_cost + heuristic(neighbour), new_cost, neighbour))
+        else:
+            return None
+
+        # Walk back from the goal, keeping only the cells where the direction changes
+        path = [goal]
+        while path[-1] != start:
+            path.append(came_from[path[-1]])
+        path.reverse()
+        cells = [(node % cols, node // cols) for node in path]
+        turning_points = [cells[0]]
+        for previous, current, following in zip(cells, cells[1:], cells[2:]):
+            if (current[0] - previous[0], current[1] - previous[1]) != (following[0] - current[0], following[1] - current[1]):
+                turning_points.append(current)
+        if len(cells) > 1:
+            turning_points.append(cells[-1])
+        return turning_points
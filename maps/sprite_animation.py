@@ -0,0 +1,63 @@
+import pygame
+import os
+import json
+from managers.asset_manager import AssetManager
+from .collision_compiler import DATA_DIR
+
+HERO_DATA_DIR = os.path.join(DATA_DIR, "heroes")
+
+# Facings in frame table order
+FRONT, BACK, LEFT, RIGHT = range(4)
+DIRECTION_NAMES = ["front", "back", "left", "right"]
+
+
+class SpriteAnimationSet:
+    def __init__(self, frames, stand, walk, frame_ms):
+        """Scaled frames plus, per facing, the standing frame index, walk cycle and frame time."""
+        self.frames = frames  # List of scaled surfaces
+        self.stand = stand  # Facing -> frame index
+        self.walk = walk  # Facing -> tuple of frame indices
+        self.frame_ms = frame_ms  # Facing -> milliseconds per walk frame
+
+
+loaded_sets = {}  # (hero, script_dir) -> SpriteAnimationSet, shared by the hero and the NPCs
+
+
+def get_hero_types():
+    """Every hero that has an animation data file."""
+    return sorted(name[:-5] for name in os.listdir(HERO_DATA_DIR) if name.endswith(".json"))
+
+
+def load_animation_set(script_dir, hero_type):
+    """Slice a hero's sprite sheet as described by its data file, scaling every frame once."""
+    key = (hero_type, script_dir)
+    animation_set = loaded_sets.get(key)
+    if animation_set is not None:
+        return animation_set
+
+    with open(os.path.join(HERO_DATA_DIR, f"{hero_type}.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    sheet_path = os.path.join(script_dir, "assets", "images", *data["sheet"].split("/"))
+    sheet = AssetManager().load_image(sheet_path)
+    scale = data.get("scale", 1)
+
+    # Subsurfaces share the sheet's pixels; only the scaled frames are new surfaces
+    frames = []
+    frame_indices = {}
+    for name, rect in data["frames"].items():
+        frame = sheet.subsurface(pygame.Rect(rect))
+        size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+        frame_indices[name] = len(frames)
+        frames.append(pygame.transform.scale(frame, size))
+
+    stand, walk, frame_ms = [], [], []
+    for direction in DIRECTION_NAMES:
+        animation = data["animations"][direction]
+        stand.append(frame_indices[animation["stand"]])
+        walk.append(tuple(frame_indices[name] for name in animation["walk"]))
+        frame_ms.append(animation.get("frame_ms", 120))
+
+    animation_set = SpriteAnimationSet(frames, stand, walk, frame_ms)
+    loaded_sets[key] = animation_set
+    return animation_set
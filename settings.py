@@ -12,6 +12,75 @@ SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
 
+# Static screens drop to IDLE_FPS once nothing has happened for IDLE_DELAY_MS
+IDLE_FPS = 10
+IDLE_DELAY_MS = 1000
+
+# Gameplay (map movement, battle timers) advances in fixed steps of 1 / SIMULATION_HZ
+# seconds, independent of the frame rate. Slow frames run at most SIMULATION_MAX_STEPS.
+SIMULATION_HZ = 60
+SIMULATION_MAX_STEPS = 8
+
+# Internal resolutions the scenes can be drawn at. Lower ones draw fewer pixels on slow
+# machines; the canvas is upscaled to the window every frame.
+RENDER_RESOLUTIONS = [(1920, 1080), (1280, 720), (960, 540)]
+RENDER_WIDTH, RENDER_HEIGHT = RENDER_RESOLUTIONS[0]
+
+# Performance presets offered in the Options screen. On first launch a short
+# benchmark picks one and the choice is saved for this machine.
+PERFORMANCE_PRESETS = {
+    "low": {
+        "render_resolution": RENDER_RESOLUTIONS[2],
+        "menu_video": False,  # Show a static frame instead of the video
+        "fps_cap": 30,
+        "dirty_rects": True,
+        "map_tile_cache": 48,
+        "map_npcs": 60,
+        "particles": 1024,
+    },
+    "medium": {
+        "render_resolution": RENDER_RESOLUTIONS[1],
+        "menu_video": True,
+        "fps_cap": 45,
+        "dirty_rects": True,
+        "map_tile_cache": 96,
+        "map_npcs": 150,
+        "particles": 2048,
+    },
+    "high": {
+        "render_resolution": RENDER_RESOLUTIONS[0],
+        "menu_video": True,
+        "fps_cap": 60,
+        "dirty_rects": False,
+        "map_tile_cache": 192,
+        "map_npcs": 300,
+        "particles": 4096,
+    },
+}
+PERFORMANCE_PRESET_ORDER = ["low", "medium", "high"]
+PERFORMANCE_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".finalquiztasy", "performance.json")
+
+# Startup preloader: groups with a lower priority are loaded first,
+# remove a group to load it on demand instead
+PRELOAD_PRIORITIES = {
+    "main_menu": 0,
+    "hero_selection": 1,
+    "map": 2,
+}
+PRELOAD_WORKERS = 4
+
+# Milliseconds per frame the menus and the map spend preparing battle sprites in the background
+SPRITE_WARM_BUDGET_MS = 2
+
+# Print every frame in which the surface pool had to create a surface (pooled paths only)
+SURFACE_POOL_DEBUG = False
+
+# Print how many draw-list commands each frame queued and how many draw calls they became
+DRAW_LIST_DEBUG = False
+
+# Size in pixels of the grid cells the UI router buckets widgets into for hit tests
+UI_HIT_CELL_SIZE = 128
+
 # Font settings
 FONT_PATH = os.path.join("assets", "fonts", "press_start_2p.ttf")
 FONT_SIZE = 24
@@ -13,7 +13,3 @@ class BackButton:
     def draw(self):
         """Draws the Back button on the screen."""
         self.button.draw(self.screen)
-
-    def update(self, event):
-        """Handles updates (hover, clicks) for the Back button."""
-        self.button.update(event)
@@ -1,17 +1,14 @@
 import pygame
-import time
+from managers.sprite_variants import SpriteVariants
+from managers.display_manager import DisplayManager
+from managers.game_clock import GameClock
 
 class Button:
     def __init__(self, x, y, idle_img, hover_img, click_img=None, action=None, scale=1.0, audio_manager=None, freeze_duration=0):
         """Creates a button with optional freeze time (only for Hero Selection buttons)."""
-        self.idle_img = self.load_image(idle_img)
-        self.hover_img = self.load_image(hover_img)
-        self.click_img = self.load_image(click_img) if click_img else self.hover_img
-
-        # Scale images
-        self.idle_img = pygame.transform.scale(self.idle_img, (int(self.idle_img.get_width() * scale), int(self.idle_img.get_height() * scale)))
-        self.hover_img = pygame.transform.scale(self.hover_img, (int(self.hover_img.get_width() * scale), int(self.hover_img.get_height() * scale)))
-        self.click_img = pygame.transform.scale(self.click_img, (int(self.click_img.get_width() * scale), int(self.click_img.get_height() * scale)))
+        self.idle_img = self.load_image(idle_img, scale)
+        self.hover_img = self.load_image(hover_img, scale)
+        self.click_img = self.load_image(click_img, scale) if click_img else self.hover_img
 
         self.image = self.idle_img
         self.rect = self.image.get_rect(center=(x, y))
@@ -19,45 +16,55 @@ class Button:
         self.visible = True
         self.active = True
         self.clicked = False
+        self.hovered = False  # Pushed by the UI router while the button is registered
         self.click_time = None  # Track click time
         self.freeze_duration = freeze_duration  # ❗ Only Hero Selection buttons will have a freeze time
 
         self.audio_manager = audio_manager
 
-    def load_image(self, img):
-        """Helper method to load an image from file or return the surface if already loaded."""
-        return pygame.image.load(img).convert_alpha() if isinstance(img, str) else img
+        # Last drawn image and rect, so dirty-rect frames only update what changed
+        self.drawn_image = None
+        self.drawn_rect = None
+
+    def load_image(self, img, scale=1.0):
+        """Helper method to load an image from file, or take an already loaded surface, at the button's scale."""
+        if isinstance(img, str):
+            return SpriteVariants().get(img, scale)  # Scaled once for every button using this image
+        if scale == 1:
+            return img
+        return pygame.transform.scale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
 
     def draw(self, screen):
-        """Draw the button on the screen."""
+        """Draw the button on the screen, or queue it when given a DrawList."""
         if self.visible:
+            # The click image shows for at least one frame, or until the freeze time is over
+            if self.clicked and self.active and self.drawn_image is self.image:
+                if GameClock().now() - self.click_time >= self.freeze_duration:
+                    self.clicked = False
+                    self.image = self.hover_img if self.hovered else self.idle_img
             screen.blit(self.image, self.rect.topleft)
+            if self.image is not self.drawn_image or self.rect != self.drawn_rect:
+                dirty = self.rect.union(self.drawn_rect) if self.drawn_rect else self.rect
+                DisplayManager().mark_dirty(dirty)
+                self.drawn_image = self.image
+                self.drawn_rect = self.rect.copy()
 
-    def update(self, event):
-        """Handles hover, click, and optional freeze effect for Hero Selection."""
-        if not self.visible or not self.active:
-            return  # Ignore updates if the button is disabled
-
-        mouse_pos = pygame.mouse.get_pos()
-
-        # If button has a freeze duration, stay on click_img
-        if self.clicked and self.freeze_duration > 0:
-            if time.time() - self.click_time >= self.freeze_duration:  # Wait for freeze_duration seconds
-                self.clicked = False
-                self.image = self.idle_img  # Return to normal
-            return  # Skip hover effect while frozen
+    def set_hovered(self, hovered):
+        """Called by the UI router when the cursor enters or leaves the button."""
+        self.hovered = hovered
+        if self.active and not self.clicked:
+            self.image = self.hover_img if hovered else self.idle_img
 
-        # Hover effect
-        if self.rect.collidepoint(mouse_pos):
-            self.image = self.hover_img
-        else:
-            self.image = self.idle_img
+    def update(self, event):
+        """Handles a click the UI router dispatched, with the optional freeze effect for Hero Selection."""
+        if not self.visible or not self.active or self.clicked:
+            return  # Ignore clicks if the button is disabled or still frozen
 
         # Click effect
-        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(mouse_pos):
+        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos):
             self.image = self.click_img
             self.clicked = True
-            self.click_time = time.time()  # Start freeze timer
+            self.click_time = GameClock().now()  # Start freeze timer
 
             if self.audio_manager and self.audio_manager.audio_enabled:
                 self.audio_manager.play_sfx()
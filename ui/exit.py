@@ -1,5 +1,7 @@
 import pygame
 import os
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 
 class Exit:
     def __init__(self, screen, script_dir, exit_callback=None, audio_manager=None):
@@ -21,8 +23,8 @@ class Exit:
         # Load exit confirmation assets
         quit_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "exit_border.png")
         self.exit_border = pygame.image.load(quit_border_img)
-        self.exit_border = pygame.transform.scale(self.exit_border, (700, 400))
-        self.exit_border_rect = self.exit_border.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.exit_border = pygame.transform.scale(self.exit_border, (px(700), px(400)))
+        self.exit_border_rect = self.exit_border.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Load exit button images
         self.exit_button_images = {
@@ -41,13 +43,13 @@ class Exit:
         from .button import Button
 
         # Yes button
-        self.yes_button = Button(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 130,
+        self.yes_button = Button(px(SCREEN_WIDTH // 2 - 140), px(SCREEN_HEIGHT // 2 + 130),
                                  self.exit_button_images['yes']['normal'],
                                  self.exit_button_images['yes']['hover'],
                                  None, self.confirm_exit, scale=0.4, audio_manager=self.audio_manager)
 
         # No button
-        self.no_button = Button(SCREEN_WIDTH // 2 + 140, SCREEN_HEIGHT // 2 + 130,
+        self.no_button = Button(px(SCREEN_WIDTH // 2 + 140), px(SCREEN_HEIGHT // 2 + 130),
                                 self.exit_button_images['no']['normal'],
                                 self.exit_button_images['no']['hover'],
                                 None, self.cancel_exit, scale=0.4, audio_manager=self.audio_manager)
@@ -55,6 +57,7 @@ class Exit:
     def exit_game(self):
         print("Exit button clicked!")
         self.show_exit_confirmation = True
+        UIRouter().set_scope(self, [self.yes_button, self.no_button])
 
     def confirm_exit(self):
         """Handles the confirmation of exiting the game."""
@@ -64,11 +67,11 @@ class Exit:
 
     def cancel_exit(self):
         self.show_exit_confirmation = False
+        UIRouter().unregister_scope(self)
 
     def handle_events(self, event):
         if self.show_exit_confirmation:
-            self.yes_button.update(event)
-            self.no_button.update(event)
+            UIRouter().dispatch(event, scope=self)
 
     def draw(self):
         if self.show_exit_confirmation:
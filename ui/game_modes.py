@@ -3,6 +3,8 @@ import os
 from ui.button import Button
 from .back_button import BackButton
 from managers.save_manager import SaveManager
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 
 
 class GameModes:
@@ -23,9 +25,9 @@ class GameModes:
 
         # Define button positions
         self.positions = {
-            "sp": (960, 280),  # Middle top
-            "pvp": (480, 800),  # Bottom left
-            "custom": (1440, 800)  # Bottom right
+            "sp": (px(960), px(280)),  # Middle top
+            "pvp": (px(480), px(800)),  # Bottom left
+            "custom": (px(1440), px(800))  # Bottom right
         }
 
         # Load buttons with scaling
@@ -40,13 +42,13 @@ class GameModes:
             os.path.join(script_dir, "assets", "images", "buttons", "game modes", "new or continue", "border.png"))
         # Scale the border image
         original_border_size = border_image.get_rect().size
-        scaled_border_width = int(original_border_size[0] * self.border_scale)
-        scaled_border_height = int(original_border_size[1] * self.border_scale)
+        scaled_border_width = px(original_border_size[0] * self.border_scale)
+        scaled_border_height = px(original_border_size[1] * self.border_scale)
         self.new_continue_border = pygame.transform.scale(border_image, (scaled_border_width, scaled_border_height))
-        self.new_continue_border_rect = self.new_continue_border.get_rect(center=(960, 540))
+        self.new_continue_border_rect = self.new_continue_border.get_rect(center=(px(960), px(540)))
 
         # Create new/continue buttons with custom scaling
-        self.new_button = self.create_button(script_dir, "new", (905, 480), action=self.start_new_game,
+        self.new_button = self.create_button(script_dir, "new", (px(905), px(480)), action=self.start_new_game,
                                              button_scale=self.new_continue_scale)
 
         # Load continue button images (normal, hover, locked)
@@ -59,7 +61,7 @@ class GameModes:
 
         # Create continue button (will be updated based on saved progress)
         self.continue_button = Button(
-            905, 600, continue_img_path, continue_hover_path,
+            px(905), px(600), continue_img_path, continue_hover_path,
             action=self.continue_game, scale=self.new_continue_scale,
             audio_manager=self.audio_manager
         )
@@ -67,13 +69,13 @@ class GameModes:
         # Store locked button image
         self.continue_locked_img = pygame.image.load(continue_locked_path)
         original_size = self.continue_locked_img.get_rect().size
-        scaled_width = int(original_size[0] * self.new_continue_scale)
-        scaled_height = int(original_size[1] * self.new_continue_scale)
+        scaled_width = px(original_size[0] * self.new_continue_scale)
+        scaled_height = px(original_size[1] * self.new_continue_scale)
         self.continue_locked_img = pygame.transform.scale(self.continue_locked_img, (scaled_width, scaled_height))
 
         # Add Back button
         self.back_button = BackButton(self.screen, script_dir, self.go_back, audio_manager=self.audio_manager,
-                                      position=(100, 100), scale=0.25)
+                                      position=(px(100), px(100)), scale=0.25)
 
     def play_single_player(self):
         if not self.auth_manager:  # Check if auth_manager is available
@@ -92,12 +94,14 @@ class GameModes:
 
         for button in self.buttons.values():
             button.active = False  # Disable background buttons when prompt is active
+        self.route_buttons()
 
     def update_continue_button(self, has_progress):
         """Update the continue button based on whether the user has saved progress"""
         if has_progress:
             # Enable continue button
             self.continue_button.active = True
+            self.continue_button.image = self.continue_button.idle_img
         else:
             # Disable continue button and use locked image
             self.continue_button.active = False
@@ -151,17 +155,14 @@ class GameModes:
 
             # Reset any level states in the game instance if they exist
             if self.game_instance and hasattr(self.game_instance, 'lspu_map') and self.game_instance.lspu_map:
-                # Lock all levels except level 1
-                for level in self.game_instance.lspu_map.levels.levels:
-                    if level["id"] > 1:  # Lock all levels except level 1
-                        level["unlocked"] = False
-                    else:
-                        level["unlocked"] = True
+                # Lock all levels except level 1 and go back to the spawn point
+                self.game_instance.lspu_map.reset_progress()
                 print("Game map levels reset")
 
         self.show_new_continue = False
         for button in self.buttons.values():
             button.active = True  # Re-enable buttons when leaving prompt
+        self.route_buttons()
 
         if self.game_instance:
             if hasattr(self.game_instance, 'hero_selection'):
@@ -177,6 +178,7 @@ class GameModes:
             return
         print("Continuing previous game...")
         self.show_new_continue = False
+        self.route_buttons()
 
         # Load saved progress
         progress = self.save_manager.load_progress()
@@ -205,7 +207,7 @@ class GameModes:
             # After the map loads, unlock levels up to the saved level
             if hasattr(self.game_instance, 'lspu_map') and self.game_instance.lspu_map:
                 for level_id in range(1, progress['level'] + 1):
-                    self.game_instance.lspu_map.levels.unlock_level(level_id)
+                    self.game_instance.lspu_map.levels_manager.unlock_level(level_id)
         else:
             print("No saved progress found")
 
@@ -241,6 +243,7 @@ class GameModes:
             self.show_new_continue = False  # Hide only the New/Continue selection
             for button in self.buttons.values():
                 button.active = True  # Re-enable buttons when closing prompt
+            self.route_buttons()
         else:
             self.hide()  # Hide game modes
             if self.game_instance:
@@ -249,20 +252,20 @@ class GameModes:
                     self.game_instance.main_menu.show_game_logo = True  # Show logo
                     self.game_instance.main_menu.main_menu()  # Show main menu elements
 
+    def route_buttons(self):
+        """Register the buttons of the current prompt with the UI router, or none while hidden."""
+        if not self.visible:
+            buttons = []
+        elif self.show_new_continue:
+            buttons = [self.new_button, self.continue_button, self.back_button.button]
+        else:
+            buttons = list(self.buttons.values()) + [self.back_button.button]
+        UIRouter().set_scope(self, buttons)
+
     def update(self, event):
         if self.visible:
-            # Only update back button and active prompt buttons when new/continue is shown
-            if self.show_new_continue:
-                self.new_button.update(event)
-                # Only update continue button if it's active (if there's saved progress)
-                if self.continue_button.active:
-                    self.continue_button.update(event)
-                self.back_button.update(event)
-            else:
-                # Update all buttons when not showing new/continue
-                for button in self.buttons.values():
-                    button.update(event)
-                self.back_button.update(event)
+            # Only the button under a click gets it; the router holds the prompt's buttons alone while it is shown
+            UIRouter().dispatch(event, scope=self)
 
     def draw(self):
         if self.visible:
@@ -287,10 +290,12 @@ class GameModes:
         self.show_new_continue = False  # Reset this when showing the menu
         for button in self.buttons.values():
             button.active = True
+        self.route_buttons()
 
     def hide(self):
         """Hide the game mode selection."""
         self.visible = False
         self.show_new_continue = False  # Reset this when hiding the menu q
         for button in self.buttons.values():
-            button.active = False
\ No newline at end of file
+            button.active = False
+        self.route_buttons()
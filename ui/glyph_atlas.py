@@ -0,0 +1,66 @@
+import pygame
+from settings import FONT_PATH
+from managers.display_manager import px
+
+ATLAS_CHARACTERS = "".join(chr(code) for code in range(32, 127))  # Printable ASCII
+
+atlas_cache = {}  # (font path, canvas size, color) -> GlyphAtlas
+
+
+class GlyphAtlas:
+    def __init__(self, size, color, font_path=FONT_PATH):
+        """Every printable glyph of a monospaced font rasterized once, side by side on one surface.
+
+        Strings are then drawn as one blit per character out of the atlas instead of going through FreeType.
+        """
+        self.font = pygame.font.Font(font_path, size)
+        self.color = color
+        self.advance = self.font.size("M")[0]  # Same for every glyph of a monospaced font
+        self.height = self.font.size("M")[1]
+        self.surface = self.font.render(ATLAS_CHARACTERS, True, color)
+        self.areas = {character: pygame.Rect(index * self.advance, 0, self.advance, self.height)
+                      for index, character in enumerate(ATLAS_CHARACTERS)}
+        self.extra_glyphs = {}  # Characters outside the atlas, rendered on first use
+
+    def size(self, text):
+        """Width and height of text, like pygame.font.Font.size."""
+        return len(text) * self.advance, self.height
+
+    def get_rect(self, text, **position):
+        """Rect text would cover, placed like Surface.get_rect (e.g. center=(x, y))."""
+        rect = pygame.Rect((0, 0), self.size(text))
+        for name, value in position.items():
+            setattr(rect, name, value)
+        return rect
+
+    def glyph_blits(self, text, pos):
+        """(surface, position, area) for each character of text drawn at pos."""
+        x, y = pos
+        blits = []
+        for character in text:
+            area = self.areas.get(character)
+            if area is not None:
+                if character != " ":
+                    blits.append((self.surface, (x, y), area))
+            else:
+                glyph = self.extra_glyphs.get(character)
+                if glyph is None:
+                    glyph = self.extra_glyphs[character] = self.font.render(character, True, self.color)
+                blits.append((glyph, (x, y)))
+            x += self.advance
+        return blits
+
+    def draw(self, target, text, pos):
+        """Draw text with its top-left at pos onto a surface or a DrawList; returns the covered rect."""
+        target.blits(self.glyph_blits(text, pos), doreturn=False)
+        return pygame.Rect(pos, self.size(text))
+
+
+def get_atlas(size, color, font_path=FONT_PATH):
+    """The shared atlas for a layout font size and color, built on first use at the canvas size."""
+    size = px(size)
+    key = (font_path, size, tuple(color))
+    atlas = atlas_cache.get(key)
+    if atlas is None:
+        atlas = atlas_cache[key] = GlyphAtlas(size, color, font_path)
+    return atlas
@@ -5,7 +5,11 @@ import random
 from .button import Button
 from .back_button import BackButton
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.display_manager import DisplayManager
+from managers.display_manager import px
 from managers.save_manager import SaveManager
+from managers.asset_manager import AssetManager
+from managers.ui_router import UIRouter
 
 CONFIRMATION_DELAY = pygame.USEREVENT + 1
 
@@ -23,13 +27,15 @@ class HeroSelection:
         # Load background border
         border_path = os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes",
                                    "hero selection", "choose_hero_border.png")
-        self.border_img = pygame.image.load(border_path)
-        self.border_rect = self.border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.border_img = AssetManager().load_image(border_path)
+        self.border_img = pygame.transform.scale(self.border_img, (px(self.border_img.get_width()),
+                                                                   px(self.border_img.get_height())))
+        self.border_rect = self.border_img.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Character button positions
         self.positions = {
-            "boy": (self.border_rect.centerx - 300, self.border_rect.centery + 30),
-            "girl": (self.border_rect.centerx + 300, self.border_rect.centery + 30)
+            "boy": (self.border_rect.centerx - px(300), self.border_rect.centery + px(30)),
+            "girl": (self.border_rect.centerx + px(300), self.border_rect.centery + px(30))
         }
 
         # Load character buttons with scaling
@@ -44,7 +50,7 @@ class HeroSelection:
             self.game_instance.script_dir,
             self.go_back,
             audio_manager=self.game_instance.audio_manager,
-            position=(100, 100),
+            position=(px(100), px(100)),
             scale=0.25
         )
 
@@ -67,20 +73,20 @@ class HeroSelection:
         # Load confirmation border with scaling
         confirmation_border_path = os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes",
                                                 "hero selection", "yes_or_no_border.png")
-        self.confirmation_border_original = pygame.image.load(confirmation_border_path)
+        self.confirmation_border_original = AssetManager().load_image(confirmation_border_path)
 
         # Apply scaling to confirmation border
         border_scale = 0.7
-        border_width = int(self.confirmation_border_original.get_width() * border_scale)
-        border_height = int(self.confirmation_border_original.get_height() * border_scale)
+        border_width = px(self.confirmation_border_original.get_width() * border_scale)
+        border_height = px(self.confirmation_border_original.get_height() * border_scale)
         self.confirmation_border = pygame.transform.scale(self.confirmation_border_original,
                                                           (border_width, border_height))
         self.confirmation_border_rect = self.confirmation_border.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Create Yes/No buttons with appropriate scaling
-        yes_btn_position = (self.confirmation_border_rect.centerx - 200, self.confirmation_border_rect.centery + 150)
-        no_btn_position = (self.confirmation_border_rect.centerx + 200, self.confirmation_border_rect.centery + 150)
+        yes_btn_position = (self.confirmation_border_rect.centerx - px(200), self.confirmation_border_rect.centery + px(150))
+        no_btn_position = (self.confirmation_border_rect.centerx + px(200), self.confirmation_border_rect.centery + px(150))
 
         button_scale = 0.6  # Scale for the yes/no buttons
 
@@ -191,7 +197,7 @@ class HeroSelection:
         start_time = time.time()
         while time.time() - start_time < freeze_duration:
             self.draw()
-            pygame.display.update()
+            DisplayManager().present()  # Upscales the canvas
 
         # Select the hero's OST based on selection
         hero_ost_path = os.path.join(self.game_instance.script_dir, "assets", "audio", "ost", self.selected_hero,
@@ -204,6 +210,7 @@ class HeroSelection:
 
         for button in self.buttons.values():
             button.active = True
+        self.route_buttons()
 
         # Call the map function
         self.game_instance.map(hero_ost_path)
@@ -218,6 +225,17 @@ class HeroSelection:
         for button in self.buttons.values():
             button.image = button.idle_img
             button.active = True
+        self.route_buttons()
+
+    def route_buttons(self):
+        """Register the buttons of the current state with the UI router, or none while hidden."""
+        if not self.visible:
+            buttons = []
+        elif self.confirmation_active:
+            buttons = [self.yes_button, self.no_button]  # While confirmation is active, only Yes/No buttons respond
+        else:
+            buttons = list(self.buttons.values()) + [self.back_button.button]
+        UIRouter().set_scope(self, buttons)
 
     def update(self, event):
         """Handles button interactions and enforces click delay."""
@@ -226,22 +244,15 @@ class HeroSelection:
                 # Show confirmation exactly after 1 second
                 self.confirmation_active = True
                 pygame.time.set_timer(CONFIRMATION_DELAY, 0)  # Stop the timer
+                self.route_buttons()
 
-            if self.confirmation_active:
-                # While confirmation is active, only Yes/No buttons respond
-                self.yes_button.update(event)
-                self.no_button.update(event)
-            else:
-                # Normal hero selection state
-                for button in self.buttons.values():
-                    button.update(event)
-                self.back_button.update(event)
+            UIRouter().dispatch(event, scope=self)
 
     def draw(self):
         """Draw the hero selection screen."""
-        frame_surface = self.background_menu.get_frame()
-        frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.screen.blit(frame_surface, (0, 0))
+        display_manager = DisplayManager()
+        frame_surface = self.background_menu.get_frame(display_manager.render_size)
+        display_manager.draw_background(frame_surface)
 
         if self.visible:
             # Draw the main border
@@ -274,12 +285,14 @@ class HeroSelection:
         for button in self.buttons.values():
             button.visible = True
             button.active = True
+        self.route_buttons()
         print("Hero selection screen opened.")
 
     def hide(self):
         """Hide the hero selection screen."""
         self.visible = False
         self.confirmation_active = False
+        self.route_buttons()
         if self.voiceline_sound:
             self.voiceline_sound.stop()
             self.voiceline_sound = None
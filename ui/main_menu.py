@@ -1,9 +1,12 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH, FONT_SIZE
+from settings import SCREEN_WIDTH, FONT_PATH, FONT_SIZE
 from .button import Button
 from managers.audio_manager import AudioManager
 from managers.auth_manager import AuthManager
+from managers.asset_manager import AssetManager
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 from .game_modes import GameModes
 from .back_button import BackButton
 from .hero_selection import HeroSelection
@@ -41,14 +44,17 @@ class MainMenu:
         if not self.game_instance:
             self.game_modes = GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self)
 
+        self.route_buttons()
+
     def load_assets(self):
         # Load game logo
         game_logo_img = os.path.join(self.script_dir, "assets", "images", "logo", "logo.png")
-        self.game_logo = pygame.image.load(game_logo_img)
+        asset_manager = AssetManager()
+        self.game_logo = asset_manager.load_image(game_logo_img)
         self.game_logo = pygame.transform.scale(self.game_logo, (
-            int(self.game_logo.get_width() * 0.75), int(self.game_logo.get_height() * 0.75)))
-        custom_x = 1070
-        custom_y = 220
+            px(self.game_logo.get_width() * 0.75), px(self.game_logo.get_height() * 0.75)))
+        custom_x = px(1070)
+        custom_y = px(220)
         self.game_logo_rect = self.game_logo.get_rect(centerx=custom_x, centery=custom_y)
 
         # Load menu button images
@@ -86,45 +92,45 @@ class MainMenu:
 
         # Load the login icon (normal state)
         if os.path.exists(login_icon_path):
-            self.login_icon = pygame.image.load(login_icon_path)
-            self.login_icon = pygame.transform.scale(self.login_icon, (125, 125))
+            self.login_icon = asset_manager.load_image(login_icon_path)
+            self.login_icon = pygame.transform.scale(self.login_icon, (px(125), px(125)))
 
         # Load the login icon hover image
         if os.path.exists(login_icon_hover_path):
-            self.login_icon_hover = pygame.image.load(login_icon_hover_path)
-            self.login_icon_hover = pygame.transform.scale(self.login_icon_hover, (125, 125))
+            self.login_icon_hover = asset_manager.load_image(login_icon_hover_path)
+            self.login_icon_hover = pygame.transform.scale(self.login_icon_hover, (px(125), px(125)))
 
         # Load the registered icon (normal state)
         if os.path.exists(registered_icon_path):
-            self.registered_icon = pygame.image.load(registered_icon_path)
-            self.registered_icon = pygame.transform.scale(self.registered_icon, (125, 125))
+            self.registered_icon = asset_manager.load_image(registered_icon_path)
+            self.registered_icon = pygame.transform.scale(self.registered_icon, (px(125), px(125)))
 
         # Load the registered icon hover image
         if os.path.exists(registered_icon_hover_path):
-            self.registered_icon_hover = pygame.image.load(registered_icon_hover_path)
-            self.registered_icon_hover = pygame.transform.scale(self.registered_icon_hover, (125, 125))
+            self.registered_icon_hover = asset_manager.load_image(registered_icon_hover_path)
+            self.registered_icon_hover = pygame.transform.scale(self.registered_icon_hover, (px(125), px(125)))
 
         # Create font for login text
-        self.login_font = pygame.font.Font(FONT_PATH, FONT_SIZE // 2)
+        self.login_font = pygame.font.Font(FONT_PATH, px(FONT_SIZE // 2))
 
     def create_buttons(self):
         # Create main menu buttons
-        self.play_button = Button(920, 670, self.button_images['play']['normal'],
+        self.play_button = Button(px(920), px(670), self.button_images['play']['normal'],
                                   self.button_images['play']['hover'],
                                   self.button_images['play']['click'],
                                   self.play_game, scale=0.50, audio_manager=self.audio_manager)
 
-        self.options_button = Button(920, 750, self.button_images['options']['normal'],
+        self.options_button = Button(px(920), px(750), self.button_images['options']['normal'],
                                      self.button_images['options']['hover'],
                                      self.button_images['options']['click'],
                                      self.open_options, scale=0.50, audio_manager=self.audio_manager)
 
-        self.credits_button = Button(920, 830, self.button_images['credits']['normal'],
+        self.credits_button = Button(px(920), px(830), self.button_images['credits']['normal'],
                                      self.button_images['credits']['hover'],
                                      self.button_images['credits']['click'],
                                      self.show_credits, scale=0.50, audio_manager=self.audio_manager)
 
-        self.exit_button = Button(920, 910, self.button_images['exit']['normal'],
+        self.exit_button = Button(px(920), px(910), self.button_images['exit']['normal'],
                                   self.button_images['exit']['hover'],
                                   self.button_images['exit']['click'],
                                   self.exit_game, scale=0.50, audio_manager=self.audio_manager)
@@ -138,17 +144,25 @@ class MainMenu:
             button_img = self.login_icon
             button_hover = self.login_icon_hover
 
-        self.login_button = Button(100, SCREEN_HEIGHT - 100,
+        self.login_button = Button(px(100), px(100),
                                    button_img,
                                    button_hover,
                                    button_img,  # No click image
                                    self.open_login_screen,
                                    scale=1.0,
                                    audio_manager=self.audio_manager)
+        self.login_button_logged_in = bool(self.auth_manager.get_current_user())
 
         self.menu_buttons = [self.play_button, self.options_button, self.credits_button, self.exit_button,
                              self.login_button]
 
+    def route_buttons(self):
+        """Register the menu buttons with the UI router while no other screen or dialog covers them."""
+        covered = (not self.visible or self.login_screen.visible or self.login_screen.register_screen.visible or
+                   self.logout_screen.visible or self.exit_handler.show_exit_confirmation or
+                   self.options_handler.show_settings or self.is_game_modes_visible())
+        UIRouter().set_scope(self, [] if covered else self.menu_buttons)
+
     def open_login_screen(self):
         """Open the login or logout screen based on login status"""
         current_user = self.auth_manager.get_current_user()
@@ -156,6 +170,7 @@ class MainMenu:
             self.logout_screen.show()
         else:
             self.login_screen.show()
+        self.route_buttons()
 
     def on_login_close(self):
         """Callback when login screen is closed"""
@@ -165,6 +180,7 @@ class MainMenu:
 
         # Update login button appearance when login screen closes
         self.update_login_button()
+        self.route_buttons()
 
         # Debug: Print current user after update
         current_user_after = self.auth_manager.get_current_user()
@@ -180,49 +196,26 @@ class MainMenu:
         """Callback when logout screen is closed"""
         # Update login button appearance when logout screen closes
         self.update_login_button()
+        self.route_buttons()
 
     def update_login_button(self):
         """Update login button based on user login status"""
-        current_user = self.auth_manager.get_current_user()
+        logged_in = bool(self.auth_manager.get_current_user())
 
-        # Store current mouse position to check hover state
-        mouse_pos = pygame.mouse.get_pos()
-        was_hovering = self.login_button.rect.collidepoint(mouse_pos)
+        # Called every frame, so the images are only swapped when the status changed
+        if logged_in == self.login_button_logged_in:
+            return
+        self.login_button_logged_in = logged_in
 
-        # Re-create the login button with appropriate images
-        if current_user:
-            # Remove the old button from menu_buttons list
-            if self.login_button in self.menu_buttons:
-                self.menu_buttons.remove(self.login_button)
-
-            # Create a new button with the registered icon
-            self.login_button = Button(100, 100,
-                                       self.registered_icon,
-                                       self.registered_icon_hover,
-                                       self.registered_icon,  # No click image
-                                       self.open_login_screen,
-                                       scale=1.0,
-                                       audio_manager=self.audio_manager)
+        if logged_in:
+            idle_img, hover_img = self.registered_icon, self.registered_icon_hover
         else:
-            # Remove the old button from menu_buttons list
-            if self.login_button in self.menu_buttons:
-                self.menu_buttons.remove(self.login_button)
-
-            # Create a new button with the login icon
-            self.login_button = Button(100, 100,
-                                       self.login_icon,
-                                       self.login_icon_hover,
-                                       self.login_icon,  # No click image
-                                       self.open_login_screen,
-                                       scale=1.0,
-                                       audio_manager=self.audio_manager)
-
-        # Restore hover state if mouse is over button
-        if was_hovering:
-            self.login_button.image = self.login_button.hover_img
-
-        # Add the new button to menu_buttons
-        self.menu_buttons.append(self.login_button)
+            idle_img, hover_img = self.login_icon, self.login_icon_hover
+
+        # Swap the images on the same button so it stays registered with the UI router
+        button = self.login_button
+        button.idle_img, button.hover_img, button.click_img = idle_img, hover_img, idle_img  # No click image
+        button.image = hover_img if button.hovered else idle_img
 
     def play_game(self):
         # Before checking login status, update button state
@@ -255,9 +248,11 @@ class MainMenu:
         # Hide main menu buttons
         for button in self.menu_buttons:
             button.visible = False
+        self.route_buttons()
 
     def open_options(self):
         self.options_handler.open_options(self.menu_buttons)
+        self.route_buttons()
 
     def show_credits(self):
         print("Credits button clicked!")
@@ -267,6 +262,7 @@ class MainMenu:
 
     def exit_game(self):
         self.exit_handler.exit_game()
+        self.route_buttons()
 
     def handle_events(self, event):
         if self.login_screen.visible or (
@@ -291,12 +287,15 @@ class MainMenu:
 
         elif self.exit_handler.show_exit_confirmation:
             self.exit_handler.handle_events(event)
+            if not self.exit_handler.show_exit_confirmation:
+                self.route_buttons()  # The dialog was cancelled
         elif self.options_handler.show_settings:
             self.options_handler.handle_events(event, self.menu_buttons)
+            if not self.options_handler.show_settings:
+                self.route_buttons()  # The settings were closed
         else:
-            # Only update main menu buttons if settings and exit confirmation are not open
-            for button in self.menu_buttons:
-                button.update(event)
+            # Only the menu button under a click gets it, and only while nothing covers the menu
+            UIRouter().dispatch(event, scope=self)
 
         # For Game Modes
         if self.game_instance and self.game_instance.game_modes.visible:
@@ -362,7 +361,7 @@ class MainMenu:
 
             # Render and draw the text
             text_surf = self.login_font.render(status_text, True, pygame.Color('white'))
-            self.screen.blit(text_surf, (175, 100))
+            self.screen.blit(text_surf, (px(175), px(100)))
 
     def is_game_modes_visible(self):
         """Helper method to check if game modes is visible regardless of where it's stored"""
@@ -377,10 +376,12 @@ class MainMenu:
         self.visible = True
         # Update login button when showing the main menu
         self.update_login_button()
+        self.route_buttons()
 
     def hide(self):
         """Hide the main menu."""
         self.visible = False
+        self.route_buttons()
 
     def main_menu(self):
         # Ensure all main menu buttons are visible
@@ -397,4 +398,5 @@ class MainMenu:
         if self.game_instance and hasattr(self.game_instance, 'game_modes'):
             self.game_instance.game_modes.hide()
         elif hasattr(self, 'game_modes'):
-            self.game_modes.hide()
\ No newline at end of file
+            self.game_modes.hide()
+        self.route_buttons()
\ No newline at end of file
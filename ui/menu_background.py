@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 import pygame
 import sys
+from managers.performance_manager import PerformanceManager
 
 class MenuBackground:
     def __init__(self, file_path, speed=0.5):
@@ -11,8 +12,18 @@ class MenuBackground:
             sys.exit()
         self.speed = speed
         self.frame_counter = 0
+        self.static_frames = {}  # size -> still frame used when menu video is off
+        self.last_frame = None
+
+    def get_frame(self, size=None, advance=True):
+        """Return the next video frame, resized to size (width, height) if given."""
+        if not PerformanceManager().get("menu_video"):
+            return self.get_static_frame(size)
+
+        # Hold the last frame without decoding again
+        if not advance and self.last_frame and (not size or self.last_frame.get_size() == tuple(size)):
+            return self.last_frame
 
-    def get_frame(self):
         self.frame_counter += self.speed
         self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.frame_counter)
 
@@ -22,9 +33,31 @@ class MenuBackground:
             self.frame_counter = 0
             ret, frame = self.cap.read()
 
+        if size and (frame.shape[1], frame.shape[0]) != tuple(size):
+            # Resizing the decoded frame is cheaper than scaling the pygame surface
+            frame = cv2.resize(frame, tuple(size), interpolation=cv2.INTER_LINEAR)
+
         frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         frame = np.rot90(frame)
-        return pygame.surfarray.make_surface(frame)
+        self.last_frame = pygame.surfarray.make_surface(frame)
+        return self.last_frame
+
+    def get_static_frame(self, size=None):
+        """Decode the current frame once per size and keep showing it."""
+        key = tuple(size) if size else None
+        frame = self.static_frames.get(key)
+        if frame is None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.frame_counter)
+            ret, frame = self.cap.read()
+            if not ret:
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = self.cap.read()
+            if size and (frame.shape[1], frame.shape[0]) != key:
+                frame = cv2.resize(frame, key, interpolation=cv2.INTER_LINEAR)
+            frame = np.rot90(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            frame = pygame.surfarray.make_surface(frame).convert()
+            self.static_frames[key] = frame
+        return frame
 
     def close(self):
         self.cap.release()
\ No newline at end of file
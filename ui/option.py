@@ -1,5 +1,8 @@
 import pygame
 import os
+from managers.display_manager import px
+from managers.performance_manager import PerformanceManager
+from managers.ui_router import UIRouter
 
 class Options:
     def __init__(self, screen, audio_manager, script_dir):
@@ -12,6 +15,8 @@ class Options:
         self.show_apply_changes = False
         self.audio_enabled = True
         self.temp_audio_enabled = True
+        self.performance_manager = PerformanceManager()
+        self.temp_preset = self.performance_manager.get_preset()
         self.menu_buttons = []  # Store menu buttons
 
         # Load settings assets
@@ -25,27 +30,38 @@ class Options:
         settings_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "settings",
                                            "settings_border.png")
         self.settings_border = pygame.image.load(settings_border_img)
-        self.settings_border = pygame.transform.scale(self.settings_border, (700, 400))
-        self.settings_border_rect = self.settings_border.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.settings_border = pygame.transform.scale(self.settings_border, (px(700), px(400)))
+        self.settings_border_rect = self.settings_border.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Load apply changes border
         apply_changes_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "settings",
                                                 "apply_changes_border.png")
         self.apply_changes_border = pygame.image.load(apply_changes_border_img)
-        self.apply_changes_border = pygame.transform.scale(self.apply_changes_border, (700, 400))
+        self.apply_changes_border = pygame.transform.scale(self.apply_changes_border, (px(700), px(400)))
         self.apply_changes_border_rect = self.apply_changes_border.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Load audio toggle images
         self.audio_on_img = pygame.image.load(
             os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_on.png"))
         self.audio_off_img = pygame.image.load(
             os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_off.png"))
-        self.audio_on_img = pygame.transform.scale(self.audio_on_img, (150, 130))
-        self.audio_off_img = pygame.transform.scale(self.audio_off_img, (150, 130))
+        self.audio_on_img = pygame.transform.scale(self.audio_on_img, (px(150), px(130)))
+        self.audio_off_img = pygame.transform.scale(self.audio_off_img, (px(150), px(130)))
 
         from settings import SCREEN_WIDTH, SCREEN_HEIGHT
-        self.audio_img_rect = self.audio_on_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 10))
+        self.audio_img_rect = self.audio_on_img.get_rect(center=(px(SCREEN_WIDTH // 2 - 150), px(SCREEN_HEIGHT // 2 - 10)))
+
+        # Graphics preset selector, drawn as "< PRESET >" next to the audio icon
+        from settings import FONT_PATH, FONT_SIZE
+        self.preset_font = pygame.font.Font(FONT_PATH, px(FONT_SIZE))
+        self.preset_label = self.preset_font.render("GRAPHICS", True, (255, 255, 255))
+        self.preset_label_rect = self.preset_label.get_rect(center=(px(SCREEN_WIDTH // 2 + 150), px(SCREEN_HEIGHT // 2 - 50)))
+        self.preset_left_arrow = self.preset_font.render("<", True, (255, 255, 255))
+        self.preset_left_rect = self.preset_left_arrow.get_rect(center=(px(SCREEN_WIDTH // 2 + 50), px(SCREEN_HEIGHT // 2)))
+        self.preset_right_arrow = self.preset_font.render(">", True, (255, 255, 255))
+        self.preset_right_rect = self.preset_right_arrow.get_rect(center=(px(SCREEN_WIDTH // 2 + 250), px(SCREEN_HEIGHT // 2)))
+        self.preset_texts = {}  # preset -> rendered name
 
         # Load apply/discard button images
         self.settings_button_images = {
@@ -66,33 +82,33 @@ class Options:
         from .button import Button
 
         # Initialize buttons with image paths and actions
-        self.audio_toggle_button = Button(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 10,
+        self.audio_toggle_button = Button(px(SCREEN_WIDTH // 2 - 150), px(SCREEN_HEIGHT // 2 - 10),
                                           self.audio_on_img, self.audio_on_img,
                                           None, self.toggle_audio,
                                           scale=1.0, audio_manager=self.audio_manager
                                           )
 
         # Apply button
-        self.apply_button = Button(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 130,
+        self.apply_button = Button(px(SCREEN_WIDTH // 2 - 140), px(SCREEN_HEIGHT // 2 + 130),
                                    self.settings_button_images['apply']['normal'],
                                    self.settings_button_images['apply']['hover'],
                                    None, self.apply_settings, scale=0.4, audio_manager=self.audio_manager)
 
         # Discard button
-        self.discard_button = Button(SCREEN_WIDTH // 2 + 140, SCREEN_HEIGHT // 2 + 130,
+        self.discard_button = Button(px(SCREEN_WIDTH // 2 + 140), px(SCREEN_HEIGHT // 2 + 130),
                                      self.settings_button_images['discard']['normal'],
                                      self.settings_button_images['discard']['hover'],
                                      None, self.discard_settings, scale=0.4, audio_manager=self.audio_manager)
 
         # Confirm apply button
-        self.confirm_apply_button = Button(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 130,
+        self.confirm_apply_button = Button(px(SCREEN_WIDTH // 2 - 140), px(SCREEN_HEIGHT // 2 + 130),
                                            self.settings_button_images['apply']['normal'],
                                            self.settings_button_images['apply']['hover'],
                                            None, self.confirm_apply_settings, scale=0.4,
                                            audio_manager=self.audio_manager)
 
         # Cancel apply button
-        self.cancel_apply_button = Button(SCREEN_WIDTH // 2 + 140, SCREEN_HEIGHT // 2 + 130,
+        self.cancel_apply_button = Button(px(SCREEN_WIDTH // 2 + 140), px(SCREEN_HEIGHT // 2 + 130),
                                           self.settings_button_images['discard']['normal'],
                                           self.settings_button_images['discard']['hover'],
                                           None, self.cancel_apply_settings, scale=0.4, audio_manager=self.audio_manager)
@@ -104,19 +120,30 @@ class Options:
         self.menu_buttons = menu_buttons
         # Save current settings for potential discard
         self.temp_audio_enabled = self.audio_enabled
+        self.temp_preset = self.performance_manager.get_preset()
         # Disable main menu buttons when settings are open
         for button in menu_buttons:
             button.active = False
+        self.route_buttons()
 
     def toggle_audio(self):
         print("Audio toggle clicked!")
         self.temp_audio_enabled = not self.temp_audio_enabled
         self.audio_manager.toggle_audio()  # Mute/unmute audio instantly
 
+    def cycle_preset(self, step):
+        """Select the next or previous graphics preset; it takes effect on apply."""
+        from settings import PERFORMANCE_PRESET_ORDER
+        index = PERFORMANCE_PRESET_ORDER.index(self.temp_preset)
+        self.temp_preset = PERFORMANCE_PRESET_ORDER[(index + step) % len(PERFORMANCE_PRESET_ORDER)]
+        if self.audio_manager:
+            self.audio_manager.play_sfx()
+
     def apply_settings(self):
         print("Apply settings clicked!")
         # Show confirmation dialog
         self.show_apply_changes = True
+        self.route_buttons()
 
     def discard_settings(self):
         print("Discard settings clicked!")
@@ -127,20 +154,35 @@ class Options:
         # Re-enable main menu buttons when settings are closed
         for button in self.menu_buttons:
             button.active = True
+        self.route_buttons()
 
     def confirm_apply_settings(self):
         print("Confirming settings...")
         # Apply settings permanently
         self.audio_enabled = self.temp_audio_enabled
+        if self.temp_preset != self.performance_manager.get_preset():
+            self.performance_manager.apply_preset(self.temp_preset)
         self.show_apply_changes = False
         self.show_settings = False
         # Re-enable main menu buttons when settings are closed
         for button in self.menu_buttons:
             button.active = True
+        self.route_buttons()
 
     def cancel_apply_settings(self):
         print("Canceling apply confirmation...")
         self.show_apply_changes = False
+        self.route_buttons()
+
+    def route_buttons(self):
+        """Register the buttons of the open dialog with the UI router, or none while settings are closed."""
+        if not self.show_settings:
+            buttons = []
+        elif self.show_apply_changes:
+            buttons = [self.confirm_apply_button, self.cancel_apply_button]
+        else:
+            buttons = [self.audio_toggle_button, self.apply_button, self.discard_button]
+        UIRouter().set_scope(self, buttons)
 
     def handle_events(self, event, menu_buttons=None):
         # Store menu buttons if provided
@@ -148,13 +190,12 @@ class Options:
             self.menu_buttons = menu_buttons
 
         if self.show_settings:
-            if self.show_apply_changes:
-                self.confirm_apply_button.update(event)
-                self.cancel_apply_button.update(event)
-            else:
-                self.audio_toggle_button.update(event)
-                self.apply_button.update(event)
-                self.discard_button.update(event)
+            if not self.show_apply_changes and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if self.preset_left_rect.inflate(px(30), px(30)).collidepoint(event.pos):
+                    self.cycle_preset(-1)
+                elif self.preset_right_rect.inflate(px(30), px(30)).collidepoint(event.pos):
+                    self.cycle_preset(1)
+            UIRouter().dispatch(event, scope=self)
 
     def draw(self):
         from settings import SCREEN_WIDTH, SCREEN_HEIGHT
@@ -166,6 +207,7 @@ class Options:
             # Draw the appropriate audio icon based on status
             audio_img = self.audio_on_img if self.temp_audio_enabled else self.audio_off_img
             self.screen.blit(audio_img, self.audio_img_rect.topleft)
+            self.draw_preset_selector()
 
             if self.show_apply_changes:
                 # Draw apply changes confirmation
@@ -175,4 +217,15 @@ class Options:
             else:
                 # Draw apply/discard buttons
                 self.apply_button.draw(self.screen)
-                self.discard_button.draw(self.screen)
\ No newline at end of file
+                self.discard_button.draw(self.screen)
+    def draw_preset_selector(self):
+        preset_text = self.preset_texts.get(self.temp_preset)
+        if preset_text is None:
+            preset_text = self.preset_font.render(self.temp_preset.upper(), True, (255, 255, 255))
+            self.preset_texts[self.temp_preset] = preset_text
+
+        self.screen.blit(self.preset_label, self.preset_label_rect)
+        self.screen.blit(self.preset_left_arrow, self.preset_left_rect)
+        self.screen.blit(preset_text, preset_text.get_rect(center=(self.preset_label_rect.centerx,
+                                                                   self.preset_left_rect.centery)))
+        self.screen.blit(self.preset_right_arrow, self.preset_right_rect)
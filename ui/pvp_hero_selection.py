@@ -5,6 +5,9 @@ import random
 from ui.button import Button
 from .back_button import BackButton
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.display_manager import DisplayManager
+from managers.display_manager import px
+from managers.ui_router import UIRouter
 
 CONFIRMATION_DELAY = pygame.USEREVENT + 1
 
@@ -30,27 +33,27 @@ class PVPHeroSelection:
         original_border_p1 = pygame.image.load(border_path_p1)
         original_border_p2 = pygame.image.load(border_path_p2)
 
-        border_width_p1 = int(original_border_p1.get_width() * border_scale)
-        border_height_p1 = int(original_border_p1.get_height() * border_scale)
+        border_width_p1 = px(original_border_p1.get_width() * border_scale)
+        border_height_p1 = px(original_border_p1.get_height() * border_scale)
         self.border_img_p1 = pygame.transform.scale(original_border_p1, (border_width_p1, border_height_p1))
 
-        border_width_p2 = int(original_border_p2.get_width() * border_scale)
-        border_height_p2 = int(original_border_p2.get_height() * border_scale)
+        border_width_p2 = px(original_border_p2.get_width() * border_scale)
+        border_height_p2 = px(original_border_p2.get_height() * border_scale)
         self.border_img_p2 = pygame.transform.scale(original_border_p2, (border_width_p2, border_height_p2))
 
         # Position borders
-        self.border_rect_p1 = self.border_img_p1.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.border_rect_p2 = self.border_img_p2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+        self.border_rect_p1 = self.border_img_p1.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
+        self.border_rect_p2 = self.border_img_p2.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 50)))
 
         # Character button positions for player 1
         self.positions_p1 = {
-            "boy": (self.border_rect_p1.centerx - 300, self.border_rect_p1.centery + 87),
-            "girl": (self.border_rect_p1.centerx + 300, self.border_rect_p1.centery + 87)
+            "boy": (self.border_rect_p1.centerx - px(300), self.border_rect_p1.centery + px(87)),
+            "girl": (self.border_rect_p1.centerx + px(300), self.border_rect_p1.centery + px(87))
         }
 
         self.positions_p2 = {
-            "boy": (self.border_rect_p1.centerx - 300, self.border_rect_p1.centery + 87),
-            "girl": (self.border_rect_p1.centerx + 300, self.border_rect_p1.centery + 87)
+            "boy": (self.border_rect_p1.centerx - px(300), self.border_rect_p1.centery + px(87)),
+            "girl": (self.border_rect_p1.centerx + px(300), self.border_rect_p1.centery + px(87))
         }
 
         # Load character buttons with scaling for both players
@@ -74,7 +77,7 @@ class PVPHeroSelection:
             self.game_instance.script_dir,
             self.go_back,
             audio_manager=self.game_instance.audio_manager,
-            position=(100, 100),
+            position=(px(100), px(100)),
             scale=0.25
         )
 
@@ -99,16 +102,16 @@ class PVPHeroSelection:
 
         # Apply scaling to confirmation border
         border_scale = 0.7
-        border_width = int(self.confirmation_border_original.get_width() * border_scale)
-        border_height = int(self.confirmation_border_original.get_height() * border_scale)
+        border_width = px(self.confirmation_border_original.get_width() * border_scale)
+        border_height = px(self.confirmation_border_original.get_height() * border_scale)
         self.confirmation_border = pygame.transform.scale(self.confirmation_border_original,
                                                           (border_width, border_height))
         self.confirmation_border_rect = self.confirmation_border.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2)))
 
         # Create Yes/No buttons with appropriate scaling
-        yes_btn_position = (self.confirmation_border_rect.centerx - 200, self.confirmation_border_rect.centery + 150)
-        no_btn_position = (self.confirmation_border_rect.centerx + 200, self.confirmation_border_rect.centery + 150)
+        yes_btn_position = (self.confirmation_border_rect.centerx - px(200), self.confirmation_border_rect.centery + px(150))
+        no_btn_position = (self.confirmation_border_rect.centerx + px(200), self.confirmation_border_rect.centery + px(150))
 
         button_scale = 0.6  # Scale for the yes/no buttons
 
@@ -134,9 +137,9 @@ class PVPHeroSelection:
         self.voiceline_sound = None
 
         # Status text for player turn indication
-        self.font = pygame.font.Font(None, 48)
+        self.font = pygame.font.Font(None, px(48))
         self.status_text = self.font.render("Player 1's Turn", True, (255, 255, 255))
-        self.status_rect = self.status_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+        self.status_rect = self.status_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(150)))
 
     def create_button(self, name, position, player, scale=1.0, freeze_duration=0):
         """Helper to create buttons with player number."""
@@ -210,7 +213,8 @@ class PVPHeroSelection:
                 button.active = True
             # Update status text
             self.status_text = self.font.render("Player 2's Turn", True, (255, 255, 255))
-            self.status_rect = self.status_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
+            self.status_rect = self.status_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(150)))
+            self.route_buttons()
         else:  # Both players have selected
             # Store selections in game instance
             self.game_instance.p1_hero = self.selected_heroes[1]
@@ -224,7 +228,7 @@ class PVPHeroSelection:
             start_time = time.time()
             while time.time() - start_time < freeze_duration:
                 self.draw()
-                pygame.display.update()
+                DisplayManager().present()  # Upscales the canvas
 
             # Hide this screen
             self.hide()
@@ -254,6 +258,19 @@ class PVPHeroSelection:
             for button in self.buttons_p2.values():
                 button.image = button.idle_img
                 button.active = True
+        self.route_buttons()
+
+    def route_buttons(self):
+        """Register the buttons of the current state with the UI router, or none while hidden."""
+        if not self.visible:
+            buttons = []
+        elif self.confirmation_active:
+            buttons = [self.yes_button, self.no_button]  # While confirmation is active, only Yes/No buttons respond
+        else:
+            # Normal hero selection state based on current player
+            player_buttons = self.buttons_p1 if self.current_player == 1 else self.buttons_p2
+            buttons = list(player_buttons.values()) + [self.back_button.button]
+        UIRouter().set_scope(self, buttons)
 
     def update(self, event):
         """Handles button interactions and enforces click delay."""
@@ -262,26 +279,15 @@ class PVPHeroSelection:
                 # Show confirmation exactly after 1 second
                 self.confirmation_active = True
                 pygame.time.set_timer(CONFIRMATION_DELAY, 0)  # Stop the timer
+                self.route_buttons()
 
-            if self.confirmation_active:
-                # While confirmation is active, only Yes/No buttons respond
-                self.yes_button.update(event)
-                self.no_button.update(event)
-            else:
-                # Normal hero selection state based on current player
-                if self.current_player == 1:
-                    for button in self.buttons_p1.values():
-                        button.update(event)
-                else:
-                    for button in self.buttons_p2.values():
-                        button.update(event)
-                self.back_button.update(event)
+            UIRouter().dispatch(event, scope=self)
 
     def draw(self):
         """Draw the PVP hero selection screen."""
-        frame_surface = self.background_menu.get_frame()
-        frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.screen.blit(frame_surface, (0, 0))
+        display_manager = DisplayManager()
+        frame_surface = self.background_menu.get_frame(display_manager.render_size)
+        display_manager.draw_background(frame_surface)
 
         if self.visible:
             # Draw the status text showing whose turn it is
@@ -327,6 +333,7 @@ class PVPHeroSelection:
             button.visible = True
             button.active = False
             button.image = button.idle_img
+        self.route_buttons()
 
         print("PVP Hero selection screen opened.")
 
@@ -334,6 +341,7 @@ class PVPHeroSelection:
         """Hide the hero selection screen."""
         self.visible = False
         self.confirmation_active = False
+        self.route_buttons()
         if self.voiceline_sound:
             self.voiceline_sound.stop()
             self.voiceline_sound = None
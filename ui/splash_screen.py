@@ -0,0 +1,56 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH, FONT_SIZE
+from managers.asset_manager import AssetPreloader
+from managers.display_manager import DisplayManager, px
+
+
+class SplashScreen:
+    def __init__(self, screen, manifest):
+        """Lightweight loading screen shown while the startup assets are decoded."""
+        self.screen = screen
+        self.preloader = AssetPreloader(manifest)
+        self.clock = pygame.time.Clock()
+
+        # Progress bar layout
+        self.bar_rect = pygame.Rect(0, 0, px(800), px(30))
+        self.bar_rect.center = (px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 + 60))
+
+        # Static text is rendered once
+        font = pygame.font.Font(FONT_PATH, px(FONT_SIZE))
+        self.title_text = font.render("Final Quiztasy", True, (255, 255, 255))
+        self.title_rect = self.title_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 - 40)))
+        self.loading_text = font.render("Loading...", True, (200, 200, 200))
+        self.loading_rect = self.loading_text.get_rect(center=(px(SCREEN_WIDTH // 2), px(SCREEN_HEIGHT // 2 + 120)))
+
+    def draw(self):
+        """Draw the title and progress bar."""
+        self.screen.fill((0, 0, 0))
+        self.screen.blit(self.title_text, self.title_rect)
+
+        # Empty bar, filled portion, then border
+        pygame.draw.rect(self.screen, (40, 40, 40), self.bar_rect)
+        filled = self.bar_rect.copy()
+        filled.width = int(self.bar_rect.width * self.preloader.progress())
+        pygame.draw.rect(self.screen, (0, 200, 0), filled)
+        pygame.draw.rect(self.screen, (255, 255, 255), self.bar_rect, px(2))
+
+        self.screen.blit(self.loading_text, self.loading_rect)
+
+    def run(self):
+        """Keep the splash animating while assets load. Returns False if the window was closed."""
+        self.preloader.start()
+        # Leave most of each frame for drawing; conversions get the rest
+        time_budget_ms = max(1, 1000 // FPS // 2)
+
+        while not self.preloader.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.preloader.cancel()
+                    return False
+
+            self.preloader.poll(time_budget_ms)
+            self.draw()
+            DisplayManager().present()
+            self.clock.tick(FPS)
+
+        return True
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+
+TEXT_CACHE_SIZE = 64  # Rendered lines kept per TextCache
+
+
+def fit_prefix(font, text, max_width):
+    """Length of the longest prefix of text that fits in max_width, found by binary search."""
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if font.size(text[:middle])[0] <= max_width:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def fit_suffix(font, text, max_width):
+    """Index where the longest suffix of text that fits in max_width starts."""
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high) // 2
+        if font.size(text[middle:])[0] <= max_width:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+class TextCache:
+    def __init__(self, font, color, max_entries=TEXT_CACHE_SIZE):
+        """Rendered text surfaces for one font and color, kept for the most recently drawn strings."""
+        self.font = font
+        self.color = color
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # Text -> surface, least recently used first
+
+    def render(self, text):
+        surface = self.surfaces.get(text)
+        if surface is None:
+            surface = self.surfaces[text] = self.font.render(text, True, self.color)
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(text)
+        return surface
+
+
+class TextLayout:
+    def __init__(self, font, max_width):
+        """Word wrapping that only reflows the text from the first line an edit can have changed."""
+        self.font = font
+        self.max_width = max_width
+        self.text = None
+        self.lines = []
+        self.paragraphs = []  # Per paragraph: (text, words, lines, start word of each line or None)
+
+    def layout(self, text):
+        """Wrap text into lines that fit max_width; unchanged text returns the previous lines."""
+        if text == self.text:
+            return self.lines
+        self.text = text
+
+        paragraphs = text.split('\n') if text else []
+        old = self.paragraphs
+        self.paragraphs = []
+        self.lines = []
+        for index, paragraph in enumerate(paragraphs):
+            previous = old[index] if index < len(old) else None
+            if previous is None or previous[0] != paragraph:
+                previous = self.wrap_paragraph(paragraph, previous)
+            self.paragraphs.append(previous)
+            self.lines.extend(previous[2])
+        return self.lines
+
+    def wrap_paragraph(self, paragraph, previous=None):
+        """Greedy word wrap; lines before the first changed word are reused from the previous layout."""
+        if not paragraph:
+            return paragraph, [], [""], [0]  # Empty paragraph becomes a blank line
+
+        words = paragraph.split()
+        if not words:
+            # Only whitespace: break the raw text like one long word
+            lines = self.break_word(paragraph)
+            return paragraph, words, lines, [None] * len(lines)
+
+        lines, starts, first_word = [], [], 0
+        if previous is not None and previous[1]:
+            # A line can be kept when its words and the word that pushed the next line down are unchanged
+            _, old_words, old_lines, old_starts = previous
+            same = 0
+            while same < min(len(words), len(old_words)) and words[same] == old_words[same]:
+                same += 1
+            for index, start in enumerate(old_starts):
+                if start is not None and start < same:
+                    lines, starts, first_word = old_lines[:index], old_starts[:index], start
+
+        current_line, current_start = "", None
+        for index in range(first_word, len(words)):
+            word = words[index]
+            test_line = current_line + " " + word if current_line else word
+            if self.font.size(test_line)[0] <= self.max_width:
+                if not current_line:
+                    current_start = index
+                current_line = test_line
+                continue
+
+            # Word doesn't fit, close the current line and start a new one
+            if current_line:
+                lines.append(current_line)
+                starts.append(current_start)
+            if self.font.size(word)[0] > self.max_width:
+                # Too long for any line: the word fills lines on its own
+                chunks = self.break_word(word)
+                lines.extend(chunks)
+                starts.extend([index] + [None] * (len(chunks) - 1))
+                current_line, current_start = "", None
+            else:
+                current_line, current_start = word, index
+
+        if current_line:
+            lines.append(current_line)
+            starts.append(current_start)
+        return paragraph, words, lines, starts
+
+    def break_word(self, text):
+        """Split text into chunks that each fit max_width (at least one character per chunk)."""
+        chunks = []
+        while text:
+            count = max(1, fit_prefix(self.font, text, self.max_width))
+            chunks.append(text[:count])
+            text = text[count:]
+        return chunks